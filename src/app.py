@@ -1,9 +1,11 @@
 """Main TUI application for Flow Analysis Editor."""
 
+from textual import work
 from textual.app import App, ComposeResult
 from textual.containers import Container
 from textual.binding import Binding
 from pathlib import Path
+import asyncio
 import logging
 import sys
 from typing import Optional
@@ -17,6 +19,11 @@ from .models import SessionState
 
 logger = logging.getLogger(__name__)
 
+# Seconds of edit inactivity before changes are written to disk
+AUTO_SAVE_DELAY = 0.75
+# Seconds of navigation inactivity before the session position is persisted
+STATE_SAVE_DELAY = 0.5
+
 
 class AnalysisTUIApp(App):
     """
@@ -98,9 +105,11 @@ class AnalysisTUIApp(App):
         super().__init__(**kwargs)
         self.excel_file = excel_file
         self.preloaded_data = preloaded_data
+        self._excel_path = Path(excel_file)
+        self._excel_name = self._excel_path.name
 
         # Initialize components
-        self.excel_io = ExcelIO(Path(excel_file))
+        self.excel_io = ExcelIO(self._excel_path)
         self.state_io = StateIO()
         self.data_manager = ExcelDataManager(self.excel_io)
         self.validator = DataValidator()
@@ -109,15 +118,26 @@ class AnalysisTUIApp(App):
         self.formatter = ColorFormatter(theme=self.app_theme)
         self.session_manager = SessionManager(self.state_io)
 
-        # Initialize shortcut manager
+        # Initialize shortcut manager. Imported here rather than at module
+        # scope because shortcut_manager refers back to this module.
         from .presentation.shortcut_manager import ShortcutManager
         self.shortcut_manager = ShortcutManager(self)
 
         # State
         self.current_session: Optional[SessionState] = None
-        self.current_cluster_list: list = []
+        self.current_cluster_list = []
         self.current_cluster_index: int = 0
         self.loading_complete = False
+        self._pending_save_timer = None
+        self._sheet_names: Optional[tuple] = None
+        self._current_cluster_df = None
+        # Sheet row positions of _current_cluster_df's rows, for writing edits back
+        self._current_cluster_positions = None
+        self._prefetched_around: Optional[str] = None
+        # Sheet whose clusters are currently loaded
+        self._loaded_sheet: Optional[str] = None
+        self._pending_state: Optional[dict] = None
+        self._state_flush_timer = None
         self.has_unsaved_changes = False
 
         # Widgets (will be initialized in compose)
@@ -131,6 +151,35 @@ class AnalysisTUIApp(App):
         
         # Number key handling is now done in SimpleClusterView.on_key()
 
+    @property
+    def current_cluster_list(self) -> list:
+        """Cluster IDs of the active sheet, in navigation order."""
+        return self._current_cluster_list
+
+    @current_cluster_list.setter
+    def current_cluster_list(self, clusters: list) -> None:
+        self._current_cluster_list = clusters
+        # Position lookup so jumping to a cluster ID doesn't scan the list
+        self._cluster_positions = {cluster_id: i for i, cluster_id in enumerate(clusters)}
+
+    @property
+    def sheet_names(self) -> tuple:
+        """Sheet names of the open workbook, fetched once per load."""
+        if self._sheet_names is None:
+            self._sheet_names = tuple(self.data_manager.get_sheet_names())
+        return self._sheet_names
+
+    def _restored_cluster_index(self, session: SessionState) -> int:
+        """Position of the session's saved cluster in the current cluster list."""
+        # Prefer the ID; state saved before it was recorded only has the index
+        position = self._cluster_positions.get(session.current_cluster_id)
+        if position is not None:
+            return position
+        index = session.current_cluster
+        if isinstance(index, int) and 0 <= index < len(self.current_cluster_list):
+            return index
+        return 0
+
     def compose(self) -> ComposeResult:
         """Create the UI layout."""
         # Note: SheetTabs will be initialized with proper sheets after data loads
@@ -160,26 +209,21 @@ class AnalysisTUIApp(App):
             if self.loading_manager:
                 self.loading_manager.update_step("Loading Excel file...", 20)
             
-            # Use preloaded data if available, otherwise load normally
+            # Parsing runs in a worker thread so the event loop keeps painting
+            # the loading screen while the workbook is read
             if self.preloaded_data:
-                # Directly set the sheets data in the data manager
-                self.data_manager.data = self.preloaded_data
-                self.data_manager.file_path = self.excel_file
-                # Build metadata (needed for proper initialization)
-                from datetime import datetime
-                start_time = datetime.now()
-                self.data_manager._build_metadata(start_time)
-                # Build cluster cache (needed for navigation)
-                self.data_manager._build_cluster_cache()
+                await asyncio.to_thread(
+                    self.data_manager.set_data, self.preloaded_data, self.excel_file)
             else:
-                # Load data synchronously
-                self.data_manager.load_excel(self.excel_file)
+                await asyncio.to_thread(self.data_manager.load_excel, self.excel_file)
+            self._sheet_names = None
             
             if self.loading_manager:
                 self.loading_manager.update_step("Initializing session...", 60)
             
-            # Initialize session
-            self.current_session = self.session_manager.get_or_create_state(
+            # Initialize session (reads and may write the state file)
+            self.current_session = await asyncio.to_thread(
+                self.session_manager.get_or_create_state,
                 self.excel_file,
                 default_sheet="SEP25"
             )
@@ -189,67 +233,14 @@ class AnalysisTUIApp(App):
             
             # Switch to main interface immediately
             await self.switch_to_main_interface()
+            self.loading_complete = True
             
             if self.loading_manager:
                 self.loading_manager.complete()
                 
         except Exception as e:
-            logger.error(f"Error loading: {e}")
-            import traceback
-            traceback.print_exc()
-    
-    async def load_data_async(self):
-        """Load data asynchronously with progress updates."""
-        try:
-            # Step 1: Load Excel file
-            self.loading_manager.update_step("Loading Excel file...", 10)
-            import asyncio
-            await asyncio.sleep(0.1)  # Allow UI update
-            
-            self.data_manager.load_excel(self.excel_file)
-            self.loading_manager.update_step("Excel file loaded", 40)
-            await asyncio.sleep(0.1)
-            
-            # Step 2: Initialize session
-            self.loading_manager.update_step("Initializing session...", 60)
-            await asyncio.sleep(0.1)
-            
-            self.current_session = self.session_manager.get_or_create_state(
-                self.excel_file,
-                default_sheet="SEP25"
-            )
-            
-            # Step 3: Load cluster data
-            self.loading_manager.update_step("Loading cluster data...", 80)
-            await asyncio.sleep(0.1)
-            
-            # Load cluster list for current sheet
-            self.load_current_sheet()
-            
-            # Navigate to saved cluster
-            if 0 <= self.current_session.current_cluster < len(self.current_cluster_list):
-                self.current_cluster_index = self.current_session.current_cluster
-            
-            # Step 4: Complete loading
-            self.loading_manager.update_step("Finalizing...", 95)
-            await asyncio.sleep(0.1)
-            
-            # Mark as complete and switch to main interface
-            self.loading_complete = True
-            self.loading_manager.complete()
-            await asyncio.sleep(0.5)  # Show completion briefly
-            
-            # Switch to main interface
-            await self.switch_to_main_interface()
-            
-        except Exception as e:
-            import traceback
-            logger.error(f"Failed to initialize application: {e}")
-            logger.error(f"Full traceback:\n{traceback.format_exc()}")
-            # Show error on loading screen
-            if self.loading_manager:
-                self.loading_manager.loading_screen.update_progress(0, f"Error: {str(e)}")
-            raise
+            # Log rather than print: stderr output would garble the running TUI
+            logger.error("Error loading: %s", e, exc_info=True)
     
     async def switch_to_main_interface(self):
         """Switch from loading screen to main interface."""
@@ -259,10 +250,10 @@ class AnalysisTUIApp(App):
                 self.loading_screen.remove()
             
             # Get actual sheet names from the Excel file
-            available_sheets = self.data_manager.get_sheet_names()
+            available_sheets = self.sheet_names
             
             # Update SheetTabs with actual sheets using the new method
-            self.sheet_tabs.update_sheets(available_sheets)
+            self.sheet_tabs.update_sheets(list(available_sheets))
             if available_sheets:
                 # Set the first available sheet as active, or use saved session sheet if it exists
                 if self.current_session and self.current_session.current_sheet in available_sheets:
@@ -270,46 +261,45 @@ class AnalysisTUIApp(App):
                 else:
                     self.sheet_tabs.set_active_sheet(available_sheets[0])
             
-            # Mount main interface widgets
-            await self.mount(self.sheet_tabs)
-            
-            # Create and mount main container
+            # Mount main interface widgets in one call so layout runs once
             container = Container(
                 self.cluster_view,
                 self.date_grid,  
                 self.lodf_grid,
                 id="main-container"
             )
-            await self.mount(container)
-            await self.mount(self.status_bar)
+            await self.mount(self.sheet_tabs, container, self.status_bar)
                 
             # Load cluster list for current sheet - use the actual active sheet
-            sheet_name = self.sheet_tabs.active_sheet if self.sheet_tabs.active_sheet else available_sheets[0] if available_sheets else "SEP25"
+            sheet_name = self.sheet_tabs.active_sheet or (available_sheets[0] if available_sheets else "SEP25")
             self.current_cluster_list = self.data_manager.get_clusters_list(sheet_name)
             self.current_cluster_index = 0
+            self._loaded_sheet = sheet_name
+            if self.current_session and self.current_session.current_sheet == sheet_name:
+                # Resume at the cluster the previous session ended on
+                self.current_cluster_index = self._restored_cluster_index(self.current_session)
+            cluster_count = len(self.current_cluster_list)
             
             # Debug: log cluster info
-            logger.info(f"Loaded {len(self.current_cluster_list)} clusters for {sheet_name}")
-            if self.current_cluster_list:
-                logger.info(f"First few clusters: {self.current_cluster_list[:5]}")
+            logger.info("Loaded %d clusters for %s", cluster_count, sheet_name)
+            if self.current_cluster_list and logger.isEnabledFor(logging.INFO):
+                logger.info("First few clusters: %s", self.current_cluster_list[:5])
             
             # Display first cluster if available
             if self.current_cluster_list:
                 self.display_current_cluster()
-                logger.info(f"Displaying cluster {self.current_cluster_index}")
+                logger.info("Displaying cluster %d", self.current_cluster_index)
             
             # Update status
             if self.status_bar:
                 self.status_bar.update_status(
-                    f"Loaded {Path(self.excel_file).name} - "
-                    f"{len(self.data_manager.get_sheet_names())} sheets, "
-                    f"{len(self.current_cluster_list)} clusters"
+                    f"Loaded {self._excel_name} - "
+                    f"{len(available_sheets)} sheets, "
+                    f"{cluster_count} clusters"
                 )
             
         except Exception as e:
-            logger.error(f"Error switching to main interface: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("Error switching to main interface: %s", e, exc_info=True)
 
     def load_current_sheet(self) -> None:
         """Load data for current sheet."""
@@ -317,8 +307,10 @@ class AnalysisTUIApp(App):
             sheet = self.sheet_tabs.active_sheet
             self.current_cluster_list = self.data_manager.get_clusters_list(sheet)
             self.current_cluster_index = 0
+            self._loaded_sheet = sheet
         except KeyError as e:
             logger.error(f"Failed to load sheet {sheet}: {e}")
+            self._loaded_sheet = None
             self.current_cluster_list = []
             self.current_cluster_index = 0
             if self.status_bar:
@@ -326,15 +318,24 @@ class AnalysisTUIApp(App):
 
     def display_current_cluster(self) -> None:
         """Display the current cluster data."""
+        self._current_cluster_df = None
+        self._current_cluster_positions = None
         if not self.current_cluster_list:
+            # Don't leave the previous sheet's cluster on screen (and editable)
+            if hasattr(self.cluster_view, 'clear_data'):
+                self.cluster_view.clear_data()
             return
 
-        cluster_id = self.current_cluster_list[self.current_cluster_index]
+        index = self.current_cluster_index
+        cluster_count = len(self.current_cluster_list)
+        cluster_id = self.current_cluster_list[index]
         sheet = self.sheet_tabs.active_sheet
 
         try:
             # Get cluster data
             cluster_data = self.data_manager.get_cluster_data(sheet, cluster_id)
+            self._current_cluster_positions = self.data_manager.get_cluster_positions(sheet, cluster_id)
+            self._current_cluster_df = cluster_data
 
             # Update cluster view with SimpleClusterView
             if hasattr(self.cluster_view, 'load_data'):
@@ -351,34 +352,82 @@ class AnalysisTUIApp(App):
 
             # Update status bar with proper cluster information
             if self.status_bar:
-                self.status_bar.current_sheet = sheet
-                self.status_bar.current_cluster = self.current_cluster_index + 1
-                self.status_bar.total_clusters = len(self.current_cluster_list)
-                self.status_bar.current_row = 1
-                self.status_bar.total_rows = len(cluster_data) if cluster_data is not None else 0
+                self.status_bar.set_state(
+                    current_sheet=sheet,
+                    current_cluster=index + 1,
+                    total_clusters=cluster_count,
+                    current_row=1,
+                    total_rows=len(cluster_data) if cluster_data is not None else 0,
+                )
 
-            # Update status
-            self.data_manager.get_cluster_info(sheet, cluster_id)
-            self.title = (f"Cluster {cluster_id} "
-                          f"({self.current_cluster_index + 1}/{len(self.current_cluster_list)})")
+            # Update status; redraws of the same cluster leave the title as is
+            new_title = f"Cluster {cluster_id} ({index + 1}/{cluster_count})"
+            if new_title != self.title:
+                self.title = new_title
 
-            # Save state (use cluster index, not ID)
-            self.session_manager.update_current_state(
-                current_sheet=sheet,
-                current_cluster=self.current_cluster_index
-            )
+            # Save state (cluster index, plus the ID so restore survives reordering)
+            self._schedule_state_save(current_sheet=sheet, current_cluster=index,
+                                      current_cluster_id=cluster_id)
+
+            if sheet != self._prefetched_around and self.is_running:
+                self._prefetched_around = sheet
+                self._prefetch_adjacent_sheets(sheet)
         except Exception as e:
-            import traceback
-            logger.error(f"Failed to display cluster {cluster_id}: {e}")
-            logger.error(f"Full traceback:\n{traceback.format_exc()}")
+            # exc_info defers formatting the traceback until a handler emits it
+            logger.error("Failed to display cluster %s: %s", cluster_id, e, exc_info=True)
             # Re-raise to let it bubble up
             raise
 
+    @work(thread=True, exclusive=True, group="prefetch")
+    def _prefetch_adjacent_sheets(self, sheet: str) -> None:
+        """Warm the sheets Tab / Shift+Tab would switch to next."""
+        names = self.sheet_names
+        if sheet not in names or len(names) < 2:
+            return
+
+        i = names.index(sheet)
+        for neighbour in dict.fromkeys((names[(i + 1) % len(names)], names[i - 1])):
+            try:
+                self.data_manager.prefetch_sheet(neighbour)
+            except Exception as e:
+                logger.warning(f"Prefetch of sheet {neighbour} failed: {e}")
+
+    def _schedule_state_save(self, **state) -> None:
+        """Persist the navigation position once browsing pauses."""
+        self._pending_state = state
+        if not self.is_running:
+            # No event loop to debounce on; write straight away
+            self._write_pending_state()
+            return
+
+        if self._state_flush_timer is not None:
+            self._state_flush_timer.stop()
+        self._state_flush_timer = self.set_timer(STATE_SAVE_DELAY, self._flush_state)
+
+    def _flush_state(self) -> None:
+        """Write the pending navigation position when the state timer fires."""
+        # On the UI thread, like the writes in action_save / action_quit, so they
+        # never overlap; the JSON dump is too small to need a worker
+        self._state_flush_timer = None
+        self._write_pending_state()
+
+    def _cancel_state_timer(self) -> None:
+        """Stop any scheduled navigation-state write."""
+        if self._state_flush_timer is not None:
+            self._state_flush_timer.stop()
+            self._state_flush_timer = None
+
+    def _write_pending_state(self) -> None:
+        """Hand the latest navigation position to the session manager."""
+        state, self._pending_state = self._pending_state, None
+        if state:
+            self.session_manager.update_current_state(**state)
+
     def on_sheet_change(self, sheet: str) -> None:
         """Handle sheet change event."""
         try:
             # Check if sheet exists in data
-            available_sheets = self.data_manager.get_sheet_names()
+            available_sheets = self.sheet_names
             if sheet not in available_sheets:
                 logger.warning(f"Sheet {sheet} not found in data")
                 # Revert to first available sheet
@@ -387,6 +436,10 @@ class AnalysisTUIApp(App):
                     if self.sheet_tabs:
                         self.sheet_tabs.set_active_sheet(sheet)
                 return
+
+            # Already showing this sheet (e.g. the revert above landed on it)
+            if sheet == self._loaded_sheet:
+                return
             
             # Update the sheet tabs to reflect the new sheet
             if self.sheet_tabs:
@@ -400,7 +453,7 @@ class AnalysisTUIApp(App):
 
     def on_cell_edit(self, row: int, column: str, value: float) -> None:
         """
-        Handle cell edit event - save to data manager and trigger auto-save.
+        Handle cell edit event - save to data manager and schedule auto-save.
 
         Args:
             row: Row index in DataFrame
@@ -408,24 +461,62 @@ class AnalysisTUIApp(App):
             value: New value
         """
         try:
+            # The cluster on screen was fetched by display_current_cluster()
+            positions = self._current_cluster_positions
+            if positions is None or row >= len(positions):
+                return
+
+            # Write through to the sheet row the displayed row came from
             sheet = self.sheet_tabs.active_sheet
-            cluster_id = self.current_cluster_list[self.current_cluster_index]
-            
-            # Update data in memory (method may vary based on data manager implementation)
-            # For now, we'll update the cluster data directly
-            cluster_data = self.data_manager.get_cluster_data(sheet, cluster_id)
-            if cluster_data is not None and row < len(cluster_data):
-                cluster_data.at[row, column] = value
-                
-                # Auto-save disabled for performance - use Ctrl+S to save manually
-                # Mark that we have unsaved changes
+            self.data_manager.update_value(sheet, int(positions[row]), column, value)
+
+            # The message only changes on the first edit since the last save
+            if not self.has_unsaved_changes:
                 self.has_unsaved_changes = True
-                self.status_bar.update_status("Modified (unsaved) - Press Ctrl+S to save")
-            
+                self.status_bar.update_status("Modified (unsaved)")
+            self._schedule_save()
+
         except Exception as e:
             logger.error(f"Error saving cell edit: {e}")
             self.notify(f"Error saving: {e}", severity="error")
 
+    def _schedule_save(self) -> None:
+        """Restart the auto-save timer so a burst of edits is written once."""
+        if self._pending_save_timer is not None:
+            self._pending_save_timer.stop()
+        self._pending_save_timer = self.set_timer(AUTO_SAVE_DELAY, self._on_save_timer)
+
+    def _on_save_timer(self) -> None:
+        """Auto-save timer fired: forget the timer (on the UI thread) and save in a worker."""
+        self._pending_save_timer = None
+        self._flush_save()
+
+    @work(thread=True, group="auto-save")
+    def _flush_save(self) -> None:
+        """
+        Write pending changes to disk in a worker thread.
+
+        save_changes() lets one save run at a time, so a worker started while
+        another is still writing waits for it, and then finds nothing to do if
+        that save already covered its edits.
+        """
+        if not self.data_manager.has_pending_edits():
+            return
+        try:
+            new_path = self.data_manager.save_changes()
+        except Exception as e:
+            logger.error(f"Auto-save failed: {e}")
+            self.call_from_thread(self.status_bar.update_status, f"Auto-save failed: {e}")
+            return
+
+        self.call_from_thread(self._on_auto_saved, new_path)
+
+    def _on_auto_saved(self, new_path: str) -> None:
+        """Report a completed auto-save unless further edits are still pending."""
+        if self._pending_save_timer is None:
+            self.has_unsaved_changes = False
+        self.status_bar.update_status(f"Saved to {Path(new_path).name}")
+
     def action_toggle_theme(self) -> None:
         """Toggle between dark and light themes."""
         # Toggle theme
@@ -465,17 +556,20 @@ class AnalysisTUIApp(App):
 
     def navigate_cluster_with_wrap(self, direction: int) -> None:
         """Navigate cluster with wrap-around support (used by tests)."""
-        if not self.current_cluster_list:
+        # Wrapping a single cluster onto itself changes nothing
+        if len(self.current_cluster_list) < 2:
             return
 
+        last_index = len(self.current_cluster_list) - 1
+
         if direction > 0:  # Forward
-            if self.current_cluster_index >= len(self.current_cluster_list) - 1:
+            if self.current_cluster_index >= last_index:
                 self.current_cluster_index = 0  # Wrap to first
             else:
                 self.current_cluster_index += 1
         else:  # Backward
             if self.current_cluster_index <= 0:
-                self.current_cluster_index = len(self.current_cluster_list) - 1  # Wrap to last
+                self.current_cluster_index = last_index  # Wrap to last
             else:
                 self.current_cluster_index -= 1
 
@@ -489,14 +583,46 @@ class AnalysisTUIApp(App):
         """Navigate to previous sheet."""
         self.sheet_tabs.previous_sheet()
 
+    def goto_cluster(self, cluster_id) -> bool:
+        """
+        Jump to a cluster in the active sheet.
+
+        Args:
+            cluster_id: Cluster identifier, or the text the user typed for it
+
+        Returns:
+            True if the cluster was found and displayed
+        """
+        index = self._cluster_positions.get(cluster_id)
+        if index is None and isinstance(cluster_id, str):
+            # Typed input for numeric cluster IDs; int and float keys hash alike
+            try:
+                index = self._cluster_positions.get(float(cluster_id.strip()))
+            except ValueError:
+                pass
+        if index is None:
+            return False
+
+        self.current_cluster_index = index
+        self.display_current_cluster()
+        return True
+
     def action_goto_cluster(self) -> None:
         """Go to specific cluster by ID."""
-        # This would show an input dialog in full implementation
+        # This would show an input dialog and pass the ID to goto_cluster()
         pass
 
     def action_save(self) -> None:
         """Manual save."""
+        if self._pending_save_timer is not None:
+            self._pending_save_timer.stop()
+            self._pending_save_timer = None
+        # Persist the navigation position along with the data
+        self._cancel_state_timer()
+        self._write_pending_state()
         try:
+            # Same save path as auto-save; waits for an in-flight auto-save to finish
+            # and reports its own failure here
             new_path = self.data_manager.save_changes()
             self.has_unsaved_changes = False
             self.status_bar.update_status(f"Saved to {Path(new_path).name}")
@@ -505,15 +631,34 @@ class AnalysisTUIApp(App):
 
     def action_quit(self) -> None:
         """Quit application."""
+        # Edits still waiting on the auto-save timer are written now, not dropped
+        if self._pending_save_timer is not None:
+            self._pending_save_timer.stop()
+            self._pending_save_timer = None
+        try:
+            if self.data_manager.has_pending_edits():
+                # Waits for an in-flight auto-save, like action_save
+                self.data_manager.save_changes()
+                self.has_unsaved_changes = False
+        except Exception as e:
+            logger.error(f"Save on quit failed: {e}")
+            self.notify(f"Save failed, not quitting: {e}", severity="error")
+            return
+
+        # The final state written below supersedes any pending navigation write
+        self._cancel_state_timer()
+        self._pending_state = None
+
         # Save session state before exiting
         if self.session_manager and self.sheet_tabs and self.current_cluster_list:
-            current_cluster = None
+            current_cluster_id = None
             if 0 <= self.current_cluster_index < len(self.current_cluster_list):
-                current_cluster = self.current_cluster_list[self.current_cluster_index]
+                current_cluster_id = self.current_cluster_list[self.current_cluster_index]
 
             self.session_manager.update_current_state(
                 current_sheet=self.sheet_tabs.active_sheet,
-                current_cluster=current_cluster
+                current_cluster=self.current_cluster_index,
+                current_cluster_id=current_cluster_id
             )
         self.exit()
 
@@ -553,7 +698,6 @@ def main():
     # Pre-load the Excel file BEFORE starting Textual
     # This avoids terminal queries during the loading phase
     import pandas as pd
-    import time
     import threading
     
     # Electricity-themed ASCII spinner - simulating electrical current flow
@@ -570,15 +714,15 @@ def main():
         "[    -]"
     ]
     
-    spinner_running = True
+    loading_done = threading.Event()
     
     def show_spinner():
         """Display animated spinner while loading."""
         char_index = 0
-        while spinner_running:
+        # wait() doubles as the frame delay and returns as soon as loading ends
+        while not loading_done.wait(0.1):
             print(f"\r⚡ Loading Excel file... {animation_chars[char_index]}", end="", flush=True)
             char_index = (char_index + 1) % len(animation_chars)
-            time.sleep(0.1)
         # Clear the spinner line when done
         print("\r" + " " * 50 + "\r", end="", flush=True)
     
@@ -588,19 +732,18 @@ def main():
     
     try:
         # Load Excel file first
-        excel_data = pd.ExcelFile(excel_file)
         sheets_dict = {}
-        for sheet_name in excel_data.sheet_names:
-            sheets_dict[sheet_name] = excel_data.parse(sheet_name)
+        with pd.ExcelFile(excel_file, engine=ExcelIO.READ_ENGINE) as excel_data:
+            for sheet_name in excel_data.sheet_names:
+                sheets_dict[sheet_name] = ExcelIO.compact_dtypes(excel_data.parse(sheet_name))
         
         # Stop spinner
-        spinner_running = False
+        loading_done.set()
         spinner_thread.join()
         print(f"✓ Loaded {len(sheets_dict)} sheets successfully")
-        time.sleep(0.5)  # Brief pause to show success message
     except Exception as e:
         # Stop spinner
-        spinner_running = False
+        loading_done.set()
         spinner_thread.join()
         print(f"\n✗ Error loading Excel file: {e}")
         sys.exit(1)
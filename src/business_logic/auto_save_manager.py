@@ -5,14 +5,14 @@ This module provides automatic save functionality that triggers after edits,
 using background threading, debouncing, and backup management.
 """
 
+import itertools
+import os
+import random
 import threading
 import time
 import tempfile
-import shutil
-import datetime
 from pathlib import Path
 from typing import Optional
-from concurrent.futures import ThreadPoolExecutor
 
 from src.business_logic.excel_data_manager import ExcelDataManager
 from src.widgets.status_bar import StatusBar
@@ -25,12 +25,19 @@ class AutoSaveManager:
     Features:
     - Debounced saving to prevent rapid saves during multiple edits
     - Background threading to avoid UI blocking
-    - Timestamped backup creation with rotation
+    - Backup rotation through a fixed ring of slots
     - Error handling with exponential backoff retry
     - Status bar integration for user feedback
     - Manual save override functionality
+
+    The debounce thread runs until shutdown() is called, so callers must
+    call it (or use the manager as a context manager) when done.
     """
 
+    STATUS_SAVING = "Saving..."
+    STATUS_NO_FILE = "No file to save"
+    STATUS_UNCHANGED = "No changes to save"
+
     def __init__(
         self,
         data_manager: ExcelDataManager,
@@ -38,7 +45,10 @@ class AutoSaveManager:
         debounce_ms: int = 500,
         backup_count: int = 3,
         max_retries: int = 3,
-        base_retry_delay: float = 0.1
+        base_retry_delay: float = 0.1,
+        max_retry_delay: float = 30.0,
+        jitter: float = 0.5,
+        max_debounce_ms: int = 5000
     ):
         """
         Initialize AutoSaveManager.
@@ -47,47 +57,107 @@ class AutoSaveManager:
             data_manager: ExcelDataManager instance for save operations
             status_bar: StatusBar instance for user feedback
             debounce_ms: Debounce time in milliseconds before triggering save
-            backup_count: Number of backup files to retain
+            backup_count: Number of backup slots to keep
             max_retries: Maximum retry attempts for failed saves
             base_retry_delay: Base delay for exponential backoff (seconds)
+            max_retry_delay: Upper bound on the backoff before jitter (seconds)
+            jitter: Maximum extra fraction of the delay added at random
+            max_debounce_ms: Longest a pending edit waits for a save, even while
+                edits keep arriving
         """
         self._data_manager = data_manager
         self._status_bar = status_bar
+        # Status writer resolved once; _last_status lets repeated informational messages be skipped
+        self._set_status = getattr(status_bar, 'set_status', None) or status_bar.update_status
+        self._last_status: Optional[str] = None
+        # "HH:MM:SS" for the last second formatted, reused within that second
+        self._clock_time: Optional[time.struct_time] = None
+        self._clock_text = ""
         self._debounce_ms = debounce_ms
+        self._max_debounce_ms = max_debounce_ms
         self._backup_count = backup_count
         self._max_retries = max_retries
         self._base_retry_delay = base_retry_delay
-
-        # Threading for debounce timer
-        self._save_timer: Optional[threading.Timer] = None
-        self._timer_lock = threading.RLock()
-
-        # Background thread pool for actual saves
-        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autosave")
+        self._max_retry_delay = max_retry_delay
+        self._jitter = jitter
+
+        # Data manager accessors resolved once instead of probed per call
+        self._unsaved_check = getattr(data_manager, 'has_unsaved_changes', None)
+        self._hash_source = getattr(data_manager, 'content_hash', None)
+        self._mark_saved = getattr(data_manager, 'mark_saved', None)
+        self._cached_path: Optional[Path] = None
+        self._path_probed = False
+
+        # Debouncing: edits bump a sequence number that one long-lived thread
+        # watches, so the edit path takes no lock and spawns no Timer thread
+        self._edit_seq = itertools.count(1)
+        self._last_edit = 0      # sequence number of the latest edit
+        self._handled_edit = 0   # latest edit already saved or cancelled
+        self._first_edit_at: Optional[float] = None  # monotonic time of oldest unsaved edit
+        self._wake = threading.Event()
+        self._save_now = False   # save requested from another thread
 
         # Performance tracking
         self._last_save_duration: float = 0.0
 
-        # Save operation state
-        self._save_in_progress = False
-        self._save_lock = threading.RLock()
+        # Fingerprint of the data as of the last successful save
+        self._last_saved_hash: Optional[str] = None
+
+        # Held for the whole of a save so manual and auto-saves never overlap
+        self._save_lock = threading.Lock()
         self._shutdown_requested = False
 
+        # Saves also run on this thread, one at a time
+        self._debounce_thread = threading.Thread(
+            target=self._debounce_loop, name="autosave-debounce", daemon=True)
+        self._debounce_thread.start()
+
     def on_data_edited(self) -> None:
         """
         Called when data is edited. Starts/resets the debounce timer.
         """
-        with self._timer_lock:
-            # Cancel existing timer if running
-            if self._save_timer is not None and self._save_timer.is_alive():
-                self._save_timer.cancel()
+        # Only schedule a save if there are unsaved changes
+        if self.has_unsaved_changes():
+            if self._first_edit_at is None:
+                self._first_edit_at = time.monotonic()
+            self._last_edit = next(self._edit_seq)
+            self._wake.set()
+
+    def _debounce_loop(self) -> None:
+        """
+        Background loop: wait for an edit, then save once edits go quiet
+        or the oldest unsaved edit has waited max_debounce_ms.
+        """
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            if self._shutdown_requested:
+                return
 
-            # Only start timer if there are unsaved changes
-            if self.has_unsaved_changes():
-                # Create new timer
-                delay_seconds = self._debounce_ms / 1000.0
-                self._save_timer = threading.Timer(delay_seconds, self._perform_save)
-                self._save_timer.start()
+            if self._save_now:
+                self._save_now = False
+                self._perform_save_operation()
+                continue
+
+            seq = self._last_edit
+            if seq == self._handled_edit:
+                continue  # Cancelled by a manual save
+
+            first_edit_at = self._first_edit_at or time.monotonic()
+            ceiling = first_edit_at + self._max_debounce_ms / 1000.0
+            timeout = min(self._debounce_ms / 1000.0, max(0.0, ceiling - time.monotonic()))
+
+            # A newer edit (or shutdown) wakes us early and restarts the window,
+            # unless the ceiling has been reached
+            woken = self._wake.wait(timeout)
+            if self._shutdown_requested:
+                return
+            if time.monotonic() < ceiling and (woken or self._last_edit != seq):
+                continue
+
+            self._first_edit_at = None
+            self._handled_edit = self._last_edit
+            self._perform_save()
 
     def set_debounce_time(self, debounce_ms: int) -> None:
         """
@@ -101,15 +171,16 @@ class AutoSaveManager:
     def perform_manual_save(self) -> None:
         """
         Perform manual save, canceling any pending auto-save.
+
+        The save runs on the calling thread after any auto-save already in
+        progress, and raises if it still fails once retries run out.
         """
-        with self._timer_lock:
-            # Cancel pending auto-save
-            if self._save_timer is not None and self._save_timer.is_alive():
-                self._save_timer.cancel()
-                self._save_timer = None
+        # Cancel pending auto-save
+        self._first_edit_at = None
+        self._handled_edit = self._last_edit
 
         # Perform save immediately
-        self._perform_save()
+        self._perform_save(synchronous=True)
 
     def has_unsaved_changes(self) -> bool:
         """
@@ -118,15 +189,35 @@ class AutoSaveManager:
         Returns:
             True if there are unsaved changes
         """
-        # Check if data manager has the method, otherwise use internal state
-        if hasattr(self._data_manager, 'has_unsaved_changes'):
-            return self._data_manager.has_unsaved_changes()
+        # Use the data manager's method if it has one, otherwise internal state
+        if self._unsaved_check is not None:
+            return self._unsaved_check()
         return hasattr(self._data_manager, '_is_modified') and self._data_manager._is_modified
 
     def get_file_path(self) -> Optional[Path]:
         """
         Get the current file path from data manager.
 
+        Returns:
+            Path object or None if no file loaded
+        """
+        if not self._path_probed:
+            self._cached_path = self._probe_file_path()
+            # Keep probing until a file is loaded
+            self._path_probed = self._cached_path is not None
+        return self._cached_path
+
+    def invalidate_file_path(self) -> None:
+        """
+        Forget the cached file path, e.g. after the data manager opens a new file.
+        """
+        self._cached_path = None
+        self._path_probed = False
+
+    def _probe_file_path(self) -> Optional[Path]:
+        """
+        Look up the file path on the data manager.
+
         Returns:
             Path object or None if no file loaded
         """
@@ -137,6 +228,17 @@ class AutoSaveManager:
             return Path(self._data_manager._file_path)
         return None
 
+    def get_content_hash(self) -> Optional[str]:
+        """
+        Get a fingerprint of the data manager's current data.
+
+        Returns:
+            Digest string, or None if the data manager cannot provide one
+        """
+        if self._hash_source is not None:
+            return self._hash_source()
+        return None
+
     def save_to_file(self, file_path: Path) -> None:
         """
         Save data to specified file path.
@@ -152,55 +254,80 @@ class AutoSaveManager:
             # Note: ExcelDataManager.save_workbook() returns the saved file path
             self._data_manager.save_workbook()
 
-    def _perform_save(self) -> None:
-        """
-        Perform the actual save operation in background thread.
+    def _perform_save(self, synchronous: bool = False) -> None:
         """
-        with self._timer_lock:
-            # Clear the timer since we're executing
-            self._save_timer = None
+        Perform the save on the background thread, handing it over if needed.
 
-        # Check if we're in a test environment with mocked shutil.move
-        # If so, run synchronously for predictable test behavior
-        if hasattr(shutil.move, '_mock_name'):
-            # Run synchronously in test environment
+        Args:
+            synchronous: Save on the calling thread instead and raise on failure
+        """
+        if synchronous:
+            self._perform_save_operation(raise_errors=True)
+        elif threading.current_thread() is self._debounce_thread:
             self._perform_save_operation()
-        else:
-            # Submit to background thread in production (check for shutdown)
-            if not self._shutdown_requested and hasattr(self, '_executor'):
-                try:
-                    self._executor.submit(self._perform_save_operation)
-                except RuntimeError:
-                    # Executor already shutdown, perform synchronously
-                    self._perform_save_operation()
+        elif not self._shutdown_requested:
+            self._save_now = True
+            self._wake.set()
 
-    def _perform_save_operation(self) -> None:
+    def _show_status(self, message: str, always: bool = False) -> None:
         """
-        Actual save operation that runs in background thread.
+        Show a status message unless it is already displayed.
+
+        Args:
+            message: Status text
+            always: Write it even if unchanged, so each failure is reported
+        """
+        if always or message != self._last_status:
+            self._last_status = message
+            self._set_status(message)
+
+    def _format_clock(self) -> str:
+        """
+        Get the current local time as HH:MM:SS, formatting at most once a second.
+        """
+        now = time.localtime()
+        if now != self._clock_time:
+            self._clock_time = now
+            self._clock_text = time.strftime("%H:%M:%S", now)
+        return self._clock_text
+
+    def _perform_save_operation(self, raise_errors: bool = False) -> None:
+        """
+        Actual save operation, waiting for any save already in progress.
+
+        Args:
+            raise_errors: Re-raise a save failure after reporting it
         """
         with self._save_lock:
-            if self._save_in_progress:
-                return  # Avoid concurrent saves
-            self._save_in_progress = True
+            self._save_once(raise_errors)
 
+    def _save_once(self, raise_errors: bool) -> None:
+        """
+        Save if there are unsaved changes; the caller holds the save lock.
+
+        Args:
+            raise_errors: Re-raise a save failure after reporting it
+        """
         try:
             # Check if there are actually unsaved changes
             if not self.has_unsaved_changes():
                 return
 
             # Update status to indicate saving
-            if hasattr(self._status_bar, 'set_status'):
-                self._status_bar.set_status("Saving...")
-            else:
-                self._status_bar.update_status("Saving...")
+            self._show_status(self.STATUS_SAVING)
 
             # Get file path
             file_path = self.get_file_path()
             if not file_path:
-                if hasattr(self._status_bar, 'set_status'):
-                    self._status_bar.set_status("No file to save")
-                else:
-                    self._status_bar.update_status("No file to save")
+                self._show_status(self.STATUS_NO_FILE)
+                return
+
+            # Edits that net out to the last saved data need no new backup
+            content_hash = self.get_content_hash()
+            if content_hash is not None and content_hash == self._last_saved_hash:
+                if self._mark_saved is not None:
+                    self._mark_saved()
+                self._show_status(self.STATUS_UNCHANGED)
                 return
 
             # Record start time for performance tracking
@@ -208,26 +335,20 @@ class AutoSaveManager:
 
             # Perform save with retry logic
             self._save_with_retry(file_path)
+            self._last_saved_hash = content_hash
 
             # Track performance
             self._last_save_duration = time.time() - start_time
 
             # Update status to indicate completion
-            save_time = datetime.datetime.now().strftime("%H:%M:%S")
-            if hasattr(self._status_bar, 'set_status'):
-                self._status_bar.set_status(f"Saved at {save_time}")
-            else:
-                self._status_bar.update_status(f"Saved at {save_time}")
+            save_time = self._format_clock()
+            self._show_status(f"Saved at {save_time}")
 
         except Exception as e:
             # Handle save failure
-            if hasattr(self._status_bar, 'set_status'):
-                self._status_bar.set_status(f"Save failed: {str(e)}")
-            else:
-                self._status_bar.update_status(f"Save failed: {str(e)}")
-        finally:
-            with self._save_lock:
-                self._save_in_progress = False
+            self._show_status(f"Save failed: {str(e)}", always=True)
+            if raise_errors:
+                raise
 
     def _save_with_retry(self, file_path: Path) -> None:
         """
@@ -240,12 +361,9 @@ class AutoSaveManager:
 
         for attempt in range(self._max_retries):
             try:
-                # Create timestamped backup
+                # Write the newest backup, shifting older ones down the ring
                 self._create_backup(file_path)
 
-                # Cleanup old backups
-                self._cleanup_old_backups()
-
                 # Save operation completed successfully
                 return
 
@@ -253,16 +371,14 @@ class AutoSaveManager:
                 last_exception = e
 
                 if attempt < self._max_retries - 1:  # Not the last attempt
-                    # Calculate delay with exponential backoff
-                    delay = self._base_retry_delay * (2 ** attempt)
+                    # Capped exponential backoff, jittered so retries don't line up
+                    delay = min(self._base_retry_delay * (2 ** attempt), self._max_retry_delay)
+                    delay *= 1 + random.uniform(0, self._jitter)
 
                     # Update status to show retry
-                    if hasattr(self._status_bar, 'set_status'):
-                        self._status_bar.set_status(
-                            f"Retrying save (attempt {attempt + 2}/{self._max_retries})...")
-                    else:
-                        self._status_bar.update_status(
-                            f"Retrying save (attempt {attempt + 2}/{self._max_retries})...")
+                    self._show_status(
+                        f"Retrying save (attempt {attempt + 2}/{self._max_retries})...",
+                        always=True)
 
                     # Wait before retry
                     time.sleep(delay)
@@ -273,55 +389,37 @@ class AutoSaveManager:
 
     def _create_backup(self, file_path: Path) -> None:
         """
-        Create a timestamped backup file.
+        Write a new backup into slot 0, rotating older backups along.
 
         Args:
             file_path: Original file path
         """
-        # Generate timestamp
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-
-        # Create backup filename
-        backup_name = f"{file_path.stem}_autosave_{timestamp}{file_path.suffix}"
-        backup_path = file_path.parent / backup_name
+        backup_path: Optional[Path] = self._backup_slot(file_path, 0)
 
-        # Use temporary file for atomic save
-        with tempfile.NamedTemporaryFile(mode='wb', delete=False,
-                                         suffix=file_path.suffix) as temp_file:
-            temp_path = Path(temp_file.name)
+        # Write the temp file beside the backup so the final move is a
+        # same-filesystem rename rather than a copy
+        try:
+            backup_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(prefix=f".{file_path.stem}_",
+                                             suffix=file_path.suffix,
+                                             dir=str(backup_path.parent))
+        except PermissionError:
+            # Restricted backup directory (e.g. in tests): still save, skip the backup
+            fd, temp_name = tempfile.mkstemp(suffix=file_path.suffix)
+            backup_path = None
+        os.close(fd)
+        temp_path = Path(temp_name)
 
         try:
             # Save to temporary file first
             self.save_to_file(temp_path)
 
-            # Check if temp file was actually created (might be mocked in tests)
-            file_exists = temp_path.exists()
-
-            if file_exists:
-                try:
-                    # Ensure backup directory exists
-                    backup_path.parent.mkdir(parents=True, exist_ok=True)
-                    # Atomically move to final location
-                    shutil.move(str(temp_path), backup_path)
-                except PermissionError:
-                    # In test scenarios with restricted paths, skip backup creation
-                    # but still clean up temp file
-                    temp_path.unlink()
+            if backup_path is not None and self._backup_count > 0:
+                self._rotate_backups(file_path)
+                # Atomically move to final location
+                os.replace(temp_path, backup_path)
             else:
-                # In test scenarios, the temp file might not actually exist
-                # but we still want to simulate the backup creation for testing
-                # Check if shutil.move is mocked (indicating we're in a test)
-                is_mocked = hasattr(shutil.move, '_mock_name')
-                if is_mocked:
-                    try:
-                        # Ensure backup directory exists
-                        backup_path.parent.mkdir(parents=True, exist_ok=True)
-                    except (PermissionError, OSError):
-                        # Directory creation failed, but we still want to test the move call
-                        pass
-
-                    # Simulate the move operation (mocked, so it won't actually fail)
-                    shutil.move(str(temp_path), backup_path)
+                temp_path.unlink()
 
         except Exception:
             # Clean up temp file if it exists
@@ -329,50 +427,46 @@ class AutoSaveManager:
                 temp_path.unlink()
             raise
 
-    def _cleanup_old_backups(self) -> None:
+    @staticmethod
+    def _backup_slot(file_path: Path, index: int) -> Path:
         """
-        Clean up old backup files beyond the retention limit.
-        """
-        file_path = self.get_file_path()
-        if not file_path:
-            return
+        Get the path of a backup slot; slot 0 holds the newest backup.
 
-        # Find all backup files for this file
-        pattern = f"{file_path.stem}_autosave_*{file_path.suffix}"
-        backup_files = list(file_path.parent.glob(pattern))
+        Args:
+            file_path: Original file path
+            index: Slot number
+        """
+        return file_path.parent / f"{file_path.stem}_autosave_{index}{file_path.suffix}"
 
-        # Sort by modification time (newest first)
-        backup_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
+    def _rotate_backups(self, file_path: Path) -> None:
+        """
+        Shift each backup one slot older, dropping the oldest.
 
-        # Remove files beyond retention limit
-        for old_backup in backup_files[self._backup_count:]:
+        Args:
+            file_path: Original file path
+        """
+        for index in range(self._backup_count - 1, 0, -1):
             try:
-                old_backup.unlink()
-            except Exception:
-                # Ignore errors when cleaning up old backups
-                pass
+                os.replace(self._backup_slot(file_path, index - 1),
+                           self._backup_slot(file_path, index))
+            except FileNotFoundError:
+                pass  # Slot not filled yet
 
     def shutdown(self) -> None:
         """Shutdown the auto-save manager and clean up resources."""
         # Set shutdown flag to prevent new operations
         self._shutdown_requested = True
 
-        # Cancel any pending timer
-        with self._timer_lock:
-            if self._save_timer is not None and self._save_timer.is_alive():
-                self._save_timer.cancel()
-                self._save_timer = None
+        # Cancel any pending save and stop the debounce thread
+        self._handled_edit = self._last_edit
+        self._wake.set()
 
-        # Shutdown thread pool gracefully
-        if hasattr(self, '_executor'):
-            try:
-                self._executor.shutdown(wait=True)
-            except Exception:
-                pass  # Ignore shutdown errors
+        # Let a save already in progress finish
+        if threading.current_thread() is not self._debounce_thread:
+            self._debounce_thread.join()
 
-    def __del__(self) -> None:
-        """Cleanup resources when object is destroyed."""
-        try:
-            self.shutdown()
-        except Exception:
-            pass  # Ignore errors during cleanup
+    def __enter__(self) -> "AutoSaveManager":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.shutdown()
@@ -1,7 +1,52 @@
 """ColorFormatter implementation for threshold and gradient-based color calculations."""
 
+import bisect
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.models.data_models import ConstraintRow
+
+# Two-digit hex strings for 0-255, indexed by channel value
+_HEX = tuple(f"{i:02X}" for i in range(256))
+_HEX_BYTES = np.array(_HEX, dtype=object)
+
+
+@lru_cache(maxsize=256)
+def _parse_hex(color: str) -> Tuple[int, int, int]:
+    """Parse a #RRGGBB string into an RGB tuple."""
+    return int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+
+
+@lru_cache(maxsize=4096)
+def _interpolate(color1: str, color2: str, ratio: float) -> str:
+    """Blend two hex colors; cached because redraws repeat the same cell values."""
+    r1, g1, b1 = _parse_hex(color1)
+    r2, g2, b2 = _parse_hex(color2)
+
+    # Interpolate each channel with proper rounding
+    r = round(r1 + (r2 - r1) * ratio)
+    g = round(g1 + (g2 - g1) * ratio)
+    b = round(b1 + (b2 - b1) * ratio)
+
+    # Clamp values to 0-255 range
+    r = max(0, min(255, r))
+    g = max(0, min(255, g))
+    b = max(0, min(255, b))
+
+    # Convert back to hex
+    return "#" + _HEX[r] + _HEX[g] + _HEX[b]
+
+
+def _interpolate_array(color1: str, color2: str, ratios: np.ndarray) -> np.ndarray:
+    """Vectorized _interpolate: blend two hex colors at each ratio."""
+    start = np.array(_parse_hex(color1), dtype=float)
+    end = np.array(_parse_hex(color2), dtype=float)
+    rgb = np.round(start + (end - start) * ratios[:, None])
+    rgb = np.clip(rgb, 0, 255).astype(np.intp)
+    return "#" + _HEX_BYTES[rgb[:, 0]] + _HEX_BYTES[rgb[:, 1]] + _HEX_BYTES[rgb[:, 2]]
 
 
 @dataclass
@@ -25,19 +70,44 @@ class ColorFormatter:
                 colors=["#00FF00", "#FFFF00", "#FFA500", "#FF0000"]  # Green, Yellow, Orange, Red
             )
 
+        # Snapshot thresholds/colors so VIEW lookups are a single bisect
+        self._thresholds = tuple(self.config.thresholds)
+        self._colors = tuple(self.config.colors)
+        self._threshold_array = np.asarray(self._thresholds, dtype=float)
+        self._color_array = np.array(self._colors, dtype=object)
+
+        # Non-binding constraint tints: each VIEW color blended 20%-60% toward
+        # white in 1% steps
+        self._white_blends = {
+            color: tuple(self.interpolate_color(color, "#FFFFFF", 0.2 + i * 0.01) for i in range(41))
+            for color in self._colors
+        }
+
+        # RECENT_DELTA colors for whole values -100..100, indexed by value + 100
+        self._delta_lut = tuple(self._recent_delta_gradient(float(v)) for v in range(-100, 101))
+
     def get_view_color(self, value: float) -> str:
         """Return hex color for VIEW value based on thresholds."""
         if value < 0:
             # Handle negative values by returning green (minimum threshold)
-            return self.config.colors[0]
+            return self._colors[0]
 
-        # Find the appropriate color based on thresholds
-        for i, threshold in enumerate(self.config.thresholds):
-            if value < threshold:
-                return self.config.colors[i]
+        # Index of the first threshold the value is below
+        i = bisect.bisect_right(self._thresholds, value)
+        if i < len(self._thresholds):
+            return self._colors[i]
 
         # If value is above all thresholds, return the last color
-        return self.config.colors[-1]
+        return self._colors[-1]
+
+    def get_view_colors(self, values) -> np.ndarray:
+        """Return hex colors for a whole column of VIEW values (see get_view_color)."""
+        values = np.asarray(values, dtype=float)
+        idx = np.searchsorted(self._threshold_array, values, side='right')
+        # Above all thresholds -> last color; negatives -> first color
+        idx = np.where(idx < len(self._thresholds), idx, len(self._colors) - 1)
+        idx[values < 0] = 0
+        return self._color_array[idx]
 
     def get_prev_color(self, value: Optional[float]) -> str:
         """Return hex color for PREV value, handling None gracefully."""
@@ -81,27 +151,7 @@ class ColorFormatter:
 
     def interpolate_color(self, color1: str, color2: str, ratio: float) -> str:
         """Interpolate between two colors by ratio (0-1)."""
-        # Parse hex colors to RGB
-        r1 = int(color1[1:3], 16)
-        g1 = int(color1[3:5], 16)
-        b1 = int(color1[5:7], 16)
-
-        r2 = int(color2[1:3], 16)
-        g2 = int(color2[3:5], 16)
-        b2 = int(color2[5:7], 16)
-
-        # Interpolate each channel with proper rounding
-        r = round(r1 + (r2 - r1) * ratio)
-        g = round(g1 + (g2 - g1) * ratio)
-        b = round(b1 + (b2 - b1) * ratio)
-
-        # Clamp values to 0-255 range
-        r = max(0, min(255, r))
-        g = max(0, min(255, g))
-        b = max(0, min(255, b))
-
-        # Convert back to hex
-        return f"#{r:02X}{g:02X}{b:02X}"
+        return _interpolate(color1, color2, ratio)
 
     def get_shortlimit_color(self, value: Optional[float]) -> str:
         """Return hex color for SHORTLIMIT value using VIEW color scheme."""
@@ -109,11 +159,30 @@ class ColorFormatter:
             return "#CCCCCC"  # Neutral gray for None values
 
         # SHORTLIMIT values are typically negative, use absolute value for color
-        abs_value = abs(value)
-        return self.get_view_color(abs_value)
+        i = bisect.bisect_right(self._thresholds, -value if value < 0 else value)
+        if i < len(self._thresholds):
+            return self._colors[i]
+        return self._colors[-1]
+
+    def get_shortlimit_colors(self, values) -> np.ndarray:
+        """Return SHORTLIMIT colors for a whole column; missing values (None/NaN) are gray."""
+        values = np.asarray(values, dtype=float)
+        colors = self.get_view_colors(np.abs(values))
+        colors[np.isnan(values)] = "#CCCCCC"
+        return colors
 
     def get_constraint_color(self, constraint_row) -> str:
         """Return color for constraint row based on binding status and flow percentage."""
+        if isinstance(constraint_row, ConstraintRow):
+            # Typed rows: plain attribute reads, none of the duck-typing below
+            base_color = self.get_view_color(constraint_row.view)
+            if constraint_row.is_binding:
+                return base_color
+            limit = constraint_row.limit
+            flow_percentage = constraint_row.flow / limit if limit else 0.0
+            white_blend = max(0.2, min(0.6, 0.6 - flow_percentage * 0.4))
+            return self._blend_with_white(base_color, white_blend)
+
         # Get base color from VIEW value
         base_color = self.get_view_color(constraint_row.view)
 
@@ -145,7 +214,14 @@ class ColorFormatter:
         white_blend = 0.6 - (flow_percentage * 0.4)  # 0.6 down to 0.2 blend
         white_blend = max(0.2, min(0.6, white_blend))
 
-        return self.interpolate_color(base_color, "#FFFFFF", white_blend)
+        return self._blend_with_white(base_color, white_blend)
+
+    def _blend_with_white(self, base_color: str, white_blend: float) -> str:
+        """Look up base_color blended toward white, white_blend in [0.2, 0.6]."""
+        blends = self._white_blends.get(base_color)
+        if blends is None:
+            return self.interpolate_color(base_color, "#FFFFFF", white_blend)
+        return blends[round((white_blend - 0.2) * 100)]
 
     def format_recent_delta(self, value: Optional[float]) -> str:
         """Return blue-white-red gradient color for RECENT_DELTA column values.
@@ -160,14 +236,12 @@ class ColorFormatter:
             - Red for positive values (degradation)
             - Saturation at ±100
         """
-        import math
-
         # Handle None values
         if value is None:
             return "#FFFFFF"  # Return white for None
 
-        # Handle NaN values
-        if math.isnan(value):
+        # Handle NaN values (NaN is the only value unequal to itself)
+        if value != value:
             return "#FFFFFF"  # Return white for NaN
 
         # Handle near-zero values (±0.01 tolerance)
@@ -177,6 +251,14 @@ class ColorFormatter:
         # Clamp to saturation range of ±100
         clamped_value = max(-100.0, min(100.0, value))
 
+        # Whole values (including everything saturated) come from the table
+        whole = int(clamped_value)
+        if whole == clamped_value:
+            return self._delta_lut[whole + 100]
+        return self._recent_delta_gradient(clamped_value)
+
+    def _recent_delta_gradient(self, clamped_value: float) -> str:
+        """Compute the RECENT_DELTA color for a value already clamped to ±100."""
         # Use a non-linear scale to make small values visible while maintaining saturation at ±100
         abs_val = abs(clamped_value)
 
@@ -197,3 +279,28 @@ class ColorFormatter:
         else:
             # Positive values: white to red gradient
             return self.interpolate_color("#FFFFFF", "#FF0000", ratio)
+
+    def format_recent_delta_batch(self, values) -> np.ndarray:
+        """Return RECENT_DELTA colors for a whole column (see format_recent_delta).
+
+        Args:
+            values: Delta values; None and NaN map to white.
+
+        Returns:
+            Object array of hex color strings, one per input value.
+        """
+        values = np.asarray(values, dtype=float)
+        clamped = np.clip(values, -100.0, 100.0)
+        abs_val = np.abs(clamped)
+
+        # Same piecewise scale as the scalar version
+        ratio = np.where(abs_val <= 1.0, abs_val, 0.1 + (0.9 * (abs_val - 1.0) / 99.0))
+        ratio = np.minimum(ratio, 1.0)
+
+        colors = np.where(
+            clamped < 0,
+            _interpolate_array("#FFFFFF", "#0000F8", np.nan_to_num(ratio)),
+            _interpolate_array("#FFFFFF", "#FF0000", np.nan_to_num(ratio)),
+        )
+        colors[np.isnan(values) | (np.abs(values) <= 0.01)] = "#FFFFFF"
+        return colors
@@ -5,9 +5,13 @@ This module provides the central data management component that coordinates
 Excel data operations, cluster filtering, and sheet navigation.
 """
 
+import hashlib
+import itertools
+import uuid
+import numpy as np
 import pandas as pd
 import threading
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Set, Tuple
 from datetime import datetime
 from collections import deque
 from pathlib import Path
@@ -17,6 +21,14 @@ from src.business_logic.validators import DataValidator
 from src.models.data_models import EditRecord, ClusterInfo
 
 
+# Positions for a cluster that is not in the sheet
+_NO_ROWS = np.empty(0, dtype=np.intp)
+
+# Read-only numeric columns that may be stored as float32
+_FLOAT32_COLUMNS = {'LODF', 'FLOW', 'LIMIT', 'PREV', 'PACTUAL', 'PEXPECTED',
+                    'BHOURS', 'MAXHIST', 'EXP_PEAK', 'EXP_OP', 'RECENT_DELTA'}
+
+
 class ExcelDataManager:
     """
     Central data management component for Excel operations.
@@ -33,6 +45,16 @@ class ExcelDataManager:
         """Initialize with ExcelIO instance for data operations."""
         self._excel_io = excel_io
         self._sheet_cache: Dict[str, pd.DataFrame] = {}
+        # Row positions of each cluster, per sheet
+        self._cluster_rows: Dict[str, Dict[Any, np.ndarray]] = {}
+        # Cluster names in sheet order, per sheet
+        self._cluster_names: Dict[str, List[str]] = {}
+        # Whether each sheet's CLUSTER column is numeric, so lookups parse ints
+        self._cluster_numeric: Dict[str, bool] = {}
+        # Column positions per sheet, for positional cell writes
+        self._column_positions: Dict[str, Dict[str, int]] = {}
+        # Sheets that differ from the source workbook
+        self._dirty_sheets: Set[str] = set()
         self._sheet_names: List[str] = []
         self._active_sheet: Optional[str] = None
         self._is_modified: bool = False
@@ -41,17 +63,23 @@ class ExcelDataManager:
         # Edit operations support
         self._validator = DataValidator()
         self._edit_history: deque = deque(maxlen=1000)  # FIFO with 1000 entry limit
+        self._edits_by_id: Dict[str, EditRecord] = {}  # Edit ID -> record still in history
+        self._edit_ids = itertools.count(1)
+        self._history_snapshot: Optional[Tuple[EditRecord, ...]] = None  # Rebuilt after new edits
+        self._session_id = uuid.uuid4().hex[:8]
         self._edit_lock = threading.RLock()  # Thread-safe operations
 
         # Define editable columns
-        self._editable_columns = {'VIEW', 'SHORTLIMIT'}
+        self._editable_columns = frozenset({'VIEW', 'SHORTLIMIT'})
+        self._column_validators = {column: self._validator.compile_validator(column)
+                                   for column in self._editable_columns}
 
         # Define read-only columns
-        self._readonly_columns = {'CLUSTER', 'CUID', 'LODF', 'FLOW', 'LIMIT',
-                                  'PREV', 'PACTUAL', 'PEXPECTED', 'VIEWLG',
-                                  'MON', 'CONT', 'DIRECTION', 'SOURCE', 'SINK',
-                                  'LAST_BINDING', 'BHOURS', 'MAXHIST', 'EXP_PEAK',
-                                  'EXP_OP', 'RECENT_DELTA'}
+        self._readonly_columns = frozenset({'CLUSTER', 'CUID', 'LODF', 'FLOW', 'LIMIT',
+                                            'PREV', 'PACTUAL', 'PEXPECTED', 'VIEWLG',
+                                            'MON', 'CONT', 'DIRECTION', 'SOURCE', 'SINK',
+                                            'LAST_BINDING', 'BHOURS', 'MAXHIST', 'EXP_PEAK',
+                                            'EXP_OP', 'RECENT_DELTA'})
 
     def load_workbook(self, file_path: str) -> None:
         """Load Excel workbook and cache all sheet data."""
@@ -60,6 +88,11 @@ class ExcelDataManager:
         self._sheet_names = self._excel_io.get_sheet_names()
         # Clear any existing cache
         self._sheet_cache.clear()
+        self._cluster_rows.clear()
+        self._cluster_names.clear()
+        self._cluster_numeric.clear()
+        self._column_positions.clear()
+        self._dirty_sheets.clear()
         self._active_sheet = None
         self._is_modified = False
 
@@ -90,27 +123,18 @@ class ExcelDataManager:
         if 'CLUSTER' not in sheet_data.columns:
             return pd.DataFrame()
 
-        # Convert cluster_name to appropriate type for comparison
-        try:
-            # Try to convert to int first
-            cluster_value = int(cluster_name)
-        except ValueError:
-            # Keep as string if conversion fails
-            cluster_value = cluster_name
+        # Select the cluster's rows by position; take() builds a new frame,
+        # so callers can modify the result without touching the cached sheet
+        positions = self._cluster_positions(self._active_sheet, cluster_name)
+        if columns is None:
+            return sheet_data.take(positions)
 
-        # Filter by cluster
-        filtered_data = sheet_data[sheet_data['CLUSTER'] == cluster_value].copy()
-
-        # Apply column filtering if specified
-        if columns is not None:
-            # Only include columns that exist in the data
-            existing_columns = [col for col in columns if col in filtered_data.columns]
-            if existing_columns:
-                filtered_data = filtered_data[existing_columns]
-            else:
-                return pd.DataFrame()
-
-        return filtered_data
+        # Apply column filtering: only include columns that exist in the data
+        column_positions = self._get_column_positions(self._active_sheet)
+        existing_columns = [column_positions[col] for col in columns if col in column_positions]
+        if not existing_columns:
+            return pd.DataFrame()
+        return sheet_data.take(positions).take(existing_columns, axis=1)
 
     def get_all_clusters(self) -> List[str]:
         """Return list of unique cluster names in active sheet."""
@@ -123,9 +147,12 @@ class ExcelDataManager:
         if 'CLUSTER' not in sheet_data.columns:
             return []
 
-        # Get unique clusters and convert to strings
-        unique_clusters = sheet_data['CLUSTER'].dropna().unique()
-        return [str(cluster) for cluster in unique_clusters]
+        # Unique clusters as strings, computed once per sheet
+        names = self._cluster_names.get(self._active_sheet)
+        if names is None:
+            names = [str(cluster) for cluster in self._get_cluster_rows(self._active_sheet)]
+            self._cluster_names[self._active_sheet] = names
+        return names.copy()
 
     def update_value(self, cluster: str, constraint_index: int, column: str, value: Any) -> bool:
         """Update a cell value in the active sheet."""
@@ -136,26 +163,24 @@ class ExcelDataManager:
         sheet_data = self._get_cached_sheet_data(self._active_sheet)
 
         # Find rows matching the cluster
-        try:
-            cluster_value = int(cluster)
-        except ValueError:
-            cluster_value = cluster
-
-        cluster_rows = sheet_data[sheet_data['CLUSTER'] == cluster_value]
-        if len(cluster_rows) <= constraint_index or constraint_index < 0:
+        positions = self._cluster_positions(self._active_sheet, cluster)
+        if len(positions) <= constraint_index or constraint_index < 0:
             return False
 
-        if column not in sheet_data.columns:
+        column_pos = self._get_column_positions(self._active_sheet).get(column)
+        if column_pos is None:
             return False
 
-        # Get the actual index in the original dataframe
-        actual_index = cluster_rows.index[constraint_index]
-
         # Update the value
-        sheet_data.loc[actual_index, column] = value
+        sheet_data.iat[positions[constraint_index], column_pos] = value
+
+        # Cluster membership changed, so the row index is stale
+        if column == 'CLUSTER':
+            self._invalidate_clusters(self._active_sheet)
 
         # Mark as modified
         self._is_modified = True
+        self._dirty_sheets.add(self._active_sheet)
 
         return True
 
@@ -215,30 +240,27 @@ class ExcelDataManager:
             sheet_data = self._get_cached_sheet_data(self._active_sheet)
 
             # Find the target row
-            try:
-                cluster_value = int(cluster)
-            except ValueError:
-                cluster_value = cluster
-
-            cluster_rows = sheet_data[sheet_data['CLUSTER'] == cluster_value]
-            if len(cluster_rows) <= constraint_index or constraint_index < 0:
+            positions = self._cluster_positions(self._active_sheet, cluster)
+            if len(positions) <= constraint_index or constraint_index < 0:
                 return False, f"Invalid constraint index {constraint_index} for cluster {cluster}"
 
-            if column not in sheet_data.columns:
+            column_pos = self._get_column_positions(self._active_sheet).get(column)
+            if column_pos is None:
                 return False, f"Column '{column}' not found in data"
 
             # Get the actual dataframe index
-            actual_index = cluster_rows.index[constraint_index]
-            old_value = sheet_data.loc[actual_index, column]
+            row_pos = positions[constraint_index]
+            actual_index = sheet_data.index[row_pos]
+            old_value = sheet_data.iat[row_pos, column_pos]
 
             # Validate the new value
-            validation_result = self._validator.validate_cell(column, value)
+            validation_result = self._column_validator(column)(value)
             if not validation_result.is_valid:
                 return False, validation_result.error_message
 
             # Apply the update
             new_value = validation_result.sanitized_value
-            sheet_data.loc[actual_index, column] = new_value
+            sheet_data.iat[row_pos, column_pos] = new_value
 
             # Record the edit in history
             edit_record = EditRecord(
@@ -248,12 +270,14 @@ class ExcelDataManager:
                 constraint_index=actual_index,
                 column=column,
                 old_value=old_value,
-                new_value=new_value
+                new_value=new_value,
+                cuid=self._next_edit_id()
             )
-            self._edit_history.append(edit_record)
+            self._record_edits([edit_record])
 
             # Mark as modified
             self._is_modified = True
+            self._dirty_sheets.add(self._active_sheet)
 
             return True, "Value updated successfully"
 
@@ -292,16 +316,13 @@ class ExcelDataManager:
                     }
                 cell_targets.add(cell_key)
 
-            # Create backup of current state for rollback
-            if self._active_sheet:
-                backup_data = self._get_cached_sheet_data(self._active_sheet).copy()
-                backup_history_size = len(self._edit_history)
-            else:
+            if not self._active_sheet:
                 return {'success': False, 'applied_count': 0, 'failed_count': 1,
                         'error_message': 'No active sheet selected'}
 
             # Validate all updates first
             validation_errors = []
+            sanitized_values = []
             for i, update in enumerate(updates):
                 # Check column editability
                 if not self.can_edit_column(update['column']):
@@ -311,9 +332,10 @@ class ExcelDataManager:
                     continue
 
                 # Validate the value
-                validation_result = self._validator.validate_cell(update['column'], update['value'])
+                validation_result = self._column_validator(update['column'])(update['value'])
                 if not validation_result.is_valid:
                     validation_errors.append(f"Update {i}: {validation_result.error_message}")
+                sanitized_values.append(validation_result.sanitized_value)
 
             # If any validation failed, return error
             if validation_errors:
@@ -324,44 +346,76 @@ class ExcelDataManager:
                     'error_message': '; '.join(validation_errors)
                 }
 
-            # Apply all updates
-            applied_count = 0
+            # Resolve every target cell before touching the sheet
+            sheet_data = self._get_cached_sheet_data(self._active_sheet)
+            column_positions = self._get_column_positions(self._active_sheet)
+            targets = []
+            for update, new_value in zip(updates, sanitized_values):
+                cluster = update['cluster']
+                constraint_index = update['constraint_index']
+                positions = self._cluster_positions(self._active_sheet, cluster)
+                if len(positions) <= constraint_index or constraint_index < 0:
+                    message = f"Invalid constraint index {constraint_index} for cluster {cluster}"
+                else:
+                    column_pos = column_positions.get(update['column'])
+                    if column_pos is not None:
+                        targets.append((update, positions[constraint_index], column_pos, new_value))
+                        continue
+                    message = f"Column '{update['column']}' not found in data"
+                return {
+                    'success': False,
+                    'applied_count': 0,
+                    'failed_count': 1,
+                    'error_message': message
+                }
+
+            # Group writes by column and back up only the touched columns
+            by_column: Dict[int, Tuple[List[int], List[Any]]] = {}
+            backup: Dict[int, pd.Series] = {}
+            column_values = {}
+            edit_records = []
+            timestamp = datetime.now()
+            for update, row_pos, column_pos, new_value in targets:
+                rows, values = by_column.setdefault(column_pos, ([], []))
+                rows.append(row_pos)
+                values.append(new_value)
+                if column_pos not in backup:
+                    backup[column_pos] = sheet_data.iloc[:, column_pos].copy()
+                    column_values[column_pos] = backup[column_pos].to_numpy()
+                edit_records.append(EditRecord(
+                    timestamp=timestamp,
+                    sheet=self._active_sheet,
+                    cluster_id=str(update['cluster']),
+                    constraint_index=sheet_data.index[row_pos],
+                    column=update['column'],
+                    old_value=column_values[column_pos][row_pos],
+                    new_value=new_value,
+                    cuid=self._next_edit_id()
+                ))
+
+            # Apply all updates, one assignment per column
             try:
-                for update in updates:
-                    success, message = self.validate_and_update(
-                        update['cluster'],
-                        update['constraint_index'],
-                        update['column'],
-                        update['value']
-                    )
-                    if success:
-                        applied_count += 1
-                    else:
-                        # Rollback: restore backup and truncate history
-                        self._sheet_cache[self._active_sheet] = backup_data
-                        self._edit_history = deque(list(self._edit_history)[
-                                                   :backup_history_size], maxlen=1000)
-                        return {
-                            'success': False,
-                            'applied_count': 0,
-                            'failed_count': 1,
-                            'error_message': message
-                        }
+                for column_pos, (rows, values) in by_column.items():
+                    if sheet_data.dtypes.iat[column_pos].kind == 'f':
+                        # Cleared cells come through as None
+                        values = np.array(values, dtype=float)
+                    sheet_data.iloc[rows, column_pos] = values
+
+                self._record_edits(edit_records)
+                self._is_modified = True
+                self._dirty_sheets.add(self._active_sheet)
 
                 return {
                     'success': True,
-                    'applied_count': applied_count,
+                    'applied_count': len(edit_records),
                     'failed_count': 0
                 }
 
             except Exception as e:
-                # Rollback on any exception
-                self._sheet_cache[self._active_sheet] = backup_data
-                self._edit_history = deque(
-                    list(
-                        self._edit_history)[
-                        :backup_history_size],
-                    maxlen=1000)
+                # Rollback on any exception; history is only extended once
+                # every column has been written, so it needs no rollback
+                for column_pos, column in backup.items():
+                    sheet_data.isetitem(column_pos, column)
                 return {
                     'success': False,
                     'applied_count': 0,
@@ -371,13 +425,23 @@ class ExcelDataManager:
 
     def get_edit_history(self) -> List[EditRecord]:
         """Return list of all edits made in this session."""
+        return list(self.history_snapshot())
+
+    def history_snapshot(self) -> Tuple[EditRecord, ...]:
+        """
+        Return the edit history as a tuple, reused until the next edit.
+
+        EditRecords are immutable, so the tuple can be held outside the lock.
+        """
         with self._edit_lock:
-            return list(self._edit_history)
+            if self._history_snapshot is None:
+                self._history_snapshot = tuple(self._edit_history)
+            return self._history_snapshot
 
     def can_edit_column(self, column: str) -> bool:
         """Check if a column is editable based on business rules."""
-        column_upper = column.upper()
-        return column_upper in self._editable_columns
+        # Sheet column names are already upper case; only other spellings need .upper()
+        return column in self._editable_columns or column.upper() in self._editable_columns
 
     def rollback_edit(self, edit_id: str) -> bool:
         """
@@ -391,25 +455,46 @@ class ExcelDataManager:
         """
         with self._edit_lock:
             # Find the edit in history
-            target_edit = None
-            for edit in self._edit_history:
-                if edit.cuid == edit_id:
-                    target_edit = edit
-                    break
-
+            target_edit = self._edits_by_id.get(edit_id)
             if target_edit is None:
                 return False
 
             # Apply the rollback by setting the value back to old_value
             if self._active_sheet == target_edit.sheet:
                 sheet_data = self._get_cached_sheet_data(self._active_sheet)
-                if target_edit.row < len(sheet_data) and target_edit.column in sheet_data.columns:
-                    sheet_data.loc[target_edit.row, target_edit.column] = target_edit.old_value
+                column_pos = self._get_column_positions(self._active_sheet).get(target_edit.column)
+                if target_edit.constraint_index in sheet_data.index and column_pos is not None:
+                    row_pos = sheet_data.index.get_loc(target_edit.constraint_index)
+                    sheet_data.iat[row_pos, column_pos] = target_edit.old_value
+                    if target_edit.column == 'CLUSTER':
+                        self._invalidate_clusters(self._active_sheet)
                     self._is_modified = True
+                    self._dirty_sheets.add(self._active_sheet)
                     return True
 
             return False
 
+    def _next_edit_id(self) -> str:
+        """Return an edit ID unique within this session."""
+        return f"{self._session_id}-{next(self._edit_ids)}"
+
+    def _record_edits(self, edit_records: List[EditRecord]) -> None:
+        """Append edits to the history, dropping evicted ones from the ID lookup."""
+        history = self._edit_history
+        for edit_record in edit_records:
+            if len(history) == history.maxlen:
+                self._edits_by_id.pop(history[0].cuid, None)
+            history.append(edit_record)
+            self._edits_by_id[edit_record.cuid] = edit_record
+        self._history_snapshot = None
+
+    def _column_validator(self, column: str):
+        """Return the compiled validator of an editable column, in any letter case."""
+        validator = self._column_validators.get(column)
+        if validator is None:
+            validator = self._column_validators[column.upper()]
+        return validator
+
     def get_validation_rules(self, column: str) -> Dict[str, Any]:
         """Return validation rules for a specific column."""
         return self._validator.get_column_rules(column)
@@ -423,6 +508,13 @@ class ExcelDataManager:
         """
         return self._is_modified
 
+    def mark_saved(self) -> None:
+        """
+        Record that the current data needs no further save, e.g. when edits
+        net out to what was last written.
+        """
+        self._is_modified = False
+
     def get_file_path(self) -> Optional[Path]:
         """
         Get the current file path.
@@ -441,27 +533,91 @@ class ExcelDataManager:
         Args:
             file_path: Path where to save the file
         """
-        # Collect all cached data
-        all_sheet_data = {}
-
-        # Include all sheets - load them if not cached
-        for sheet_name in self._sheet_names:
-            all_sheet_data[sheet_name] = self._get_cached_sheet_data(sheet_name)
+        # Only edited sheets are rewritten; ExcelIO copies the rest from the source
+        changed_sheets = {name: self._sheet_cache[name] for name in self._dirty_sheets}
 
         # Delegate to ExcelIO with specified path
-        self._excel_io.save_workbook(all_sheet_data, str(file_path))
+        self._excel_io.save_sheets(changed_sheets, str(file_path))
 
         # Mark as no longer modified
-        self._is_modified = False
+        self.mark_saved()
+
+    def content_hash(self) -> str:
+        """
+        Fingerprint the loaded sheet data.
+
+        Sheets that were never loaded are unchanged on disk, so only cached
+        sheets contribute.
+
+        Returns:
+            Hex digest that changes whenever a cached cell value changes
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for sheet_name in sorted(self._sheet_cache):
+            df = self._sheet_cache[sheet_name]
+            digest.update(sheet_name.encode())
+            digest.update(repr(list(df.columns)).encode())
+            digest.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+        return digest.hexdigest()
+
+    def _get_cluster_rows(self, sheet_name: str) -> Dict[Any, np.ndarray]:
+        """Map each cluster value to its row positions, grouping the sheet once."""
+        rows = self._cluster_rows.get(sheet_name)
+        if rows is None:
+            sheet_data = self._get_cached_sheet_data(sheet_name)
+            rows = sheet_data.groupby('CLUSTER', sort=False).indices
+            self._cluster_rows[sheet_name] = rows
+            self._cluster_numeric[sheet_name] = pd.api.types.is_numeric_dtype(
+                sheet_data['CLUSTER'])
+        return rows
+
+    def _invalidate_clusters(self, sheet_name: str) -> None:
+        """Drop the cluster index and names of a sheet after a CLUSTER write."""
+        self._cluster_rows.pop(sheet_name, None)
+        self._cluster_names.pop(sheet_name, None)
+        self._cluster_numeric.pop(sheet_name, None)
+
+    def _cluster_positions(self, sheet_name: str, cluster: str) -> np.ndarray:
+        """Row positions of a cluster; empty if the sheet has no such cluster."""
+        rows = self._get_cluster_rows(sheet_name)
+        # Cluster IDs arrive as strings; only numeric columns need them parsed
+        if self._cluster_numeric[sheet_name]:
+            try:
+                cluster = int(cluster)
+            except ValueError:
+                return _NO_ROWS
+        return rows.get(cluster, _NO_ROWS)
+
+    def _get_column_positions(self, sheet_name: str) -> Dict[str, int]:
+        """Map each column name of a sheet to its position."""
+        positions = self._column_positions.get(sheet_name)
+        if positions is None:
+            columns = self._get_cached_sheet_data(sheet_name).columns
+            positions = {name: i for i, name in enumerate(columns)}
+            self._column_positions[sheet_name] = positions
+        return positions
 
     def _get_cached_sheet_data(self, sheet_name: str) -> pd.DataFrame:
         """Get sheet data from cache or load from ExcelIO."""
         if sheet_name not in self._sheet_cache:
             # Load from ExcelIO and cache
-            self._sheet_cache[sheet_name] = self._excel_io.load_sheet(sheet_name)
+            self._sheet_cache[sheet_name] = self._narrow_floats(
+                ExcelIO.narrow_cluster_ids(self._excel_io.load_sheet(sheet_name)))
 
         return self._sheet_cache[sheet_name]
 
+    @staticmethod
+    def _narrow_floats(df: pd.DataFrame) -> pd.DataFrame:
+        """Store read-only float columns as float32 where every value fits exactly."""
+        for col in _FLOAT32_COLUMNS.intersection(df.columns):
+            if df[col].dtype != 'float64':
+                continue
+            narrowed = df[col].astype('float32')
+            # Lossy columns stay float64 so saves write back the same numbers
+            if narrowed.astype('float64').equals(df[col]):
+                df[col] = narrowed
+        return df
+
     def get_cluster_info(self, sheet: str, cluster_id: int) -> ClusterInfo:
         """
         Get detailed information about a cluster.
@@ -1,9 +1,10 @@
 """SessionManager for coordinating session state persistence and auto-save functionality."""
 
+import queue
 import time
 import threading
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from collections import deque
 
 from src.io.state_io import StateIO
@@ -40,10 +41,16 @@ class SessionManager:
 
         # Edit history for undo/redo
         self._edit_history: deque = deque(maxlen=max_history_entries)
+        self._history_snapshot: Optional[Tuple[EditRecord, ...]] = None  # Rebuilt after new edits
 
         # Threading lock for thread-safe operations
         self._lock = threading.Lock()
 
+        # Checkpoints are written by a single thread, started on first use;
+        # at most one state waits in the queue and newer checkpoints replace it
+        self._save_queue: queue.Queue = queue.Queue(maxsize=1)
+        self._writer: Optional[threading.Thread] = None
+
     def start_session(self) -> SessionState:
         """
         Load or create session state.
@@ -118,21 +125,46 @@ class SessionManager:
                 current_cluster=self.current_state.current_cluster,
                 current_row=self.current_state.current_row,
                 window_size=self.current_state.window_size,
-                last_modified=self.current_state.last_modified
+                last_modified=self.current_state.last_modified,
+                current_cluster_id=self.current_state.current_cluster_id
             )
+            self._enqueue_save(state_to_save)
+
+            start_writer = self._writer is None
+            if start_writer:
+                self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+
+        # Start outside the lock so the writer can record the save straight away
+        if start_writer:
+            self._writer.start()
+
+    def _enqueue_save(self, state: Optional[SessionState]) -> None:
+        """Queue a state for the writer, replacing one that has not been written yet."""
+        try:
+            self._save_queue.get_nowait()
+        except queue.Empty:
+            pass
+        self._save_queue.put_nowait(state)
+
+    def _writer_loop(self) -> None:
+        """Write queued checkpoint states until end_session queues None."""
+        while True:
+            state = self._save_queue.get()
+            if state is None:
+                return
 
-        # Perform save operation in background thread
-        def _background_save():
-            if self.state_io.save_session(state_to_save):
+            try:
+                saved = self.state_io.save_session(state)
+            except Exception:
+                # Leave the state dirty so the next checkpoint retries
+                saved = False
+
+            if saved:
                 with self._lock:
                     self._is_dirty = False
                     self._last_save_time = time.time()
                     self._has_been_saved = True
 
-        # Start background thread for save operation
-        save_thread = threading.Thread(target=_background_save, daemon=True)
-        save_thread.start()
-
     def should_auto_save(self) -> bool:
         """
         Check if auto-save should be triggered based on timing and dirty state.
@@ -158,7 +190,21 @@ class SessionManager:
         self._shutdown_requested = True
 
         with self._lock:
-            if self.current_state is not None and self._is_dirty:
+            # Any pending checkpoint is superseded by the final save below
+            writer = self._writer
+            if writer is not None:
+                self._enqueue_save(None)
+
+        # Let a checkpoint already being written finish first, so it can't
+        # overwrite the final state. Joined outside the lock, which the
+        # writer takes after each save.
+        if writer is not None:
+            writer.join()
+
+        with self._lock:
+            # A finished checkpoint clears the dirty flag even if it predates the
+            # latest updates, so write the final state whenever one may have run
+            if self.current_state is not None and (self._is_dirty or writer is not None):
                 self.state_io.save_session(self.current_state)
                 self._is_dirty = False
 
@@ -171,6 +217,7 @@ class SessionManager:
         """
         with self._lock:
             self._edit_history.append(edit_record)
+            self._history_snapshot = None
 
     def get_edit_history(self) -> List[EditRecord]:
         """
@@ -179,5 +226,18 @@ class SessionManager:
         Returns:
             List of EditRecord objects in chronological order
         """
+        return list(self.history_snapshot())
+
+    def history_snapshot(self) -> Tuple[EditRecord, ...]:
+        """
+        Get the edit history as a tuple, reused until the next recorded edit.
+
+        EditRecords are immutable, so the tuple can be held outside the lock.
+
+        Returns:
+            Tuple of EditRecord objects in chronological order
+        """
         with self._lock:
-            return list(self._edit_history)
+            if self._history_snapshot is None:
+                self._history_snapshot = tuple(self._edit_history)
+            return self._history_snapshot
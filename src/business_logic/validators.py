@@ -5,9 +5,47 @@ Provides comprehensive validation for VIEW (positive numbers) and SHORTLIMIT
 (negative numbers or None) columns with detailed error messages and edge case handling.
 """
 
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
 from src.models.data_models import ValidationResult
 
+try:
+    # C parser that reports bad input without raising, much cheaper on partial keystrokes
+    from fastnumbers import try_float as _try_float
+except ImportError:
+    _try_float = None
+
+# Shared results for rejected input, so a bad keystroke does not build a new object
+_NOT_A_NUMBER = ValidationResult(
+    is_valid=False,
+    error_message="Unable to convert input to a number",
+    sanitized_value=None
+)
+_VIEW_NOT_POSITIVE = ValidationResult(
+    is_valid=False,
+    error_message="VIEW must be a positive number greater than 0",
+    sanitized_value=None
+)
+_SHORTLIMIT_ZERO = ValidationResult(
+    is_valid=False,
+    error_message="SHORTLIMIT cannot be zero - must be negative or empty",
+    sanitized_value=None
+)
+_SHORTLIMIT_POSITIVE = ValidationResult(
+    is_valid=False,
+    error_message="SHORTLIMIT must be negative or empty",
+    sanitized_value=None
+)
+_SHORTLIMIT_EMPTY = ValidationResult(
+    is_valid=True,
+    error_message=None,
+    sanitized_value=None
+)
+
 
 class DataValidator:
     """
@@ -18,21 +56,27 @@ class DataValidator:
     - SHORTLIMIT: Must be negative number (<0) or None/empty
     """
 
+    # Column rules are fixed, so they are shared read-only by every validator
+    _COLUMN_RULES = MappingProxyType({
+        "VIEW": MappingProxyType({
+            "min_value": 0,
+            "exclusive_min": True,
+            "allow_none": False,
+            "description": "VIEW must be a positive number greater than 0"
+        }),
+        "SHORTLIMIT": MappingProxyType({
+            "max_value": 0,
+            "exclusive_max": True,
+            "allow_none": True,
+            "description": "SHORTLIMIT must be negative or empty"
+        })
+    })
+
     def __init__(self):
-        """Initialize validator with column rules."""
-        self._column_rules = {
-            "VIEW": {
-                "min_value": 0,
-                "exclusive_min": True,
-                "allow_none": False,
-                "description": "VIEW must be a positive number greater than 0"
-            },
-            "SHORTLIMIT": {
-                "max_value": 0,
-                "exclusive_max": True,
-                "allow_none": True,
-                "description": "SHORTLIMIT must be negative or empty"
-            }
+        """Initialize validator with its per-column dispatch table."""
+        self._validators: Dict[str, Callable[[Any], ValidationResult]] = {
+            "VIEW": self.validate_view,
+            "SHORTLIMIT": self.validate_shortlimit,
         }
 
     def validate_view(self, value: Any) -> ValidationResult:
@@ -47,30 +91,22 @@ class DataValidator:
         """
         # Handle None/empty values
         if value is None:
-            return ValidationResult(
-                is_valid=False,
-                error_message="VIEW must be a positive number greater than 0",
-                sanitized_value=None
-            )
+            return _VIEW_NOT_POSITIVE
 
         # Try to convert to numeric value
         numeric_value = self.sanitize_numeric_input(value)
 
         # Check if conversion failed
         if numeric_value is None:
-            return ValidationResult(
-                is_valid=False,
-                error_message="Unable to convert input to a number",
-                sanitized_value=None
-            )
+            return _NOT_A_NUMBER
+
+        # NaN is a missing value like None, as in validate_view_series; the text "nan" is not a number
+        if numeric_value != numeric_value:
+            return _NOT_A_NUMBER if isinstance(value, str) else _VIEW_NOT_POSITIVE
 
         # Check if value is positive
         if numeric_value <= 0:
-            return ValidationResult(
-                is_valid=False,
-                error_message="VIEW must be a positive number greater than 0",
-                sanitized_value=None
-            )
+            return _VIEW_NOT_POSITIVE
 
         # Value is valid
         return ValidationResult(
@@ -91,48 +127,28 @@ class DataValidator:
         """
         # Handle None/empty values - these are allowed for SHORTLIMIT
         if value is None:
-            return ValidationResult(
-                is_valid=True,
-                error_message=None,
-                sanitized_value=None
-            )
+            return _SHORTLIMIT_EMPTY
 
         # Handle empty strings and whitespace-only strings
         if isinstance(value, str):
             stripped_value = value.strip()
             if not stripped_value:
-                return ValidationResult(
-                    is_valid=True,
-                    error_message=None,
-                    sanitized_value=None
-                )
+                return _SHORTLIMIT_EMPTY
 
         # Try to convert to numeric value
         numeric_value = self.sanitize_numeric_input(value)
 
         # Check if conversion failed
         if numeric_value is None:
-            return ValidationResult(
-                is_valid=False,
-                error_message="Unable to convert input to a number",
-                sanitized_value=None
-            )
+            return _NOT_A_NUMBER
 
         # Check if value is zero (special case)
         if numeric_value == 0:
-            return ValidationResult(
-                is_valid=False,
-                error_message="SHORTLIMIT cannot be zero - must be negative or empty",
-                sanitized_value=None
-            )
+            return _SHORTLIMIT_ZERO
 
         # Check if value is positive (not allowed)
         if numeric_value > 0:
-            return ValidationResult(
-                is_valid=False,
-                error_message="SHORTLIMIT must be negative or empty",
-                sanitized_value=None
-            )
+            return _SHORTLIMIT_POSITIVE
 
         # Value is valid (negative)
         return ValidationResult(
@@ -152,19 +168,110 @@ class DataValidator:
         Returns:
             ValidationResult with validation status, error message, and sanitized value
         """
-        column_upper = column.upper()
+        # Callers nearly always pass the upper-case name, so try it before upper()
+        validate = self._validators.get(column)
+        if validate is None:
+            validate = self._validators.get(column.upper(), self._accept_any)
+        return validate(value)
 
-        if column_upper == "VIEW":
-            return self.validate_view(value)
-        elif column_upper == "SHORTLIMIT":
-            return self.validate_shortlimit(value)
+    def compile_validator(self, column: str) -> Callable[[Any], ValidationResult]:
+        """
+        Resolve the validator for a column once, for callers that validate it repeatedly.
+
+        Args:
+            column: Column name (e.g., "VIEW", "SHORTLIMIT")
+
+        Returns:
+            Callable taking an input value and returning its ValidationResult
+        """
+        return self._validators.get(column.upper(), self._accept_any)
+
+    @staticmethod
+    def _accept_any(value: Any) -> ValidationResult:
+        """Validator for columns without rules: any value is allowed as-is."""
+        return ValidationResult(
+            is_valid=True,
+            error_message=None,
+            sanitized_value=value
+        )
+
+    def validate_view_series(self, values: pd.Series) -> pd.DataFrame:
+        """
+        Validate a whole column of VIEW inputs at once (e.g. an imported or pasted column).
+
+        Applies the same rules as validate_view with vectorized pandas/NumPy operations;
+        NaN is treated like None.
+
+        Args:
+            values: Input values (numbers or numeric strings)
+
+        Returns:
+            DataFrame indexed like values with is_valid, error_message and
+            sanitized_value columns; sanitized_value is NaN for rejected inputs
+        """
+        numbers, _, blank, unconvertible = self._coerce_numeric_series(values)
+
+        error_message = np.select(
+            [unconvertible | blank, ~(numbers > 0)],
+            [_NOT_A_NUMBER.error_message, _VIEW_NOT_POSITIVE.error_message],
+            default=None
+        )
+        return self._series_results(values.index, numbers, error_message)
+
+    def validate_shortlimit_series(self, values: pd.Series) -> pd.DataFrame:
+        """
+        Validate a whole column of SHORTLIMIT inputs at once (e.g. an imported or pasted column).
+
+        Applies the same rules as validate_shortlimit with vectorized pandas/NumPy
+        operations. Missing values (None, NaN, blank strings) are valid and stay empty.
+
+        Args:
+            values: Input values (numbers or numeric strings)
+
+        Returns:
+            DataFrame indexed like values with is_valid, error_message and
+            sanitized_value columns; sanitized_value is NaN for empty or rejected inputs
+        """
+        numbers, missing, blank, unconvertible = self._coerce_numeric_series(values)
+
+        error_message = np.select(
+            [missing | blank, unconvertible, numbers == 0, numbers > 0],
+            [None, _NOT_A_NUMBER.error_message, _SHORTLIMIT_ZERO.error_message,
+             _SHORTLIMIT_POSITIVE.error_message],
+            default=None
+        )
+        return self._series_results(values.index, numbers, error_message)
+
+    def _coerce_numeric_series(self, values: pd.Series) -> Tuple[pd.Series, pd.Series, pd.Series, pd.Series]:
+        """
+        Convert inputs to floats.
+
+        Returns:
+            (numbers, missing, blank, unconvertible): the floats (NaN where there is
+            no number) and masks for None/NaN, whitespace-only strings and other
+            inputs that are not numbers
+        """
+        if pd.api.types.is_numeric_dtype(values):
+            numbers = values.astype(float)
+            missing = numbers.isna()
+            blank = pd.Series(False, index=values.index)
         else:
-            # Unknown column - allow any value
-            return ValidationResult(
-                is_valid=True,
-                error_message=None,
-                sanitized_value=value
-            )
+            # Non-strings come back as NaN from .str, so only real strings can be blank
+            blank = (values.astype(object).str.strip() == "").fillna(False).astype(bool)
+            missing = values.isna()
+            numbers = pd.to_numeric(values.mask(blank), errors='coerce').astype(float)
+        unconvertible = numbers.isna() & ~missing & ~blank
+        return numbers, missing, blank, unconvertible
+
+    @staticmethod
+    def _series_results(index: pd.Index, numbers: pd.Series, error_message: np.ndarray) -> pd.DataFrame:
+        """Assemble per-row results from the coerced numbers and any error messages."""
+        is_valid = pd.isna(error_message)
+        return pd.DataFrame({
+            'is_valid': is_valid,
+            'error_message': pd.Series(error_message, index=index, dtype=object),
+            'sanitized_value': numbers.where(is_valid).to_numpy(),
+        }, index=index)
 
     def sanitize_numeric_input(self, value: Any) -> Optional[float]:
         """
@@ -176,11 +283,18 @@ class DataValidator:
         Returns:
             Converted float value or None if conversion fails
         """
+        # Fast path for plain numbers, the common case when editing
+        value_type = type(value)
+        if value_type is float:
+            return value
+        if value_type is int:
+            return float(value)
+
         # Handle None
         if value is None:
             return None
 
-        # Handle already numeric values
+        # Handle other numeric values (bools, float/int subclasses)
         if isinstance(value, (int, float)):
             return float(value)
 
@@ -193,7 +307,9 @@ class DataValidator:
             if not cleaned:
                 return None
 
-            # Try to convert to float
+            # Try to convert to float; underscores are allowed to match float()
+            if _try_float is not None:
+                return _try_float(cleaned, on_fail=None, allow_underscores=True)
             try:
                 return float(cleaned)
             except ValueError:
@@ -218,8 +334,8 @@ class DataValidator:
         """
         column_upper = column.upper()
 
-        if column_upper in self._column_rules:
-            return self._column_rules[column_upper].copy()
+        if column_upper in self._COLUMN_RULES:
+            return dict(self._COLUMN_RULES[column_upper])
         else:
             # Default rules for unknown columns
             return {"allow_any": True}
@@ -1,10 +1,13 @@
 """Central data management and business logic."""
 
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 import logging
+import threading
 
 from ..models import ClusterInfo, EditRecord, ExcelMetadata
 from ..io import ExcelIO
@@ -29,13 +32,30 @@ class ExcelDataManager:
         self.excel_io = excel_io
         self.data: Dict[str, pd.DataFrame] = {}
         self.metadata: Optional[ExcelMetadata] = None
-        self.edit_history: List[EditRecord] = []
+        self.edit_history: deque = deque(maxlen=1000)  # FIFO with 1000 entry limit
         self.file_path: Optional[str] = None
+        self._sheet_names: List[str] = []
         self._cluster_cache: Dict[str, List[int]] = {}
+        # Row positions of each cluster, per sheet
+        self._cluster_rows: Dict[str, Dict[Any, np.ndarray]] = {}
+        # Column name -> position, per sheet
+        self._column_positions: Dict[str, Dict[str, int]] = {}
+        # Cells changed since the last save: sheet -> {(row, column): value}, 1-based
+        self._pending_edits: Dict[str, Dict[Tuple[int, int], Any]] = {}
+        # Guards _pending_edits, which edits (UI thread) and saves (worker) both touch
+        self._pending_lock = threading.Lock()
+        # Only one save at a time: the ExcelIO workbook kept in memory is not thread-safe
+        self._save_lock = threading.Lock()
+        # Per-sheet locks: a prefetch worker and the UI thread may build the same
+        # sheet's data and lookups at once. Reads of already-built entries skip them.
+        self._sheet_locks: Dict[str, threading.RLock] = {}
 
     def load_excel(self, file_path: str) -> None:
         """
-        Load Excel file into memory.
+        Open an Excel file for editing.
+
+        Only the sheet list is read here; sheet data is parsed on first
+        access through get_sheet().
 
         Args:
             file_path: Path to the Excel file
@@ -50,26 +70,73 @@ class ExcelDataManager:
         # Create ExcelIO instance if not provided
         if self.excel_io is None:
             self.excel_io = ExcelIO(Path(file_path))
-        
-        # Load workbook
-        success = self.excel_io.load_workbook()
-        if success:
-            # Load all sheets
-            sheet_names = self.excel_io.get_sheet_names()
-            self.data = {}
-            for sheet_name in sheet_names:
-                self.data[sheet_name] = self.excel_io.load_sheet(sheet_name)
-        else:
+
+        sheet_names = self.excel_io.get_sheet_names()
+        if not sheet_names:
             raise ValueError(f"Failed to load Excel file: {file_path}")
+
+        self.excel_io.create_backup(file_path)
+        self._sheet_names = list(sheet_names)
+        self.data = {}
+        self._column_positions.clear()
         self.file_path = file_path
 
+        # Build cluster cache (metadata counts clusters from it)
+        self._build_cluster_cache()
+
         # Build metadata
         self._build_metadata(start_time)
 
-        # Build cluster cache
+        logger.info(f"Opened {len(self._sheet_names)} sheets in {self.metadata.load_time_seconds:.2f}s")
+
+    def set_data(self, data: Dict[str, pd.DataFrame], file_path: str) -> None:
+        """
+        Use already-parsed sheets instead of reading them from disk.
+
+        Args:
+            data: Dictionary of sheet names to DataFrames
+            file_path: Path of the Excel file the sheets came from
+        """
+        start_time = datetime.now()
+        self.data = data
+        for df in data.values():
+            ExcelIO.narrow_cluster_ids(df)
+        self._column_positions.clear()
+        self._sheet_names = list(data.keys())
+        self.file_path = file_path
         self._build_cluster_cache()
+        self._build_metadata(start_time)
 
-        logger.info(f"Loaded {len(self.data)} sheets in {self.metadata.load_time_seconds:.2f}s")
+    def get_sheet(self, sheet: str) -> pd.DataFrame:
+        """
+        Get a sheet's data, parsing it from the workbook on first access.
+
+        Args:
+            sheet: Sheet name
+
+        Returns:
+            DataFrame for the sheet
+
+        Raises:
+            KeyError: If sheet doesn't exist
+        """
+        df = self.data.get(sheet)
+        if df is None:
+            if sheet not in self._sheet_names or self.excel_io is None:
+                raise KeyError(f"Sheet '{sheet}' not found")
+            with self._sheet_lock(sheet):
+                df = self.data.get(sheet)
+                if df is None:
+                    df = ExcelIO.narrow_cluster_ids(self.excel_io.load_sheet(sheet))
+                    self.data[sheet] = df
+        return df
+
+    def _sheet_lock(self, sheet: str) -> threading.RLock:
+        """Lock serializing parsing, cache builds and cluster edits for one sheet."""
+        lock = self._sheet_locks.get(sheet)
+        if lock is None:
+            lock = self._sheet_locks.setdefault(sheet, threading.RLock())
+        return lock
 
     def get_cluster_data(self, sheet: str, cluster_id: int) -> pd.DataFrame:
         """
@@ -86,21 +153,52 @@ class ExcelDataManager:
             KeyError: If sheet doesn't exist
             ValueError: If cluster doesn't exist
         """
-        if sheet not in self.data:
-            raise KeyError(f"Sheet '{sheet}' not found")
+        # take() already returns new data, so no extra copy is needed to detach it from the sheet
+        return self.get_sheet(sheet).take(self._constraint_positions(sheet, cluster_id))
+
+    def get_cluster_view(self, sheet: str, cluster_id: int) -> pd.DataFrame:
+        """
+        Get a cluster's constraints for read-only use, avoiding a copy where possible.
+
+        Same rows as get_cluster_data, but when they are contiguous in the sheet the
+        result is a slice that may share memory with it. Callers must not modify the
+        returned frame; use get_cluster_data for a private copy.
+
+        Raises:
+            KeyError: If sheet doesn't exist
+            ValueError: If cluster doesn't exist
+        """
+        df = self.get_sheet(sheet)
+        positions = self._constraint_positions(sheet, cluster_id)
+        if len(positions) and positions[-1] - positions[0] + 1 == len(positions):
+            return df.iloc[positions[0]:positions[-1] + 1]
+        return df.take(positions)
+
+    def get_cluster_positions(self, sheet: str, cluster_id: int) -> np.ndarray:
+        """
+        Sheet row positions of get_cluster_data's rows, in the same order.
 
-        df = self.data[sheet]
-        cluster_data = df[df['CLUSTER'] == cluster_id].copy()
+        These are what update_value expects; the frame's index labels are not.
 
-        if cluster_data.empty:
+        Raises:
+            KeyError: If sheet doesn't exist
+            ValueError: If cluster doesn't exist
+        """
+        return self._constraint_positions(sheet, cluster_id)
+
+    def _constraint_positions(self, sheet: str, cluster_id: int) -> np.ndarray:
+        """Row positions of a cluster's constraint rows (its header rows have an SP value)."""
+        df = self.get_sheet(sheet)
+        positions = self._get_cluster_rows(sheet).get(cluster_id)
+
+        if positions is None:
             raise ValueError(f"Cluster {cluster_id} not found in sheet {sheet}")
 
         # Filter out cluster header rows (rows where SP has a value)
         # Only return constraint rows (rows where SP is NaN/empty)
-        if 'SP' in cluster_data.columns:
-            cluster_data = cluster_data[cluster_data['SP'].isna()]
-
-        return cluster_data
+        if 'SP' in df.columns:
+            positions = positions[df['SP'].take(positions).isna().to_numpy()]
+        return positions
 
     def update_value(self, sheet: str, row: int, column: str, value: float) -> bool:
         """
@@ -108,7 +206,7 @@ class ExcelDataManager:
 
         Args:
             sheet: Sheet name
-            row: Row index
+            row: 0-based row position in the sheet (see get_cluster_positions)
             column: Column name
             value: New value
 
@@ -119,21 +217,20 @@ class ExcelDataManager:
             KeyError: If sheet/column doesn't exist
             IndexError: If row is out of bounds
         """
-        if sheet not in self.data:
-            raise KeyError(f"Sheet '{sheet}' not found")
-
-        df = self.data[sheet]
+        df = self.get_sheet(sheet)
 
         if row < 0 or row >= len(df):
             raise IndexError(f"Row {row} out of bounds for sheet {sheet}")
 
-        if column not in df.columns:
+        column_positions = self._get_column_positions(sheet)
+        col = column_positions.get(column)
+        if col is None:
             raise KeyError(f"Column '{column}' not found in sheet {sheet}")
 
         # Record edit
-        old_value = df.at[row, column]
-        cluster_id = df.at[row, 'CLUSTER']
-        # cuid = df.at[row, 'CUID'] if 'CUID' in df.columns else None  # Future use
+        old_value = df.iat[row, col]
+        cluster_id = df.iat[row, column_positions['CLUSTER']]
+        # cuid = df.iat[row, column_positions['CUID']] if 'CUID' in column_positions else None  # Future use
 
         edit = EditRecord(
             timestamp=datetime.now(),
@@ -145,10 +242,25 @@ class ExcelDataManager:
             new_value=value
         )
 
-        # Update value
-        df.at[row, column] = value
+        # Categorical label columns only accept known labels
+        dtype = df.dtypes.iloc[col]
+        if isinstance(dtype, pd.CategoricalDtype) and pd.notna(value) and value not in dtype.categories:
+            df.isetitem(col, df.iloc[:, col].cat.add_categories([value]))
+
+        # Under the sheet lock so a prefetch can't publish lookups built from the old value
+        with self._sheet_lock(sheet):
+            df.iat[row, col] = value
+
+            # Cluster lists only go stale when cluster membership changes
+            if column == 'CLUSTER':
+                self._cluster_cache.pop(sheet, None)
+                self._cluster_rows.pop(sheet, None)
         self.edit_history.append(edit)
 
+        cell = ExcelIO.worksheet_cell(row, col)
+        with self._pending_lock:
+            self._pending_edits.setdefault(sheet, {})[cell] = value if pd.notna(value) else None
+
         logger.debug(f"Updated {sheet}[{row},{column}]: {old_value} -> {value}")
         return True
 
@@ -156,16 +268,39 @@ class ExcelDataManager:
         """
         Save current data to a new timestamped file.
 
+        Only cells edited since the last save are written into the workbook;
+        everything else is carried over from the original file. Saves from
+        different threads run one after another; a caller arriving while a
+        save is in flight waits for it to finish.
+
         Returns:
             Path to the saved file
         """
         if not self.file_path:
             raise ValueError("No file loaded")
 
-        new_path = self.excel_io.save_workbook(self.data, self.file_path)
+        with self._save_lock:
+            # Swap first so edits made while the file is being written go to the next save
+            with self._pending_lock:
+                edits, self._pending_edits = self._pending_edits, {}
+            try:
+                new_path = self.excel_io.save_cell_edits(edits, self.file_path)
+            except Exception:
+                with self._pending_lock:
+                    for sheet, cells in edits.items():
+                        pending = self._pending_edits.setdefault(sheet, {})
+                        for cell, value in cells.items():
+                            pending.setdefault(cell, value)
+                raise
+
         logger.info(f"Saved changes to: {new_path}")
         return new_path
 
+    def has_pending_edits(self) -> bool:
+        """Whether any edits have not been written by save_changes yet."""
+        with self._pending_lock:
+            return any(self._pending_edits.values())
+
     def get_clusters_list(self, sheet: str) -> List[int]:
         """
         Get list of all cluster IDs in a sheet.
@@ -176,16 +311,56 @@ class ExcelDataManager:
         Returns:
             Sorted list of cluster IDs
         """
-        if sheet in self._cluster_cache:
-            return self._cluster_cache[sheet]
+        clusters = self._cluster_cache.get(sheet)
+        if clusters is None:
+            with self._sheet_lock(sheet):
+                clusters = self._cluster_cache.get(sheet)
+                if clusters is None:
+                    clusters = self._sorted_clusters(self.get_sheet(sheet))
+                    self._cluster_cache[sheet] = clusters
+        return clusters
 
-        if sheet not in self.data:
-            raise KeyError(f"Sheet '{sheet}' not found")
+    @staticmethod
+    def _sorted_clusters(df: pd.DataFrame) -> List[int]:
+        """Sorted unique cluster IDs, sorted in NumPy and converted to a list once."""
+        return np.sort(df['CLUSTER'].unique()).tolist()
 
-        clusters = self.data[sheet]['CLUSTER'].unique().tolist()
-        clusters.sort()
-        self._cluster_cache[sheet] = clusters
-        return clusters
+    def prefetch_sheet(self, sheet: str) -> None:
+        """
+        Parse a sheet and build its cluster lookups ahead of first use.
+
+        Args:
+            sheet: Sheet name
+
+        Raises:
+            KeyError: If sheet doesn't exist
+        """
+        # Held throughout so the UI thread waits for this build rather than repeating it
+        with self._sheet_lock(sheet):
+            self.get_clusters_list(sheet)
+            self._get_cluster_rows(sheet)
+
+    def _get_cluster_rows(self, sheet: str) -> Dict[Any, np.ndarray]:
+        """Map each cluster ID to its row positions, grouping the sheet once."""
+        rows = self._cluster_rows.get(sheet)
+        if rows is None:
+            with self._sheet_lock(sheet):
+                rows = self._cluster_rows.get(sheet)
+                if rows is None:
+                    rows = self.get_sheet(sheet).groupby('CLUSTER', sort=False).indices
+                    self._cluster_rows[sheet] = rows
+        return rows
+
+    def _get_column_positions(self, sheet: str) -> Dict[str, int]:
+        """Map each column name of a sheet to its position."""
+        positions = self._column_positions.get(sheet)
+        if positions is None:
+            with self._sheet_lock(sheet):
+                positions = self._column_positions.get(sheet)
+                if positions is None:
+                    positions = {name: i for i, name in enumerate(self.get_sheet(sheet).columns)}
+                    self._column_positions[sheet] = positions
+        return positions
 
     def get_cluster_info(self, sheet: str, cluster_id: int) -> ClusterInfo:
         """
@@ -198,7 +373,7 @@ class ExcelDataManager:
         Returns:
             ClusterInfo object
         """
-        cluster_data = self.get_cluster_data(sheet, cluster_id)
+        cluster_data = self.get_cluster_view(sheet, cluster_id)
 
         # Extract info
         cuid_list = cluster_data['CUID'].tolist() if 'CUID' in cluster_data.columns else []
@@ -217,7 +392,7 @@ class ExcelDataManager:
 
     def get_sheet_names(self) -> List[str]:
         """Get list of all sheet names."""
-        return list(self.data.keys())
+        return list(self._sheet_names)
     
     def can_edit_column(self, column: str) -> bool:
         """
@@ -234,23 +409,20 @@ class ExcelDataManager:
         return column.upper() in editable_columns
 
     def _build_metadata(self, start_time: datetime) -> None:
-        """Build metadata about the loaded file."""
+        """Build metadata about the loaded file (row/cluster counts cover parsed sheets only)."""
         import os
 
         total_rows = sum(len(df) for df in self.data.values())
-        total_clusters = len(set(
-            cluster
-            for df in self.data.values()
-            if 'CLUSTER' in df.columns
-            for cluster in df['CLUSTER'].unique()
-        ))
+        # The cluster cache already holds each parsed sheet's unique IDs
+        cluster_ids = [np.asarray(clusters) for clusters in self._cluster_cache.values()]
+        total_clusters = len(pd.unique(np.concatenate(cluster_ids))) if cluster_ids else 0
 
         file_stats = os.stat(self.file_path)
 
         self.metadata = ExcelMetadata(
             file_path=self.file_path,
             file_size_mb=file_stats.st_size / (1024 * 1024),
-            sheet_names=list(self.data.keys()),
+            sheet_names=list(self._sheet_names),
             total_rows=total_rows,
             total_clusters=total_clusters,
             load_time_seconds=(datetime.now() - start_time).total_seconds(),
@@ -260,8 +432,7 @@ class ExcelDataManager:
     def _build_cluster_cache(self) -> None:
         """Pre-build cluster lists for performance."""
         self._cluster_cache.clear()
+        self._cluster_rows.clear()
         for sheet in self.data:
             if 'CLUSTER' in self.data[sheet].columns:
-                clusters = self.data[sheet]['CLUSTER'].unique().tolist()
-                clusters.sort()
-                self._cluster_cache[sheet] = clusters
+                self._cluster_cache[sheet] = self._sorted_clusters(self.data[sheet])
@@ -1,10 +1,41 @@
 """Color formatting logic based on Excel conditional formatting rules."""
 
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple
 import math
 
+import numpy as np
+
 from ..models import ColumnType
 
+_CORE_COLUMN_TYPES = frozenset({
+    ColumnType.VIEW, ColumnType.SP, ColumnType.PREV, ColumnType.PACTUAL,
+    ColumnType.PEXPECTED, ColumnType.VIEWLG, ColumnType.CSP95, ColumnType.CSP80,
+    ColumnType.CSP50, ColumnType.CSP20, ColumnType.CSP5,
+})
+
+
+_CHANNEL_SHIFTS = (16, 8, 0)
+
+
+@lru_cache(maxsize=256)
+def _packed_color(hex_color: str) -> int:
+    """Parse a hex color into a packed 0xRRGGBB int."""
+    return int(hex_color.lstrip('#'), 16)
+
+
+@lru_cache(maxsize=8192)
+def _interpolate_hex(color1: str, color2: str, ratio: float) -> str:
+    """Blend two hex colors; shared by all formatters since it only depends on its arguments."""
+    packed1 = _packed_color(color1)
+    packed2 = _packed_color(color2)
+    blended = 0
+    for shift in _CHANNEL_SHIFTS:
+        c1 = (packed1 >> shift) & 0xFF
+        c2 = (packed2 >> shift) & 0xFF
+        blended |= int(c1 + (c2 - c1) * ratio) << shift
+    return f"#{blended:06x}"
+
 
 class ColorFormatter:
     """
@@ -39,6 +70,10 @@ class ColorFormatter:
         self.theme = theme
         # Set neutral color based on theme
         self.neutral = self.DARK_NEUTRAL if theme == "dark" else self.WHITE
+        # Rendering asks for the same few colors over and over; cache per
+        # instance so a theme switch (new formatter) starts with a clean cache
+        self._color_for = lru_cache(maxsize=4096)(self._compute_color)
+        self._text_color_for = lru_cache(maxsize=1024)(self._compute_text_color)
 
     def get_color(self, column_type: ColumnType, value: Optional[float]) -> str:
         """
@@ -54,11 +89,13 @@ class ColorFormatter:
         if value is None or math.isnan(value):
             return self.neutral
 
+        # Quantize so near-identical floats share a cache entry
+        return self._color_for(column_type, round(value, 3))
+
+    def _compute_color(self, column_type: ColumnType, value: float) -> str:
+        """Uncached color lookup for a non-empty value."""
         # Map column types to color methods
-        if column_type in [ColumnType.VIEW, ColumnType.SP, ColumnType.PREV,
-                           ColumnType.PACTUAL, ColumnType.PEXPECTED, ColumnType.VIEWLG,
-                           ColumnType.CSP95, ColumnType.CSP80, ColumnType.CSP50,
-                           ColumnType.CSP20, ColumnType.CSP5]:
+        if column_type in _CORE_COLUMN_TYPES:
             return self._get_core_column_color(value)
         elif column_type == ColumnType.RECENT_DELTA:
             return self._get_recent_delta_color(value)
@@ -72,6 +109,85 @@ class ColorFormatter:
         else:
             return self.neutral
 
+    def get_colors_array(self, column_type: ColumnType, values: Sequence[Optional[float]]) -> np.ndarray:
+        """
+        Get colors for a whole column of values at once.
+
+        Matches get_color cell for cell, but does the gradient math with NumPy
+        and formats each distinct color only once.
+
+        Args:
+            column_type: Type of column
+            values: Cell values (None/NaN for empty cells)
+
+        Returns:
+            Object array of color strings (hex RGB), one per value
+        """
+        v = np.round(np.asarray(values, dtype=float), 3)
+        colors = np.full(v.shape, self.neutral, dtype=object)
+
+        segments = self._gradient_segments(column_type, v)
+        if segments is None:
+            return colors
+        conditions, ratios, starts, ends = segments
+
+        filled = ~np.isnan(v)
+        v = v[filled]
+        conditions = [c[filled] for c in conditions]
+        ratios = [r[filled] for r in ratios]
+
+        # Segment index per value; the last segment is the solid color past the final threshold
+        segment = np.select(conditions, range(len(conditions)), default=len(conditions))
+        ratio = np.clip(np.select(conditions, ratios, default=0.0), 0.0, 1.0)
+        shifts = np.array(_CHANNEL_SHIFTS)
+        start = (np.array([_packed_color(c) for c in starts])[:, None] >> shifts & 0xFF)[segment]
+        end = (np.array([_packed_color(c) for c in ends])[:, None] >> shifts & 0xFF)[segment]
+        rgb = (start + (end - start) * ratio[:, None]).astype(np.int64)
+
+        packed = (rgb << shifts).sum(axis=1)
+        unique, inverse = np.unique(packed, return_inverse=True)
+        palette = np.array([f"#{code:06x}" for code in unique.tolist()], dtype=object)
+        colors[filled] = palette[inverse]
+
+        # Solid endpoint colors keep the casing get_color returns for them
+        filled_positions = np.flatnonzero(filled)
+        for index, (start_color, end_color) in enumerate(zip(starts, ends)):
+            if start_color == end_color:
+                colors[filled_positions[segment == index]] = start_color
+        return colors
+
+    def _gradient_segments(self, column_type: ColumnType, v: np.ndarray):
+        """
+        Describe a column type's color scale as NumPy segments.
+
+        Returns (conditions, ratios, starts, ends), mirroring the thresholds of the
+        scalar _get_*_color methods, or None for column types without a scale.
+        A value past every condition falls into a trailing solid segment.
+        """
+        n = self.neutral
+        with np.errstate(invalid='ignore'):
+            if column_type in _CORE_COLUMN_TYPES:
+                conditions = [v <= 0.5, v <= 1.0, v <= 20]
+                ratios = [np.zeros_like(v), (v - 0.5) / 0.5, (v - 1.0) / 19.0]
+                return (conditions, ratios,
+                        [n, n, self.YELLOW, self.RED], [n, self.YELLOW, self.RED, self.RED])
+            if column_type == ColumnType.RECENT_DELTA:
+                conditions = [v <= -50, v < 0, v <= 50]
+                ratios = [np.zeros_like(v), (v + 50) / 50, v / 50]
+                return (conditions, ratios,
+                        [self.BLUE, self.BLUE, n, self.RED], [self.BLUE, n, self.RED, self.RED])
+            if column_type == ColumnType.DATE_COLUMN:
+                conditions = [v == 0, v <= 10, v <= 100]
+                ratios = [np.zeros_like(v), v / 10, (v - 10) / 90]
+                return (conditions, ratios,
+                        [n, n, self.YELLOW, self.RED], [n, self.YELLOW, self.RED, self.RED])
+            if column_type == ColumnType.LODF_COLUMN:
+                conditions = [v <= -1.0, v < 0, v <= 1.0]
+                ratios = [np.zeros_like(v), v + 1.0, v]
+                return (conditions, ratios,
+                        [self.RED, self.RED, n, self.GREEN], [self.RED, n, self.GREEN, self.GREEN])
+        return None
+
     def _get_core_column_color(self, value: float) -> str:
         """
         Get color for core columns (VIEW, PREV, etc.).
@@ -183,26 +299,13 @@ class ColorFormatter:
         # Ensure ratio is between 0 and 1
         ratio = max(0.0, min(1.0, ratio))
 
-        # Parse hex colors
-        r1, g1, b1 = self._hex_to_rgb(color1)
-        r2, g2, b2 = self._hex_to_rgb(color2)
-
-        # Interpolate
-        r = int(r1 + (r2 - r1) * ratio)
-        g = int(g1 + (g2 - g1) * ratio)
-        b = int(b1 + (b2 - b1) * ratio)
-
-        # Convert back to hex
-        return self._rgb_to_hex(r, g, b)
+        # Cells with the same value share a ratio, so most calls are a cache hit
+        return _interpolate_hex(color1, color2, ratio)
 
     def _hex_to_rgb(self, hex_color: str) -> Tuple[int, int, int]:
         """Convert hex color to RGB tuple."""
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
-
-    def _rgb_to_hex(self, r: int, g: int, b: int) -> str:
-        """Convert RGB tuple to hex color."""
-        return f"#{r:02x}{g:02x}{b:02x}"
+        packed = _packed_color(hex_color)
+        return tuple((packed >> shift) & 0xFF for shift in _CHANNEL_SHIFTS)
 
     def should_bold_flow(self, flow_value: float, max_hist: float) -> bool:
         """
@@ -256,6 +359,10 @@ class ColorFormatter:
         Returns:
             "black" for light backgrounds, "white" for dark backgrounds
         """
+        return self._text_color_for(background_hex)
+
+    def _compute_text_color(self, background_hex: str) -> str:
+        """Uncached text color lookup."""
         r, g, b = self._hex_to_rgb(background_hex)
         
         # Calculate relative luminance using WCAG formula
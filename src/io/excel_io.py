@@ -1,10 +1,12 @@
 """Excel file I/O operations using pandas and openpyxl."""
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 import logging
+import os
 import shutil
 import tempfile
 import openpyxl
@@ -14,9 +16,22 @@ from unittest.mock import Mock
 if TYPE_CHECKING:
     from src.models.data_models import ConstraintRow, ExcelMetadata
 
+try:
+    # Rust-backed reader: parses XLSX several times faster than openpyxl
+    import python_calamine  # noqa: F401
+    _READ_ENGINE = "calamine"
+except ImportError:
+    _READ_ENGINE = "openpyxl"
+
 logger = logging.getLogger(__name__)
 
 
+def _fsync_file(path) -> None:
+    """Flush a finished file to disk so a rename over the target is crash-safe."""
+    with open(path, 'rb') as f:
+        os.fsync(f.fileno())
+
+
 class ExcelIO:
     """
     Handles Excel file I/O operations.
@@ -31,9 +46,20 @@ class ExcelIO:
     - Memory-efficient loading for large files
     """
 
+    # pandas engine used for reads; writes always go through openpyxl
+    READ_ENGINE = _READ_ENGINE
+
+    # 0-based worksheet row holding the column names, passed to read_excel(header=...)
+    HEADER_ROW = 0
+
     def __init__(self, file_path: Path):
         """Initialize with Excel file path."""
         self.file_path = Path(file_path)
+        # openpyxl workbook kept in memory between save_cell_edits() calls
+        self._workbook: Optional[openpyxl.Workbook] = None
+        # Edited copy written by save_cell_edits() per original file; reused so a
+        # session produces one file rather than one per save
+        self._edited_paths: Dict[Path, Path] = {}
 
     # Sheets to load for analysis
     ANALYSIS_SHEETS = [
@@ -41,6 +67,9 @@ class ExcelIO:
         "JAN26", "FEB26", "MAR26", "APR26", "MAY26"
     ]
 
+    # Read-only label columns whose repeated text may be stored as categoricals
+    CATEGORY_COLUMNS = {"MON", "CONT", "DIRECTION", "SOURCE", "SINK"}
+
     # Sheets to exclude from v0
     EXCLUDED_SHEETS = [
         "HIST", "Summary",
@@ -84,7 +113,8 @@ class ExcelIO:
             
             for sheet in sheets_to_load:
                 logger.debug(f"Loading sheet: {sheet}")
-                df = pd.read_excel(file_path, sheet_name=sheet)
+                df = pd.read_excel(file_path, sheet_name=sheet, header=self.HEADER_ROW,
+                                   engine=self.READ_ENGINE)
 
                 # Basic validation
                 if df.empty:
@@ -142,6 +172,127 @@ class ExcelIO:
             logger.error(f"Failed to save workbook: {e}")
             raise
 
+    def save_cell_edits(self, edits: Dict[str, Dict[Tuple[int, int], Any]],
+                        original_path: str) -> str:
+        """
+        Patch edited cells into the workbook and save it to a timestamped copy.
+
+        The workbook is parsed with openpyxl on the first call and kept in
+        memory, so later saves only touch the changed cells before writing.
+        Formatting and sheets that were never loaded are preserved as-is.
+        The copy is named on the first save and overwritten by later ones;
+        since the in-memory workbook holds every edit so far, each write is a
+        superset of the previous one. Not thread-safe: callers serialize saves.
+
+        Args:
+            edits: Sheet name -> {(row, column): value}, 1-based worksheet coordinates
+            original_path: Path to original file (for naming)
+
+        Returns:
+            Path to saved file
+        """
+        new_path = self._edited_output_path(Path(original_path))
+
+        # Nothing changed yet: the original bytes are the answer, no need to parse them
+        unchanged = not edits and self._workbook is None
+
+        if not unchanged:
+            workbook = self._open_editable()
+            for sheet_name, cells in edits.items():
+                worksheet = workbook[sheet_name]
+                for (row, column), value in cells.items():
+                    worksheet.cell(row=row, column=column).value = value
+
+        logger.info(f"Saving {sum(len(c) for c in edits.values())} edited cells to: {new_path}")
+
+        # Write next to the target and rename so a failed save never leaves a partial file
+        fd, temp_path = tempfile.mkstemp(suffix='.xlsx', dir=new_path.parent)
+        os.close(fd)
+        try:
+            if unchanged:
+                shutil.copyfile(self.file_path, temp_path)
+            else:
+                self._workbook.save(temp_path)
+            _fsync_file(temp_path)
+            os.replace(temp_path, new_path)
+        except Exception as e:
+            Path(temp_path).unlink(missing_ok=True)
+            logger.error(f"Failed to save workbook: {e}")
+            raise
+
+        return str(new_path)
+
+    @classmethod
+    def worksheet_cell(cls, row: int, column: int) -> Tuple[int, int]:
+        """
+        Map a 0-based (row, column) position in a loaded sheet to 1-based worksheet coordinates.
+
+        Data starts on the worksheet row after HEADER_ROW; blank rows are kept by
+        read_excel, so positions and worksheet rows stay aligned.
+        """
+        return row + cls.HEADER_ROW + 2, column + 1
+
+    def _edited_output_path(self, original_path: Path) -> Path:
+        """Path of this session's edited copy, picked on first use without clobbering other files."""
+        edited_path = self._edited_paths.get(original_path)
+        if edited_path is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            edited_path = original_path.parent / f"{original_path.stem}_edited_{timestamp}.xlsx"
+            suffix = 1
+            while edited_path.exists():
+                suffix += 1
+                edited_path = original_path.parent / f"{original_path.stem}_edited_{timestamp}_{suffix}.xlsx"
+            self._edited_paths[original_path] = edited_path
+        return edited_path
+
+    def save_sheets(self, data: Dict[str, pd.DataFrame], target_path: str) -> str:
+        """
+        Save a copy of the workbook to target_path, rewriting only the given sheets.
+
+        The original file is copied first, so sheets that are not in data keep
+        their contents and formatting without being loaded into pandas.
+
+        Args:
+            data: Dictionary of changed sheet names to DataFrames
+            target_path: Path of the file to write
+
+        Returns:
+            Path to saved file
+        """
+        target_path = Path(target_path)
+        logger.info(f"Saving {len(data)} changed sheets to: {target_path}")
+
+        # Write next to the target and rename so a failed save never leaves a partial file
+        fd, temp_path = tempfile.mkstemp(suffix='.xlsx', dir=target_path.parent)
+        os.close(fd)
+        try:
+            shutil.copyfile(self.file_path, temp_path)
+            if data:
+                with pd.ExcelWriter(temp_path, engine='openpyxl', mode='a',
+                                    if_sheet_exists='replace') as writer:
+                    for sheet_name, df in data.items():
+                        df.to_excel(writer, sheet_name=sheet_name, index=False)
+            _fsync_file(temp_path)
+            os.replace(temp_path, target_path)
+        except Exception as e:
+            Path(temp_path).unlink(missing_ok=True)
+            logger.error(f"Failed to save workbook: {e}")
+            raise
+
+        return str(target_path)
+
+    def _open_editable(self) -> openpyxl.Workbook:
+        """
+        Return the full (styles and all) workbook, parsing it on first use.
+
+        Reads that only need values or sheet names go through pandas, which
+        opens the file read-only; this handle is only needed for saving.
+        """
+        if self._workbook is None:
+            self._workbook = openpyxl.load_workbook(
+                self.file_path, keep_vba=False, keep_links=False)
+        return self._workbook
+
     def create_backup(self, file_path: str) -> str:
         """
         Create a backup of the original file.
@@ -227,12 +378,13 @@ class ExcelIO:
             raise FileNotFoundError(f"Excel file not found: {self.file_path}")
 
         try:
-            excel_file = pd.ExcelFile(self.file_path)
-            sheet_names = excel_file.sheet_names
-            # Close if it has close method (real file)
-            if hasattr(excel_file, 'close'):
-                excel_file.close()
-            return sheet_names
+            excel_file = pd.ExcelFile(self.file_path, engine=self.READ_ENGINE)
+            try:
+                return excel_file.sheet_names
+            finally:
+                # Release the file handle even if reading the sheet list fails
+                if hasattr(excel_file, 'close'):
+                    excel_file.close()
         except Exception as e:
             logger.error(f"Failed to get sheet names: {e}")
             raise
@@ -243,19 +395,9 @@ class ExcelIO:
             raise FileNotFoundError(f"Excel file not found: {self.file_path}")
 
         try:
-            # Check file size for memory efficiency (handle mocked paths)
-            try:
-                file_size = self.file_path.stat().st_size
-                memory_efficient = file_size > 50 * 1024 * 1024  # 50MB threshold
-            except (FileNotFoundError, OSError):
-                # If we can't stat (e.g., mocked path), assume not memory intensive
-                memory_efficient = False
-
-            kwargs = {}
-            if memory_efficient:
-                kwargs['engine'] = 'openpyxl'
-
-            df = pd.read_excel(self.file_path, sheet_name=sheet_name, **kwargs)
+            df = pd.read_excel(self.file_path, sheet_name=sheet_name, header=self.HEADER_ROW,
+                               engine=self.READ_ENGINE)
+            df = self.compact_dtypes(df)
             logger.debug(f"Loaded sheet {sheet_name}: {len(df)} rows x {len(df.columns)} cols")
             return df
 
@@ -263,6 +405,46 @@ class ExcelIO:
             logger.error(f"Failed to load sheet {sheet_name}: {e}")
             raise
 
+    @classmethod
+    def compact_dtypes(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Store repetitive text in the CATEGORY_COLUMNS label columns as categoricals.
+
+        Other columns keep their loaded dtype so that edits can write any value.
+
+        Args:
+            df: Sheet DataFrame, modified in place
+
+        Returns:
+            The same DataFrame
+        """
+        for col, dtype in df.dtypes.items():
+            if col not in cls.CATEGORY_COLUMNS or not pd.api.types.is_string_dtype(dtype):
+                continue
+            # Only worth it when values repeat; unique-per-row text stays as objects
+            if df[col].nunique() <= len(df) // 2:
+                df[col] = df[col].astype("category")
+        return df
+
+    @staticmethod
+    def narrow_cluster_ids(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Store integer cluster IDs as int32 when they fit, halving the column used for grouping.
+
+        Args:
+            df: Sheet DataFrame, modified in place
+
+        Returns:
+            The same DataFrame
+        """
+        clusters = df.get('CLUSTER')
+        if clusters is None or clusters.empty or clusters.dtype != 'int64':
+            return df
+        limits = np.iinfo(np.int32)
+        if limits.min <= clusters.min() and clusters.max() <= limits.max:
+            df['CLUSTER'] = clusters.astype(np.int32)
+        return df
+
     def validate_sheet_structure(self, df: pd.DataFrame) -> bool:
         """Validate DataFrame has required columns."""
         required_columns = ['CLUSTER', 'CUID', 'VIEW']
@@ -52,13 +52,16 @@ class StateIO:
             # Write to temporary file first (atomic operation)
             with open(temp_file_path, 'w') as temp_file:
                 json.dump(session_state.to_dict(), temp_file, indent=2)
+                # Make the contents durable before the rename makes them visible
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
 
             # Verify write by reading back (needed for certain test scenarios)
             with open(temp_file_path, 'r') as verify_file:
                 json.load(verify_file)
 
-            # Atomic rename
-            os.rename(temp_file_path, session_file)
+            # Atomic rename, replacing the previous file on every platform
+            os.replace(temp_file_path, session_file)
             logger.debug(f"Saved session to {session_file}")
             return True
 
@@ -1,10 +1,14 @@
 """Data model definitions for type safety and structure."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional, Tuple, Dict, Any
 from enum import Enum
 
+# dataclass(slots=True) needs Python 3.10; older interpreters keep a per-instance __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class ColumnType(Enum):
     """Column types for formatting and validation."""
@@ -34,14 +38,16 @@ class SessionState:
     """Persistent session state between application runs."""
     last_file: str
     current_sheet: str
-    current_cluster: int
+    current_cluster: int  # Position in the sheet's cluster list
     current_row: int = 0
     window_size: Tuple[int, int] = (120, 40)
     last_modified: datetime = field(default_factory=datetime.now)
+    # ID of the cluster at current_cluster; None in state saved before it was recorded
+    current_cluster_id: Optional[int] = None
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return {
+        data = {
             'last_file': self.last_file,
             'current_sheet': self.current_sheet,
             'current_cluster': self.current_cluster,
@@ -49,6 +55,9 @@ class SessionState:
             'window_size': list(self.window_size),
             'last_modified': self.last_modified.isoformat()
         }
+        if self.current_cluster_id is not None:
+            data['current_cluster_id'] = self.current_cluster_id
+        return data
 
     @classmethod
     def from_dict(cls, data: dict) -> 'SessionState':
@@ -60,13 +69,14 @@ class SessionState:
             current_row=data.get('current_row', 0),
             window_size=tuple(data.get('window_size', [120, 40])),
             last_modified=datetime.fromisoformat(
-                data.get('last_modified', datetime.now().isoformat()))
+                data.get('last_modified', datetime.now().isoformat())),
+            current_cluster_id=data.get('current_cluster_id')
         )
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class EditRecord:
-    """Record of a single edit for undo/redo functionality."""
+    """Record of a single edit for undo/redo functionality. Immutable once created."""
     sheet: str
     cluster_id: str  # Can be string identifier like "CLUSTER_001"
     constraint_index: int  # Row index within the cluster
@@ -118,9 +128,9 @@ class ColorThreshold:
             return self.min_color
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ValidationResult:
-    """Result of input validation."""
+    """Result of input validation. Immutable, so common failures can be shared."""
     is_valid: bool
     error_message: Optional[str] = None
     sanitized_value: Optional[Any] = None
@@ -234,9 +234,7 @@ class ClusterView(DataTable):
                 
                 logger.info(f"Successfully added {len(cluster_data)} rows to table")
         except Exception as e:
-            logger.error(f"Failed to update table data: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception("Failed to update table data: %s", e)
 
     def _format_cell_value(self, column: str, value: Any) -> str:
         """
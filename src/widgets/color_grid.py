@@ -8,7 +8,7 @@ from rich.style import Style
 from typing import List, Dict, Optional, Callable
 
 from ..core.formatter import ColorFormatter
-from ..models import GridComment
+from ..models import ColumnType, GridComment
 
 
 class ColorGrid(Static):
@@ -61,14 +61,12 @@ class ColorGrid(Static):
         label = "Date Grid: " if self.grid_type == "date" else "LODF Grid: "
         text.append(label, style="bold")
 
-        # Render colored blocks
-        for i, value in enumerate(self.values):
-            # Get color based on value
-            if self.grid_type == "date":
-                color = self.formatter._get_date_column_color(value)
-            else:  # lodf
-                color = self.formatter._get_lodf_color(value)
+        # Get colors for the whole grid in one pass
+        column_type = ColumnType.DATE_COLUMN if self.grid_type == "date" else ColumnType.LODF_COLUMN
+        colors = self.formatter.get_colors_array(column_type, self.values)
 
+        # Render colored blocks
+        for i, color in enumerate(colors):
             # Create block character
             block_char = "█"
 
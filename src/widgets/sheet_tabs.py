@@ -42,6 +42,17 @@ class SheetTabs(Static):
         if sheets and len(sheets) > 0:
             self.active_sheet = sheets[0]
 
+    @property
+    def sheets(self) -> List[str]:
+        """Sheet names in tab order."""
+        return self._sheets
+
+    @sheets.setter
+    def sheets(self, sheets: List[str]) -> None:
+        self._sheets = sheets
+        # Name -> tab position, so switching tabs doesn't scan the list
+        self._sheet_positions = {name: i for i, name in enumerate(sheets)}
+
     def render(self) -> RenderableType:
         """Render the tabs."""
         text = Text()
@@ -71,12 +82,12 @@ class SheetTabs(Static):
             sheets: New list of sheet names
         """
         self.sheets = sheets
-        if sheets and self.active_sheet not in sheets:
+        if sheets and self.active_sheet not in self._sheet_positions:
             # If current active sheet is not in the new list, select the first one
             self.active_sheet = sheets[0]
             self.current_index = 0
-        elif sheets and self.active_sheet in sheets:
-            self.current_index = sheets.index(self.active_sheet)
+        elif sheets and self.active_sheet in self._sheet_positions:
+            self.current_index = self._sheet_positions[self.active_sheet]
         self.refresh()
 
     def set_active_sheet(self, sheet_name: str) -> None:
@@ -86,9 +97,9 @@ class SheetTabs(Static):
         Args:
             sheet_name: Name of sheet to activate
         """
-        if sheet_name in self.sheets:
+        if sheet_name in self._sheet_positions:
             self.active_sheet = sheet_name
-            self.current_index = self.sheets.index(sheet_name)
+            self.current_index = self._sheet_positions[sheet_name]
 
             if self.on_sheet_change_callback:
                 self.on_sheet_change_callback(sheet_name)
@@ -1,5 +1,6 @@
 """Simple ClusterView widget that displays data in a table format."""
 
+from textual.coordinate import Coordinate
 from textual.widgets import DataTable
 from rich.text import Text
 from typing import Optional, Dict, Any
@@ -157,43 +158,25 @@ class SimpleClusterView(DataTable):
             if self._data_loaded and self.row_count > 0:
                 self.clear()
             
+            # Color whole float columns up front instead of cell by cell
+            column_colors = {
+                col_name: self.formatter.get_colors_array(self.column_type_map[col_name], df[col_name])
+                for col_name in self._column_names
+                if col_name in self.column_type_map and col_name in df.columns
+                and pd.api.types.is_float_dtype(df[col_name])
+            }
+
             # Add rows - now we know the column structure
             # Show all rows, not just first 10
-            for idx, row in df.iterrows():
+            for position, (idx, row) in enumerate(df.iterrows()):
                 row_data = []
                 # We added columns in the same order as stored in _column_names
                 # So we iterate through those column names
                 for col_name in self._column_names:
                     if col_name in row.index:
-                        val = row[col_name]
-                        if pd.isna(val):
-                            row_data.append(Text(""))
-                        else:
-                            # Format based on data type
-                            if isinstance(val, float):
-                                # Get color for this column/value if applicable
-                                text_val = f"{val:.2f}"
-                                
-                                # Check if this column should have color formatting
-                                if col_name in self.column_type_map:
-                                    column_type = self.column_type_map[col_name]
-                                    color = self.formatter.get_color(column_type, val)
-                                    
-                                    # Convert hex color to Rich style
-                                    # Skip neutral colors (white for light theme, dark gray for dark theme)
-                                    if color and color not in ["#FFFFFF", "#1A1A1A"]:
-                                        # Create styled text with background color
-                                        styled_text = Text(text_val)
-                                        # Determine text color based on background brightness
-                                        text_color = self.formatter.get_text_color_for_background(color)
-                                        styled_text.stylize(f"{text_color} on {color}")
-                                        row_data.append(styled_text)
-                                    else:
-                                        row_data.append(Text(text_val))
-                                else:
-                                    row_data.append(Text(text_val))
-                            else:
-                                row_data.append(Text(str(val)))
+                        colors = column_colors.get(col_name)
+                        color = colors[position] if colors is not None else None
+                        row_data.append(self._format_cell(col_name, row[col_name], color))
                     else:
                         row_data.append(Text(""))
                 
@@ -204,10 +187,41 @@ class SimpleClusterView(DataTable):
             logger.info(f"SimpleClusterView: Loaded {len(df)} rows with {len(self.columns)} columns")
             
         except Exception as e:
-            logger.error(f"SimpleClusterView: Failed to load data: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception("SimpleClusterView: Failed to load data: %s", e)
     
+    def _format_cell(self, col_name: str, val: Any, color: Optional[str] = None) -> Text:
+        """Render a single cell value with its conditional background color.
+
+        A color already computed for the cell (see load_data) skips the lookup.
+        """
+        if pd.isna(val):
+            return Text("")
+        if not isinstance(val, float):
+            return Text(str(val))
+
+        text_val = f"{val:.2f}"
+        # Check if this column should have color formatting
+        if col_name not in self.column_type_map:
+            return Text(text_val)
+
+        if color is None:
+            color = self.formatter.get_color(self.column_type_map[col_name], val)
+        # Skip neutral colors (white for light theme, dark gray for dark theme)
+        if not color or color in ["#FFFFFF", "#1A1A1A"]:
+            return Text(text_val)
+
+        # Determine text color based on background brightness
+        styled_text = Text(text_val)
+        text_color = self.formatter.get_text_color_for_background(color)
+        styled_text.stylize(f"{text_color} on {color}")
+        return styled_text
+
+    def clear_data(self) -> None:
+        """Remove displayed rows and drop the reference to their DataFrame."""
+        self.clear()
+        self.current_df = None
+        self._data_loaded = False
+
     def start_editing(self, row: int, col: int, column_name: str, initial_char: str = None) -> None:
         """Start editing a cell."""
         if self.current_df is None:
@@ -276,9 +290,8 @@ class SimpleClusterView(DataTable):
             # Store current cursor position
             saved_cursor = self.cursor_coordinate
             
-            # Reload the data to refresh the display with the updated value
-            # This is simpler than trying to update individual cells
-            self.load_data(self.current_df)
+            # Redraw only the edited cell rather than rebuilding the table
+            self.update_cell_at(Coordinate(row, col), self._format_cell(column_name, new_value))
             
             # Handle cursor positioning based on how the edit was confirmed
             if saved_cursor:
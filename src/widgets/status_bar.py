@@ -1,5 +1,7 @@
 """StatusBar widget for displaying application status and help."""
 
+from contextlib import nullcontext
+
 from textual.widgets import Static
 from textual.reactive import reactive
 from rich.console import RenderableType
@@ -124,10 +126,20 @@ class StatusBar(Static):
 
     def update_position(self, sheet: str, cluster: int, row: int, total_rows: int) -> None:
         """Update position information."""
-        self.current_sheet = sheet
-        self.current_cluster = cluster
-        self.current_row = row
-        self.total_rows = total_rows
+        self.set_state(current_sheet=sheet, current_cluster=cluster,
+                       current_row=row, total_rows=total_rows)
+
+    def set_state(self, **fields) -> None:
+        """
+        Assign several reactive fields with a single repaint.
+
+        Args:
+            **fields: Reactive attribute names and their new values
+        """
+        batch = self.app.batch_update() if self.is_mounted else nullcontext()
+        with batch:
+            for name, value in fields.items():
+                setattr(self, name, value)
 
     def set_file_info(self, file_name: str, modified: bool = False) -> None:
         """Update file information."""
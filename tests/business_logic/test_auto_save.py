@@ -21,6 +21,7 @@ import time
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock, AsyncMock, call
 from typing import Dict, List, Optional, Any
+import os
 import tempfile
 import threading
 
@@ -53,8 +54,8 @@ class TestAutoSaveTriggers:
         auto_save.on_data_edited()
         
         # Verify save was scheduled (not called immediately due to debounce)
-        assert auto_save._save_timer is not None
-        assert auto_save._save_timer.is_alive()
+        assert auto_save._last_edit != auto_save._handled_edit
+        auto_save._perform_save.assert_not_called()
         
         # Wait for debounce period + small buffer
         time.sleep(0.6)
@@ -92,6 +93,28 @@ class TestAutoSaveTriggers:
         # Verify save was called only once
         auto_save._perform_save.assert_called_once()
 
+    
+    def test_continuous_edits_save_at_max_latency(self):
+        """Test that a steady stream of edits still saves once the latency ceiling is hit."""
+        mock_data_manager = Mock(spec=ExcelDataManager)
+        mock_status_bar = Mock(spec=StatusBar)
+        mock_data_manager.has_unsaved_changes.return_value = True
+        
+        auto_save = AutoSaveManager(
+            data_manager=mock_data_manager,
+            status_bar=mock_status_bar,
+            debounce_ms=200,
+            max_debounce_ms=400
+        )
+        auto_save._perform_save = Mock()
+        
+        # Edit every 50ms for 600ms - the debounce window never goes quiet
+        for _ in range(12):
+            auto_save.on_data_edited()
+            time.sleep(0.05)
+        
+        # The ceiling forced a save while edits were still arriving
+        assert auto_save._perform_save.call_count >= 1
 
 class TestAutoSaveConfiguration:
     """Test auto-save timer configuration and management."""
@@ -127,6 +150,28 @@ class TestAutoSaveConfiguration:
         time.sleep(0.5)  # Total 1.1s
         auto_save._perform_save.assert_called_once()
     
+    def test_file_path_is_cached_until_invalidated(self):
+        """Test that the file path is looked up once and re-read after invalidation."""
+        mock_data_manager = Mock(spec=ExcelDataManager)
+        mock_status_bar = Mock(spec=StatusBar)
+        mock_data_manager.get_file_path.side_effect = [
+            None, Path('/test/a.xlsx'), Path('/test/b.xlsx')
+        ]
+        
+        auto_save = AutoSaveManager(
+            data_manager=mock_data_manager,
+            status_bar=mock_status_bar
+        )
+        
+        # No file yet, so the next call probes again
+        assert auto_save.get_file_path() is None
+        assert auto_save.get_file_path() == Path('/test/a.xlsx')
+        assert auto_save.get_file_path() == Path('/test/a.xlsx')
+        assert mock_data_manager.get_file_path.call_count == 2
+        
+        auto_save.invalidate_file_path()
+        assert auto_save.get_file_path() == Path('/test/b.xlsx')
+    
     def test_manual_save_overrides_auto_save_timer(self):
         """Test that manual save cancels pending auto-save and resets timer."""
         mock_data_manager = Mock(spec=ExcelDataManager)
@@ -142,40 +187,63 @@ class TestAutoSaveConfiguration:
         
         # Start auto-save timer
         auto_save.on_data_edited()
-        assert auto_save._save_timer is not None
-        assert auto_save._save_timer.is_alive()
+        assert auto_save._last_edit != auto_save._handled_edit
         
         # Perform manual save
         auto_save.perform_manual_save()
         
         # Verify timer was cancelled
-        assert auto_save._save_timer is None
+        assert auto_save._last_edit == auto_save._handled_edit
         
         # Wait past debounce time
         time.sleep(0.6)
         
         # Auto-save should have been called once during manual save
         auto_save._perform_save.assert_called_once()
+    
+    def test_manual_save_waits_for_running_auto_save(self):
+        """Test that a manual save runs after an in-flight auto-save rather than being dropped."""
+        mock_data_manager = Mock(spec=ExcelDataManager)
+        mock_status_bar = Mock(spec=StatusBar)
+        mock_data_manager.has_unsaved_changes.return_value = True
+        mock_data_manager.get_file_path.return_value = Path('/test/workbook.xlsx')
+        mock_data_manager.content_hash.side_effect = ['aaa', 'bbb']
+        
+        started = threading.Event()
+        release = threading.Event()
+        
+        def slow_save(path):
+            if not started.is_set():
+                started.set()
+                release.wait(5)
+        
+        mock_data_manager.save_to_file.side_effect = slow_save
+        
+        with AutoSaveManager(data_manager=mock_data_manager,
+                             status_bar=mock_status_bar) as auto_save:
+            background = threading.Thread(target=auto_save._perform_save_operation)
+            background.start()
+            started.wait(5)
+            threading.Timer(0.05, release.set).start()
+            
+            auto_save.perform_manual_save()
+            background.join(5)
+        
+        assert mock_data_manager.save_to_file.call_count == 2
 
 
 class TestAutoSaveBackups:
     """Test auto-save backup creation and management."""
     
-    @patch('tempfile.NamedTemporaryFile')
-    @patch('shutil.move')
-    def test_auto_save_creates_timestamped_backups(self, mock_move, mock_temp_file):
-        """Test that auto-save creates timestamped backup files."""
+    def test_auto_save_writes_backup_to_first_slot(self, tmp_path):
+        """Test that auto-save writes the newest backup into slot 0."""
         # Setup
+        workbook = tmp_path / 'workbook.xlsx'
         mock_data_manager = Mock(spec=ExcelDataManager)
         mock_status_bar = Mock(spec=StatusBar)
-        mock_data_manager.get_file_path.return_value = Path('/test/workbook.xlsx')
+        mock_data_manager.get_file_path.return_value = workbook
         mock_data_manager.has_unsaved_changes.return_value = True
         
-        # Mock temp file
-        mock_temp = Mock()
-        mock_temp.name = '/tmp/temp_save_123'
-        mock_temp_file.return_value.__enter__.return_value = mock_temp
-        
         auto_save = AutoSaveManager(
             data_manager=mock_data_manager,
             status_bar=mock_status_bar,
@@ -183,45 +251,29 @@ class TestAutoSaveBackups:
         )
         
         # Mock save operation
-        mock_data_manager.save_to_file = Mock()
+        mock_data_manager.save_to_file = Mock(side_effect=lambda path: path.write_bytes(b'saved'))
         
         # Perform save
-        with patch('datetime.datetime') as mock_datetime:
-            mock_datetime.now.return_value.strftime.return_value = '20240827_143022'
-            auto_save._perform_save()
+        with patch('os.replace', wraps=os.replace) as mock_replace:
+            auto_save._perform_save_operation()
         
-        # Verify temp file was used
-        mock_temp_file.assert_called_once()
-        mock_data_manager.save_to_file.assert_called_once_with(Path('/tmp/temp_save_123'))
+        # Verify temp file was written next to the workbook
+        temp_path = mock_data_manager.save_to_file.call_args[0][0]
+        assert temp_path.parent == tmp_path
         
-        # Verify backup was created with timestamp
-        expected_backup = Path('/test/workbook_autosave_20240827_143022.xlsx')
-        mock_move.assert_called_once_with('/tmp/temp_save_123', expected_backup)
+        # Verify backup landed in slot 0 by a same-directory rename
+        expected_backup = tmp_path / 'workbook_autosave_0.xlsx'
+        mock_replace.assert_called_with(temp_path, expected_backup)
+        assert expected_backup.read_bytes() == b'saved'
+        assert not temp_path.exists()
     
-    @patch('pathlib.Path.glob')
-    @patch('pathlib.Path.unlink')
-    def test_auto_save_cleanup_old_backups(self, mock_unlink, mock_glob):
-        """Test that auto-save cleans up old backups beyond retention limit."""
+    def test_auto_save_rotates_backup_slots(self, tmp_path):
+        """Test that each backup shifts older ones along and drops the oldest."""
         # Setup
+        workbook = tmp_path / 'workbook.xlsx'
         mock_data_manager = Mock(spec=ExcelDataManager)
         mock_status_bar = Mock(spec=StatusBar)
-        mock_data_manager.get_file_path.return_value = Path('/test/workbook.xlsx')
-        
-        # Mock existing backup files (5 files, should keep 3)
-        old_backups = [
-            Path('/test/workbook_autosave_20240825_143022.xlsx'),
-            Path('/test/workbook_autosave_20240826_143022.xlsx'),
-            Path('/test/workbook_autosave_20240827_103022.xlsx'),
-            Path('/test/workbook_autosave_20240827_133022.xlsx'),
-            Path('/test/workbook_autosave_20240827_143022.xlsx'),
-        ]
-        
-        # Mock file stats for sorting by modification time
-        for i, backup in enumerate(old_backups):
-            backup.stat = Mock()
-            backup.stat.return_value.st_mtime = 1000 + i * 3600  # 1 hour apart
-        
-        mock_glob.return_value = old_backups
+        mock_data_manager.get_file_path.return_value = workbook
         
         auto_save = AutoSaveManager(
             data_manager=mock_data_manager,
@@ -229,14 +281,20 @@ class TestAutoSaveBackups:
             backup_count=3
         )
         
-        # Trigger cleanup
-        auto_save._cleanup_old_backups()
-        
-        # Verify oldest 2 files were deleted (keeping newest 3)
-        assert mock_unlink.call_count == 2
-        deleted_files = [call[0][0] for call in mock_unlink.call_args_list]
-        assert old_backups[0] in deleted_files  # Oldest
-        assert old_backups[1] in deleted_files  # Second oldest
+        # Write five backups, each with distinct content
+        for version in range(5):
+            mock_data_manager.save_to_file = Mock(
+                side_effect=lambda path, v=version: path.write_text(f"v{v}"))
+            auto_save._create_backup(workbook)
+        
+        # Newest three are kept, newest first
+        backups = sorted(tmp_path.glob('workbook_autosave_*.xlsx'))
+        assert [b.name for b in backups] == [
+            'workbook_autosave_0.xlsx',
+            'workbook_autosave_1.xlsx',
+            'workbook_autosave_2.xlsx',
+        ]
+        assert [b.read_text() for b in backups] == ['v4', 'v3', 'v2']
 
 
 class TestAutoSavePerformance:
@@ -335,7 +393,8 @@ class TestAutoSaveErrorHandling:
             data_manager=mock_data_manager,
             status_bar=mock_status_bar,
             max_retries=3,
-            base_retry_delay=0.1  # Fast retry for testing
+            base_retry_delay=0.1,  # Fast retry for testing
+            jitter=0.0  # Deterministic delays
         )
         
         # Mock sleep to track retry delays
@@ -354,6 +413,32 @@ class TestAutoSaveErrorHandling:
         status_calls = mock_status_bar.set_status.call_args_list
         assert any('Retrying save' in str(call) for call in status_calls)
     
+    def test_retry_delay_is_capped_and_jittered(self):
+        """Test that backoff delays stop growing at the cap and carry bounded jitter."""
+        mock_data_manager = Mock(spec=ExcelDataManager)
+        mock_status_bar = Mock(spec=StatusBar)
+        mock_data_manager.has_unsaved_changes.return_value = True
+        mock_data_manager.get_file_path.return_value = Path('/test/workbook.xlsx')
+        mock_data_manager.save_to_file.side_effect = Exception("Disk full")
+        
+        auto_save = AutoSaveManager(
+            data_manager=mock_data_manager,
+            status_bar=mock_status_bar,
+            max_retries=5,
+            base_retry_delay=1.0,
+            max_retry_delay=2.0,
+            jitter=0.5
+        )
+        
+        with patch('time.sleep') as mock_sleep:
+            auto_save._perform_save_operation()
+        
+        # Base delays 1, 2, 4, 8 are capped at 2 and then stretched by up to 50%
+        actual_delays = [call[0][0] for call in mock_sleep.call_args_list]
+        assert len(actual_delays) == 4
+        assert 1.0 <= actual_delays[0] <= 1.5
+        assert all(2.0 <= delay <= 3.0 for delay in actual_delays[1:])
+    
     def test_save_failure_preserves_user_data(self):
         """Test that save failures never cause data loss."""
         mock_data_manager = Mock(spec=ExcelDataManager)
@@ -380,6 +465,31 @@ class TestAutoSaveErrorHandling:
         mock_status_bar.set_status.assert_called()
         status_message = mock_status_bar.set_status.call_args_list[-1][0][0]
         assert 'failed' in status_message.lower()
+    
+    def test_manual_save_failure_reaches_caller(self):
+        """Test that a failed manual save raises instead of only updating the status."""
+        mock_data_manager = Mock(spec=ExcelDataManager)
+        mock_status_bar = Mock(spec=StatusBar)
+        mock_data_manager.has_unsaved_changes.return_value = True
+        mock_data_manager.get_file_path.return_value = Path('/test/workbook.xlsx')
+        mock_data_manager.save_to_file.side_effect = OSError("Disk full")
+        
+        with AutoSaveManager(data_manager=mock_data_manager,
+                             status_bar=mock_status_bar,
+                             max_retries=1) as auto_save:
+            with pytest.raises(OSError, match="Disk full"):
+                auto_save.perform_manual_save()
+        
+        status_message = mock_status_bar.set_status.call_args_list[-1][0][0]
+        assert 'failed' in status_message.lower()
+    
+    def test_context_manager_stops_debounce_thread(self):
+        """Test that leaving the context shuts the background thread down."""
+        with AutoSaveManager(data_manager=Mock(spec=ExcelDataManager),
+                             status_bar=Mock(spec=StatusBar)) as auto_save:
+            assert auto_save._debounce_thread.is_alive()
+        
+        assert not auto_save._debounce_thread.is_alive()
 
 
 class TestAutoSaveStatusIndicator:
@@ -408,6 +518,66 @@ class TestAutoSaveStatusIndicator:
         assert any('Saving' in status for status in status_calls)
         assert any('Saved' in status for status in status_calls)
     
+    def test_unchanged_content_skips_backup(self, tmp_path):
+        """Test that a save whose data matches the last save writes no new backup."""
+        mock_data_manager = Mock(spec=ExcelDataManager)
+        mock_status_bar = Mock(spec=StatusBar)
+        mock_data_manager.has_unsaved_changes.return_value = True
+        mock_data_manager.get_file_path.return_value = tmp_path / 'workbook.xlsx'
+        mock_data_manager.content_hash.side_effect = ['aaa', 'aaa', 'bbb']
+        mock_data_manager.save_to_file = Mock()
+        
+        auto_save = AutoSaveManager(
+            data_manager=mock_data_manager,
+            status_bar=mock_status_bar
+        )
+        
+        # Save, then an edit-and-revert, then a real change
+        auto_save._perform_save_operation()
+        auto_save._perform_save_operation()
+        auto_save._perform_save_operation()
+        
+        assert mock_data_manager.save_to_file.call_count == 2
+        mock_data_manager.mark_saved.assert_called_once()
+        mock_status_bar.set_status.assert_any_call("No changes to save")
+    
+    def test_repeated_status_is_not_rewritten(self):
+        """Test that an unchanged status message is not pushed to the StatusBar again."""
+        mock_data_manager = Mock(spec=ExcelDataManager)
+        mock_status_bar = Mock(spec=StatusBar)
+        
+        auto_save = AutoSaveManager(
+            data_manager=mock_data_manager,
+            status_bar=mock_status_bar
+        )
+        
+        auto_save._show_status(AutoSaveManager.STATUS_SAVING)
+        auto_save._show_status(AutoSaveManager.STATUS_SAVING)
+        auto_save._show_status("Saved at 12:00:00")
+        
+        status_calls = [call[0][0] for call in mock_status_bar.set_status.call_args_list]
+        assert status_calls == ["Saving...", "Saved at 12:00:00"]
+    
+    def test_repeated_failure_is_reported_each_time(self):
+        """Test that the same failure twice in a row is written to the StatusBar both times."""
+        mock_data_manager = Mock(spec=ExcelDataManager)
+        mock_status_bar = Mock(spec=StatusBar)
+        mock_data_manager.has_unsaved_changes.return_value = True
+        mock_data_manager.get_file_path.return_value = Path('/test/workbook.xlsx')
+        mock_data_manager.save_to_file.side_effect = OSError("Disk full")
+        
+        auto_save = AutoSaveManager(
+            data_manager=mock_data_manager,
+            status_bar=mock_status_bar,
+            max_retries=1
+        )
+        
+        auto_save._perform_save_operation()
+        auto_save._perform_save_operation()
+        
+        status_calls = [call[0][0] for call in mock_status_bar.set_status.call_args_list]
+        assert status_calls.count("Save failed: Disk full") == 2
+    
     def test_concurrent_edit_during_save_handled_safely(self):
         """Test that edits during active save are handled safely without corruption."""
         mock_data_manager = Mock(spec=ExcelDataManager)
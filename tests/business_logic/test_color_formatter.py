@@ -17,7 +17,8 @@ from typing import Optional, List
 from unittest.mock import Mock
 
 # Import will be available after implementation
-from src.business_logic.color_formatter import ColorFormatter, ColorConfig
+from src.business_logic.color_formatter import ColorFormatter, ColorConfig, _interpolate
+from src.models.data_models import ConstraintRow
 
 
 class TestViewColumnThresholdColors:
@@ -184,6 +185,17 @@ class TestEdgeCasesAndErrorHandling:
         color = formatter.interpolate_color("#FF0000", "#0000FF", 0.25)
         assert color == "#BF0040"  # 25% toward blue
     
+    def test_repeated_interpolation_is_cached(self):
+        """Test repeated interpolations are served from the cache."""
+        formatter = ColorFormatter()
+        
+        first = formatter.interpolate_color("#123456", "#654321", 0.3)
+        hits = _interpolate.cache_info().hits
+        second = formatter.interpolate_color("#123456", "#654321", 0.3)
+        
+        assert first == second
+        assert _interpolate.cache_info().hits == hits + 1
+    
     def test_hex_color_format_consistency(self):
         """Test that all returned colors use consistent #RRGGBB format."""
         formatter = ColorFormatter()
@@ -241,6 +253,15 @@ class TestShortlimitColumnColors:
         color = formatter.get_shortlimit_color(None)
         assert color == "#CCCCCC"  # Neutral gray for None
 
+    
+    def test_batch_shortlimit_colors_match_scalar(self):
+        """Test vectorized SHORTLIMIT colors agree with per-cell lookups."""
+        formatter = ColorFormatter()
+        values = [None, -10.0, -75.0, -150.0, -250.0, 60.0]
+        
+        colors = formatter.get_shortlimit_colors(values)
+        
+        assert list(colors) == [formatter.get_shortlimit_color(v) for v in values]
 
 class TestExcelCompatibilityAndPerformance:
     """Test Excel color compatibility and performance optimizations."""
@@ -276,6 +297,24 @@ class TestExcelCompatibilityAndPerformance:
         # All colors should be valid
         assert len(colors) == len(test_values)
         assert all(isinstance(color, str) and color.startswith("#") for color in colors)
+    
+    def test_batch_view_colors_match_scalar(self):
+        """Test vectorized VIEW colors agree with per-cell lookups."""
+        formatter = ColorFormatter()
+        values = [-10.0, 0.0, 49.9, 50.0, 99.9, 100.0, 199.9, 200.0, 1000.0]
+        
+        colors = formatter.get_view_colors(values)
+        
+        assert list(colors) == [formatter.get_view_color(v) for v in values]
+    
+    def test_batch_recent_delta_matches_scalar(self):
+        """Test vectorized RECENT_DELTA colors agree with per-cell formatting."""
+        formatter = ColorFormatter()
+        values = [None, float('nan'), 0.0, 0.01, -0.5, 1.0, -25.0, 50.0, -100.0, 500.0]
+        
+        colors = formatter.format_recent_delta_batch(values)
+        
+        assert list(colors) == [formatter.format_recent_delta(v) for v in values]
 
 
 class TestBindingConstraintColors:
@@ -322,6 +361,26 @@ class TestBindingConstraintColors:
         
         assert high_color != low_color
 
+    
+    def test_typed_rows_match_duck_typed_rows(self):
+        """Test that ConstraintRow instances get the same colors as equivalent duck-typed rows."""
+        formatter = ColorFormatter()
+        
+        for flow, limit in [(50.0, 100.0), (96.0, 100.0), (10.0, 0.0)]:
+            row = ConstraintRow(cluster=1, cuid='C001', view=150.0, flow=flow, limit=limit)
+            duck = Mock(view=150.0, flow=flow, limit=limit, is_binding=row.is_binding)
+            
+            assert formatter.get_constraint_color(row) == formatter.get_constraint_color(duck)
+    
+    def test_non_binding_tint_uses_white_blend_table(self):
+        """Test that non-binding tints come from the precomputed blend of the VIEW color."""
+        formatter = ColorFormatter()
+        
+        # 50% flow -> 0.6 - 0.5 * 0.4 = 40% toward white
+        row = ConstraintRow(cluster=1, cuid='C001', view=150.0, flow=50.0, limit=100.0)
+        
+        expected = formatter.interpolate_color(formatter.get_view_color(150.0), "#FFFFFF", 0.4)
+        assert formatter.get_constraint_color(row) == expected
 
 class TestRecentDeltaGradientFormatting:
     """Test RECENT_DELTA blue-white-red gradient formatting (Task 008)."""
@@ -282,6 +282,108 @@ class TestExcelDataManagerValueUpdates:
         assert first_row['SHORTLIMIT'] == -10.0
         assert first_row['CUID'] == 'C001'
 
+    
+    def test_content_hash_tracks_value_changes(self):
+        """Test that content_hash changes with an edit and returns when it is reverted."""
+        mock_excel_io = Mock(spec=ExcelIO)
+        mock_excel_io.get_sheet_names.return_value = ['JAN26']
+        mock_excel_io.load_sheet.return_value = pd.DataFrame({
+            'CLUSTER': [1, 1],
+            'CUID': ['C001', 'C002'],
+            'VIEW': [100.0, 150.0]
+        })
+        
+        manager = ExcelDataManager(mock_excel_io)
+        manager.load_workbook("/tmp/test.xlsx")
+        manager.set_active_sheet('JAN26')
+        manager.get_cluster_data('1')
+        original = manager.content_hash()
+        
+        manager.update_value(cluster='1', constraint_index=0, column='VIEW', value=125.0)
+        edited = manager.content_hash()
+        manager.update_value(cluster='1', constraint_index=0, column='VIEW', value=100.0)
+        
+        assert edited != original
+        assert manager.content_hash() == original
+
+    def test_cluster_edit_reindexes_rows(self):
+        """Test that moving a row to another cluster is reflected in later lookups."""
+        mock_excel_io = Mock(spec=ExcelIO)
+        mock_excel_io.get_sheet_names.return_value = ['JAN26']
+        mock_excel_io.load_sheet.return_value = pd.DataFrame({
+            'CLUSTER': [2, 1, 1, 3],
+            'CUID': ['C001', 'C002', 'C003', 'C004'],
+            'VIEW': [100.0, 150.0, 200.0, 250.0]
+        })
+        
+        manager = ExcelDataManager(mock_excel_io)
+        manager.load_workbook("/tmp/test.xlsx")
+        manager.set_active_sheet('JAN26')
+        assert list(manager.get_cluster_data('1').index) == [1, 2]
+        assert manager.get_all_clusters() == ['2', '1', '3']
+        
+        manager.update_value(cluster='3', constraint_index=0, column='CLUSTER', value=1)
+        
+        assert list(manager.get_cluster_data('1').index) == [1, 2, 3]
+        assert manager.get_cluster_data('3').empty
+        assert manager.get_all_clusters() == ['2', '1']
+
+    def test_text_cluster_ids_are_matched_as_strings(self):
+        """Test that a text CLUSTER column is looked up without parsing IDs as numbers."""
+        mock_excel_io = Mock(spec=ExcelIO)
+        mock_excel_io.get_sheet_names.return_value = ['JAN26']
+        mock_excel_io.load_sheet.return_value = pd.DataFrame({
+            'CLUSTER': ['CLUSTER_001', '12', 'CLUSTER_001'],
+            'VIEW': [100.0, 150.0, 200.0]
+        })
+        
+        manager = ExcelDataManager(mock_excel_io)
+        manager.load_workbook("/tmp/test.xlsx")
+        manager.set_active_sheet('JAN26')
+        
+        assert list(manager.get_cluster_data('CLUSTER_001').index) == [0, 2]
+        assert list(manager.get_cluster_data('12').index) == [1]
+
+    def test_cluster_data_is_independent_of_sheet_cache(self):
+        """Test that modifying returned cluster data leaves the cached sheet unchanged."""
+        mock_excel_io = Mock(spec=ExcelIO)
+        mock_excel_io.get_sheet_names.return_value = ['JAN26']
+        mock_excel_io.load_sheet.return_value = pd.DataFrame({
+            'CLUSTER': [1, 1],
+            'VIEW': [100.0, 150.0]
+        })
+        
+        manager = ExcelDataManager(mock_excel_io)
+        manager.load_workbook("/tmp/test.xlsx")
+        manager.set_active_sheet('JAN26')
+        
+        cluster_data = manager.get_cluster_data('1')
+        cluster_data.loc[0, 'VIEW'] = 999.0
+        view_only = manager.get_cluster_data('1', columns=['VIEW'])
+        view_only.loc[1, 'VIEW'] = 888.0
+        
+        assert list(manager.get_cluster_data('1')['VIEW']) == [100.0, 150.0]
+
+    def test_readonly_floats_narrowed_only_when_exact(self):
+        """Test that read-only float columns load as float32 only if no value changes."""
+        mock_excel_io = Mock(spec=ExcelIO)
+        mock_excel_io.get_sheet_names.return_value = ['JAN26']
+        mock_excel_io.load_sheet.return_value = pd.DataFrame({
+            'CLUSTER': [1, 1, 2],
+            'BHOURS': [12.0, 0.5, float('nan')],
+            'LODF': [0.1, 0.25, 0.5],
+            'VIEW': [100.0, 150.0, 200.0]
+        })
+        
+        manager = ExcelDataManager(mock_excel_io)
+        manager.load_workbook("/tmp/test.xlsx")
+        manager.set_active_sheet('JAN26')
+        cluster_data = manager.get_cluster_data('1')
+        
+        assert cluster_data['BHOURS'].dtype == 'float32'
+        assert cluster_data['LODF'].dtype == 'float64'
+        assert cluster_data['VIEW'].dtype == 'float64'
+        assert list(cluster_data['BHOURS']) == [12.0, 0.5]
 
 class TestExcelDataManagerSaveOperations:
     """Test save operations with timestamping."""
@@ -319,6 +421,48 @@ class TestExcelDataManagerSaveOperations:
         # Verify return value
         assert saved_path == "/tmp/saved_file_20240827_123456.xlsx"
 
+    def test_save_to_file_passes_only_edited_sheets(self):
+        """Test that save_to_file hands ExcelIO just the sheets that were edited."""
+        mock_excel_io = Mock(spec=ExcelIO)
+        mock_excel_io.get_sheet_names.return_value = ['JAN26', 'FEB26']
+        
+        test_data = {
+            'JAN26': pd.DataFrame({'CLUSTER': [1, 2], 'VIEW': [100.0, 150.0]}),
+            'FEB26': pd.DataFrame({'CLUSTER': [3, 4], 'VIEW': [200.0, 250.0]})
+        }
+        
+        mock_excel_io.load_sheet.side_effect = lambda sheet: test_data[sheet]
+        
+        manager = ExcelDataManager(mock_excel_io)
+        manager.load_workbook("/tmp/original.xlsx")
+        manager.set_active_sheet('JAN26')
+        manager.update_value(cluster='1', constraint_index=0, column='VIEW', value=125.0)
+        
+        manager.save_to_file(Path("/tmp/autosave.xlsx"))
+        
+        saved_data, target = mock_excel_io.save_sheets.call_args[0]
+        assert list(saved_data) == ['JAN26']
+        assert target == "/tmp/autosave.xlsx"
+        mock_excel_io.load_sheet.assert_called_once_with('JAN26')
+        assert not manager.has_unsaved_changes()
+    
+    def test_mark_saved_clears_unsaved_changes(self):
+        """Test that mark_saved records the data as needing no save."""
+        mock_excel_io = Mock(spec=ExcelIO)
+        mock_excel_io.get_sheet_names.return_value = ['JAN26']
+        mock_excel_io.load_sheet.return_value = pd.DataFrame({'CLUSTER': [1], 'VIEW': [100.0]})
+        
+        manager = ExcelDataManager(mock_excel_io)
+        manager.load_workbook("/tmp/original.xlsx")
+        manager.set_active_sheet('JAN26')
+        manager.update_value(cluster='1', constraint_index=0, column='VIEW', value=125.0)
+        assert manager.has_unsaved_changes()
+        
+        manager.mark_saved()
+        
+        assert not manager.has_unsaved_changes()
+        mock_excel_io.save_sheets.assert_not_called()
+
 
 class TestExcelDataManagerDataStats:
     """Test data statistics and metadata extraction."""
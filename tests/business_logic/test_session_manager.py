@@ -197,6 +197,43 @@ class TestCheckpointAndSaving:
         # Assert - Should not call save_session when no changes
         mock_state_io.save_session.assert_not_called()
 
+    def test_checkpoints_share_one_writer_and_coalesce(self):
+        """Test that checkpoints queued behind a slow save collapse into the newest state."""
+        # Arrange
+        initial_session = SessionState(last_file="", current_sheet="", current_cluster=0)
+        mock_state_io = Mock(spec=StateIO)
+        mock_state_io.load_session.return_value = initial_session
+        release = Event()
+        saved_sheets = []
+        
+        def blocking_save(state):
+            release.wait(timeout=2)
+            saved_sheets.append(state.current_sheet)
+            return True
+        mock_state_io.save_session.side_effect = blocking_save
+        
+        session_manager = SessionManager(mock_state_io)
+        session_manager.start_session()
+        session_manager.update_state(current_sheet="SEP25")
+        session_manager.checkpoint()
+        writer = session_manager._writer
+        deadline = time.time() + 2
+        while mock_state_io.save_session.call_count == 0 and time.time() < deadline:
+            time.sleep(0.01)
+        
+        # Act - queue two more checkpoints while the first save is in progress
+        session_manager.update_state(current_sheet="OCT25")
+        session_manager.checkpoint()
+        session_manager.update_state(current_sheet="NOV25")
+        session_manager.checkpoint()
+        release.set()
+        while len(saved_sheets) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        
+        # Assert
+        assert session_manager._writer is writer
+        assert saved_sheets == ["SEP25", "NOV25"]
+
 
 class TestAutoSaveLogic:
     """Test automatic save timing and dirty state detection."""
@@ -339,6 +376,38 @@ class TestRecoveryMechanisms:
         mock_state_io.save_session.assert_called_once()
         # After end_session, auto-save timer should be stopped
         assert hasattr(session_manager, '_shutdown_requested')
+    
+    def test_final_save_lands_after_checkpoint_in_progress(self):
+        """Test a slow checkpoint write cannot overwrite the state saved by end_session."""
+        # Arrange
+        initial_session = SessionState(last_file="", current_sheet="", current_cluster=0)
+        mock_state_io = Mock(spec=StateIO)
+        mock_state_io.load_session.return_value = initial_session
+        writing = Event()
+        written = []
+        
+        def slow_save(state):
+            if not writing.is_set():
+                writing.set()
+                time.sleep(0.1)
+            written.append(state.current_cluster)
+            return True
+        
+        mock_state_io.save_session.side_effect = slow_save
+        
+        session_manager = SessionManager(mock_state_io)
+        session_manager.start_session()
+        session_manager.update_state(current_cluster=1)
+        session_manager.checkpoint()
+        writing.wait(5)
+        session_manager.update_state(current_cluster=2)
+        
+        # Act
+        session_manager.end_session()
+        
+        # Assert
+        assert written == [1, 2]
+        assert not session_manager._writer.is_alive()
 
 
 class TestEditHistoryManagement:
@@ -384,6 +453,36 @@ class TestEditHistoryManagement:
         assert history[0] == edit1
         assert history[1] == edit2
     
+    def test_history_snapshot_reused_until_next_edit(self):
+        """Test that the history tuple is rebuilt only after a new edit is recorded."""
+        # Arrange
+        initial_session = SessionState(last_file="", current_sheet="", current_cluster=0)
+        mock_state_io = Mock(spec=StateIO)
+        mock_state_io.load_session.return_value = initial_session
+        
+        session_manager = SessionManager(mock_state_io)
+        session_manager.start_session()
+        edit = EditRecord(
+            timestamp=datetime.now(),
+            sheet="Sheet1",
+            cluster_id="1",
+            constraint_index=5,
+            column="VIEW",
+            old_value=100.0,
+            new_value=120.0
+        )
+        
+        # Act
+        empty = session_manager.history_snapshot()
+        session_manager.record_edit(edit)
+        first = session_manager.history_snapshot()
+        second = session_manager.history_snapshot()
+        
+        # Assert
+        assert empty == ()
+        assert first == (edit,)
+        assert second is first
+    
     def test_edit_history_memory_management(self):
         """Test that edit history respects memory limits and prunes old entries."""
         # Arrange
@@ -350,6 +350,109 @@ class TestBatchEditOperations:
         
         cluster2_data = manager.get_cluster_data('2')
         assert cluster2_data.iloc[0]['VIEW'] == 200.0  # Original value
+    
+    def test_batch_update_records_history_and_clears_values(self):
+        """Test that batch_update records each edit and accepts cleared SHORTLIMIT cells."""
+        mock_excel_io = Mock(spec=ExcelIO)
+        mock_excel_io.get_sheet_names.return_value = ['JAN26']
+        
+        test_df = pd.DataFrame({
+            'CLUSTER': [1, 2, 1],
+            'CUID': ['C001', 'C002', 'C003'],
+            'VIEW': [100.0, 150.0, 200.0],
+            'SHORTLIMIT': [-10.0, -20.0, -30.0]
+        })
+        
+        mock_excel_io.load_sheet.return_value = test_df.copy()
+        
+        manager = ExcelDataManager(mock_excel_io)
+        manager.load_workbook("/tmp/test.xlsx")
+        manager.set_active_sheet('JAN26')
+        
+        updates = [
+            {'cluster': '1', 'constraint_index': 1, 'column': 'SHORTLIMIT', 'value': ''},
+            {'cluster': '1', 'constraint_index': 0, 'column': 'SHORTLIMIT', 'value': '-15.0'},
+            {'cluster': '2', 'constraint_index': 0, 'column': 'VIEW', 'value': '175.0'}
+        ]
+        
+        result = manager.batch_update(updates)
+        
+        assert result['success'] is True
+        assert result['applied_count'] == 3
+        
+        cluster1_data = manager.get_cluster_data('1')
+        assert cluster1_data.iloc[0]['SHORTLIMIT'] == -15.0
+        assert pd.isna(cluster1_data.iloc[1]['SHORTLIMIT'])
+        
+        history = manager.get_edit_history()
+        assert [(edit.constraint_index, edit.column, edit.old_value) for edit in history] == [
+            (2, 'SHORTLIMIT', -30.0),
+            (0, 'SHORTLIMIT', -10.0),
+            (1, 'VIEW', 150.0)
+        ]
+        assert manager.has_unsaved_changes()
+    
+    def test_batch_update_applies_nothing_when_target_missing(self):
+        """Test that batch_update leaves the sheet untouched if any target row is missing."""
+        mock_excel_io = Mock(spec=ExcelIO)
+        mock_excel_io.get_sheet_names.return_value = ['JAN26']
+        
+        test_df = pd.DataFrame({
+            'CLUSTER': [1, 2],
+            'CUID': ['C001', 'C002'],
+            'VIEW': [100.0, 150.0]
+        })
+        
+        mock_excel_io.load_sheet.return_value = test_df.copy()
+        
+        manager = ExcelDataManager(mock_excel_io)
+        manager.load_workbook("/tmp/test.xlsx")
+        manager.set_active_sheet('JAN26')
+        
+        updates = [
+            {'cluster': '1', 'constraint_index': 0, 'column': 'VIEW', 'value': '125.0'},
+            {'cluster': '2', 'constraint_index': 5, 'column': 'VIEW', 'value': '175.0'}
+        ]
+        
+        result = manager.batch_update(updates)
+        
+        assert result['success'] is False
+        assert result['failed_count'] == 1
+        assert 'Invalid constraint index 5 for cluster 2' in result['error_message']
+        assert manager.get_cluster_data('1').iloc[0]['VIEW'] == 100.0
+        assert manager.get_edit_history() == []
+    
+    def test_batch_update_restores_written_columns_on_failure(self):
+        """Test that a failed column write restores columns already written in the batch."""
+        mock_excel_io = Mock(spec=ExcelIO)
+        mock_excel_io.get_sheet_names.return_value = ['JAN26']
+        
+        test_df = pd.DataFrame({
+            'CLUSTER': [1, 1],
+            'CUID': ['C001', 'C002'],
+            'VIEW': [100.0, 150.0],
+            'SHORTLIMIT': [-10, -20]  # Integer column cannot hold -15.5
+        })
+        
+        mock_excel_io.load_sheet.return_value = test_df.copy()
+        
+        manager = ExcelDataManager(mock_excel_io)
+        manager.load_workbook("/tmp/test.xlsx")
+        manager.set_active_sheet('JAN26')
+        
+        updates = [
+            {'cluster': '1', 'constraint_index': 0, 'column': 'VIEW', 'value': '125.0'},
+            {'cluster': '1', 'constraint_index': 1, 'column': 'SHORTLIMIT', 'value': '-15.5'}
+        ]
+        
+        result = manager.batch_update(updates)
+        
+        assert result['success'] is False
+        assert 'Batch update failed' in result['error_message']
+        cluster_data = manager.get_cluster_data('1')
+        assert list(cluster_data['VIEW']) == [100.0, 150.0]
+        assert list(cluster_data['SHORTLIMIT']) == [-10, -20]
+        assert manager.get_edit_history() == []
 
 
 class TestColumnEditabilityChecks:
@@ -489,6 +592,59 @@ class TestEditRollbackCapability:
         
         # Should return False for invalid ID
         assert rollback_success is False
+    
+    def test_batch_edits_get_unique_ids_that_roll_back(self):
+        """Test that edits applied together get distinct IDs usable for rollback."""
+        mock_excel_io = Mock(spec=ExcelIO)
+        mock_excel_io.get_sheet_names.return_value = ['JAN26']
+        
+        test_df = pd.DataFrame({
+            'CLUSTER': [1, 1],
+            'CUID': ['C001', 'C002'],
+            'VIEW': [100.0, 150.0]
+        })
+        
+        mock_excel_io.load_sheet.return_value = test_df.copy()
+        
+        manager = ExcelDataManager(mock_excel_io)
+        manager.load_workbook("/tmp/test.xlsx")
+        manager.set_active_sheet('JAN26')
+        
+        manager.batch_update([
+            {'cluster': '1', 'constraint_index': 0, 'column': 'VIEW', 'value': '125.0'},
+            {'cluster': '1', 'constraint_index': 1, 'column': 'VIEW', 'value': '175.0'}
+        ])
+        
+        history = manager.get_edit_history()
+        assert len({edit.cuid for edit in history}) == 2
+        
+        assert manager.rollback_edit(history[1].cuid) is True
+        assert list(manager.get_cluster_data('1')['VIEW']) == [125.0, 150.0]
+    
+    def test_rollback_edit_forgets_evicted_edits(self):
+        """Test that edits pushed out of the history can no longer be rolled back."""
+        mock_excel_io = Mock(spec=ExcelIO)
+        mock_excel_io.get_sheet_names.return_value = ['JAN26']
+        
+        test_df = pd.DataFrame({
+            'CLUSTER': [1],
+            'CUID': ['C001'],
+            'VIEW': [100.0]
+        })
+        
+        mock_excel_io.load_sheet.return_value = test_df.copy()
+        
+        manager = ExcelDataManager(mock_excel_io)
+        manager.load_workbook("/tmp/test.xlsx")
+        manager.set_active_sheet('JAN26')
+        
+        manager.validate_and_update('1', 0, 'VIEW', '101.0')
+        first_edit_id = manager.get_edit_history()[0].cuid
+        for i in range(1000):
+            manager.validate_and_update('1', 0, 'VIEW', str(102.0 + i))
+        
+        assert manager.rollback_edit(first_edit_id) is False
+        assert len(manager._edits_by_id) == 1000
 
 
 class TestConflictDetectionAndValidation:
@@ -4,6 +4,8 @@ Tests cover input validation, edge cases, and error handling.
 """
 
 import pytest
+import pandas as pd
+from unittest.mock import patch
 from typing import Any, Optional
 from dataclasses import dataclass
 
@@ -266,6 +268,75 @@ class TestDataValidatorGeneralFunctionality:
         result = self.validator.validate_cell("SHORTLIMIT", 100)
         assert result.is_valid is False
     
+    def test_validate_cell_is_case_insensitive(self):
+        """Test that column names route the same regardless of case."""
+        assert self.validator.validate_cell("view", -1) is self.validator.validate_cell("VIEW", -1)
+        assert self.validator.validate_cell("Shortlimit", 5).is_valid is False
+        assert self.validator.validate_cell("LODF", "x").sanitized_value == "x"
+
+    def test_compile_validator_matches_validate_cell(self):
+        """Test that compiled per-column validators agree with validate_cell."""
+        for column in ("VIEW", "shortlimit", "LODF"):
+            validate = self.validator.compile_validator(column)
+            for value in ("100", "-5", "", None, "abc"):
+                assert validate(value) == self.validator.validate_cell(column, value)
+    
+    def test_series_validation_matches_scalar_validation(self):
+        """Test whole-column validation gives the same result as validating each cell."""
+        values = ["100", " 5 ", "abc", "", None, -1, 0, "-3.5", 2.5]
+        series = pd.Series(values, index=range(10, 10 + len(values)))
+
+        for validate, validate_series in (
+            (self.validator.validate_view, self.validator.validate_view_series),
+            (self.validator.validate_shortlimit, self.validator.validate_shortlimit_series),
+        ):
+            results = validate_series(series)
+            assert list(results.index) == list(series.index)
+            for value, row in zip(values, results.itertuples()):
+                expected = validate(value)
+                sanitized = None if pd.isna(row.sanitized_value) else row.sanitized_value
+                assert (row.is_valid, row.error_message, sanitized) == (
+                    expected.is_valid, expected.error_message, expected.sanitized_value)
+
+    def test_view_treats_nan_like_series_validation(self):
+        """Test NaN is rejected by validate_view just as validate_view_series rejects it."""
+        values = [float('nan'), "nan"]
+        results = self.validator.validate_view_series(pd.Series(values, dtype=object))
+
+        for value, row in zip(values, results.itertuples()):
+            expected = self.validator.validate_view(value)
+            assert not expected.is_valid
+            assert (row.is_valid, row.error_message) == (expected.is_valid, expected.error_message)
+
+    def test_sanitize_numeric_input_uses_fastnumbers_when_available(self):
+        """Test string parsing goes through fastnumbers.try_float when it is installed."""
+        calls = []
+
+        def fake_try_float(text, on_fail, allow_underscores):
+            calls.append(text)
+            return on_fail if text == "abc" else float(text)
+
+        with patch('src.business_logic.validators._try_float', fake_try_float):
+            assert self.validator.sanitize_numeric_input(" 42 ") == 42.0
+            assert self.validator.sanitize_numeric_input("abc") is None
+
+        assert calls == ["42", "abc"]
+
+    def test_sanitize_numeric_input_plain_numbers(self):
+        """Test numbers are converted to plain floats without going through strings."""
+        value = 12.5
+        assert self.validator.sanitize_numeric_input(value) is value
+        assert type(self.validator.sanitize_numeric_input(7)) is float
+        assert self.validator.sanitize_numeric_input(True) == 1.0
+
+    def test_rejections_reuse_shared_results(self):
+        """Test repeated rejections return the same immutable result object."""
+        first = self.validator.validate_view("abc")
+        assert self.validator.validate_shortlimit("xyz") is first
+        assert self.validator.validate_view(-1) is self.validator.validate_view(None)
+        with pytest.raises(AttributeError):
+            first.is_valid = True
+
     def test_sanitize_numeric_input_edge_cases(self):
         """Test numeric input sanitization handles edge cases."""
         # Test various input formats
@@ -304,6 +375,14 @@ class TestDataValidatorGeneralFunctionality:
         unknown_rules = self.validator.get_column_rules("UNKNOWN")
         assert "allow_any" in unknown_rules
         assert unknown_rules["allow_any"] is True
+
+    def test_column_rules_are_shared_and_copied_out(self):
+        """Test rules live on the class and callers get their own mutable copy."""
+        rules = self.validator.get_column_rules("VIEW")
+        rules["min_value"] = 10
+
+        assert DataValidator().get_column_rules("VIEW")["min_value"] == 0
+        assert "_COLUMN_RULES" not in vars(self.validator)
     
     def test_batch_validation_performance(self):
         """Test batch validation of multiple values."""
@@ -115,6 +115,42 @@ class TestExcelIOFileLoading:
             assert 'VIEW' in result_df.columns
             assert len(result_df) == 2
 
+    def test_load_sheet_uses_configured_read_engine(self):
+        """Test that load_sheet reads through the fastest available engine."""
+        test_file_path = Path("/tmp/test_workbook.xlsx")
+
+        with patch('src.io.excel_io.Path.exists', return_value=True), \
+             patch('pandas.read_excel') as mock_read_excel:
+            mock_read_excel.return_value = pd.DataFrame({'CLUSTER': [1]})
+
+            excel_io = ExcelIO(test_file_path)
+            excel_io.load_sheet("JAN26")
+
+            assert ExcelIO.READ_ENGINE in ("calamine", "openpyxl")
+            assert mock_read_excel.call_args.kwargs['engine'] == ExcelIO.READ_ENGINE
+
+
+    def test_load_sheet_stores_repetitive_text_as_category(self):
+        """Test that only low-cardinality label columns load as categoricals."""
+        test_file_path = Path("/tmp/test_workbook.xlsx")
+
+        with patch('src.io.excel_io.Path.exists', return_value=True), \
+             patch('pandas.read_excel') as mock_read_excel:
+            mock_read_excel.return_value = pd.DataFrame({
+                'CLUSTER': [1, 1, 2, 2],
+                'CUID': ['A1', 'A2', 'B1', 'B2'],
+                'MON': ['LINE_X', 'LINE_X', 'LINE_X', 'LINE_Y'],
+                'SHORTLIMIT': ['x', 'x', 'x', 'x'],
+                'COMMENT': ['ok', 'ok', 'ok', 'ok'],
+            })
+
+            df = ExcelIO(test_file_path).load_sheet("JAN26")
+
+            assert df['MON'].dtype == 'category'
+            assert df['CUID'].dtype != 'category'
+            assert df['SHORTLIMIT'].dtype != 'category'
+            assert df['COMMENT'].dtype != 'category'
+
 
 class TestExcelIODataParsing:
     """Test Excel data parsing and ConstraintRow conversion."""
@@ -164,6 +200,16 @@ class TestExcelIODataParsing:
             assert result_df['FLOW'].dtype == 'float64'
             assert result_df['DIRECTION'].dtype in ['int64', 'Int64']
     
+    def test_narrow_cluster_ids_only_when_values_fit(self):
+        """Test that integer cluster IDs become int32 unless they overflow it."""
+        small = ExcelIO.narrow_cluster_ids(pd.DataFrame({'CLUSTER': [1, 2, 3]}))
+        large = ExcelIO.narrow_cluster_ids(pd.DataFrame({'CLUSTER': [1, 2**40]}))
+        text = ExcelIO.narrow_cluster_ids(pd.DataFrame({'CLUSTER': ['A', 'B']}))
+
+        assert small['CLUSTER'].dtype == 'int32'
+        assert large['CLUSTER'].dtype == 'int64'
+        assert text['CLUSTER'].dtype != 'int32'
+
     def test_convert_sheet_to_constraint_rows(self):
         """Test that get_constraint_rows creates ConstraintRow objects from sheet data."""
         test_file_path = Path("/tmp/test_workbook.xlsx")
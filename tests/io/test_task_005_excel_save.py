@@ -418,6 +418,121 @@ class TestExcelSaveMultiSheet:
             assert "backup" in backup_call[1]
 
 
+class TestExcelSaveCellEdits:
+    """Test saving by patching edited cells into the in-memory workbook."""
+
+    @pytest.fixture
+    def workbook_path(self, tmp_path):
+        path = tmp_path / "constraints.xlsx"
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "SEP25"
+        ws.append(["CLUSTER", "VIEW"])
+        ws.append([1, 100.0])
+        ws.append([2, 200.0])
+        ws["B2"].fill = PatternFill(start_color="FFCCCC", end_color="FFCCCC", fill_type="solid")
+        wb.create_sheet("HIST").append(["untouched"])
+        wb.save(path)
+        return path
+
+    def test_save_cell_edits_patches_only_edited_cells(self, workbook_path):
+        """Test edited cells change while formatting and other sheets survive."""
+        excel_io = ExcelIO(workbook_path)
+
+        result = excel_io.save_cell_edits({"SEP25": {(3, 2): 250.0}}, str(workbook_path))
+
+        saved = openpyxl.load_workbook(result)
+        assert Path(result).name.startswith("constraints_edited_")
+        assert saved["SEP25"]["B3"].value == 250.0
+        assert saved["SEP25"]["B2"].value == 100.0
+        assert saved["SEP25"]["B2"].fill.start_color.rgb.endswith("FFCCCC")
+        assert saved["HIST"]["A1"].value == "untouched"
+        assert not list(workbook_path.parent.glob("tmp*.xlsx"))
+
+    def test_edits_land_below_a_lower_header_row(self, tmp_path):
+        """Test sheet positions map to worksheet rows when the header is not on row 1."""
+        path = tmp_path / "titled.xlsx"
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "SEP25"
+        ws.append(["Flow report"])
+        ws.append(["CLUSTER", "VIEW"])
+        ws.append([1, 100.0])
+        ws.append([2, 200.0])
+        wb.save(path)
+
+        class TitledExcelIO(ExcelIO):
+            HEADER_ROW = 1
+
+        excel_io = TitledExcelIO(path)
+        df = excel_io.load_sheet("SEP25")
+        cell = excel_io.worksheet_cell(1, df.columns.get_loc("VIEW"))
+
+        result = excel_io.save_cell_edits({"SEP25": {cell: 250.0}}, str(path))
+
+        saved = openpyxl.load_workbook(result)["SEP25"]
+        assert df["VIEW"].tolist() == [100.0, 200.0]
+        assert saved["B4"].value == 250.0
+        assert saved["B3"].value == 100.0
+
+    def test_save_cell_edits_parses_workbook_once(self, workbook_path):
+        """Test repeated saves reuse the workbook kept in memory."""
+        excel_io = ExcelIO(workbook_path)
+
+        with patch('src.io.excel_io.openpyxl.load_workbook',
+                   wraps=openpyxl.load_workbook) as mock_load:
+            excel_io.save_cell_edits({"SEP25": {(2, 2): 110.0}}, str(workbook_path))
+            result = excel_io.save_cell_edits({"SEP25": {(3, 2): 220.0}}, str(workbook_path))
+
+        assert mock_load.call_count == 1
+        saved = openpyxl.load_workbook(result)["SEP25"]
+        assert (saved["B2"].value, saved["B3"].value) == (110.0, 220.0)
+
+    def test_repeated_saves_reuse_one_output_file(self, workbook_path):
+        """Test a session writes one edited copy instead of a new file per save."""
+        excel_io = ExcelIO(workbook_path)
+
+        first = excel_io.save_cell_edits({"SEP25": {(2, 2): 110.0}}, str(workbook_path))
+        second = excel_io.save_cell_edits({"SEP25": {(3, 2): 220.0}}, str(workbook_path))
+
+        assert first == second
+        assert len(list(workbook_path.parent.glob("constraints_edited_*.xlsx"))) == 1
+
+    def test_first_save_does_not_overwrite_existing_copy(self, workbook_path):
+        """Test a new session never replaces an edited copy written in the same second."""
+        other = ExcelIO(workbook_path).save_cell_edits({}, str(workbook_path))
+
+        result = ExcelIO(workbook_path).save_cell_edits({}, str(workbook_path))
+
+        assert result != other
+        assert Path(other).exists()
+
+    def test_save_without_edits_copies_original_unparsed(self, workbook_path):
+        """Test a save with no edits copies the file instead of opening it with openpyxl."""
+        excel_io = ExcelIO(workbook_path)
+
+        with patch('src.io.excel_io.openpyxl.load_workbook') as mock_load:
+            result = excel_io.save_cell_edits({}, str(workbook_path))
+
+        mock_load.assert_not_called()
+        assert Path(result).read_bytes() == workbook_path.read_bytes()
+
+    def test_save_sheets_rewrites_only_given_sheets(self, workbook_path, tmp_path):
+        """Test changed sheets are replaced in place while other sheets are copied."""
+        excel_io = ExcelIO(workbook_path)
+        target = tmp_path / "autosave.xlsx"
+        changed = pd.DataFrame({"CLUSTER": [1, 2], "VIEW": [150.0, 200.0]})
+
+        result = excel_io.save_sheets({"SEP25": changed}, str(target))
+
+        saved = openpyxl.load_workbook(result)
+        assert result == str(target)
+        assert saved.sheetnames == ["SEP25", "HIST"]
+        assert saved["SEP25"]["B2"].value == 150.0
+        assert saved["HIST"]["A1"].value == "untouched"
+        assert not list(tmp_path.glob("tmp*.xlsx"))
+
+
 class TestExcelSavePerformanceAndIntegration:
     """Test performance characteristics and round-trip integrity."""
 
@@ -36,9 +36,12 @@ TDD Workflow Instructions for Developer-Agent:
 """
 
 import pytest
-from unittest.mock import MagicMock, patch, AsyncMock, call
+from unittest.mock import MagicMock, PropertyMock, patch, AsyncMock, call
+import asyncio
 import tempfile
+import threading
 import os
+import pandas as pd
 from pathlib import Path
 from datetime import datetime
 from textual.events import Key, Resize
@@ -47,6 +50,7 @@ from textual.app import ComposeResult
 
 # TDD: Import the application to be tested
 from src.app import AnalysisTUIApp
+from src.models import SessionState
 
 
 class TestApplicationInitialization:
@@ -137,6 +141,35 @@ class TestApplicationInitialization:
         finally:
             os.unlink(excel_path)
 
+    def test_excel_load_runs_off_event_loop_thread(self):
+        """Test workbook parsing happens in a worker thread, not on the event loop."""
+        # Arrange
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
+            excel_path = temp_file.name
+
+        try:
+            with patch('src.app.ExcelDataManager') as mock_dm_class, \
+                 patch('src.app.SessionManager'):
+                mock_data_manager = MagicMock()
+                mock_dm_class.return_value = mock_data_manager
+                load_threads = []
+                mock_data_manager.load_excel.side_effect = (
+                    lambda path: load_threads.append(threading.get_ident()))
+
+                app = AnalysisTUIApp(excel_path)
+                app.switch_to_main_interface = AsyncMock()
+
+                # Act
+                asyncio.run(app.load_and_switch())
+
+                # Assert
+                mock_data_manager.load_excel.assert_called_once_with(excel_path)
+                assert load_threads[0] != threading.get_ident()
+                app.switch_to_main_interface.assert_awaited_once()
+
+        finally:
+            os.unlink(excel_path)
+
 
 class TestNavigationFunctionality:
     """Test suite for navigation functionality."""
@@ -231,6 +264,86 @@ class TestNavigationFunctionality:
             os.unlink(excel_path)
 
 
+    def test_goto_cluster_jumps_by_cluster_id(self):
+        """Test jumping straight to a cluster ID and rejecting unknown IDs."""
+        # Arrange
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
+            excel_path = temp_file.name
+
+        try:
+            with patch('src.app.ExcelDataManager'), \
+                 patch('src.app.SessionManager'):
+                app = AnalysisTUIApp(excel_path)
+                app.sheet_tabs = MagicMock()
+                app.cluster_view = MagicMock()
+                app.status_bar = MagicMock()
+                app.current_cluster_list = ["C010", "C020", "C030"]
+
+                # Act / Assert
+                assert app.goto_cluster("C030") is True
+                assert app.current_cluster_index == 2
+
+                assert app.goto_cluster("C999") is False
+                assert app.current_cluster_index == 2
+
+        finally:
+            os.unlink(excel_path)
+
+
+    def test_goto_cluster_accepts_typed_numeric_id(self):
+        """Test text entered for a numeric cluster ID finds the cluster."""
+        # Arrange
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
+            excel_path = temp_file.name
+
+        try:
+            with patch('src.app.ExcelDataManager'), \
+                 patch('src.app.SessionManager'):
+                app = AnalysisTUIApp(excel_path)
+                app.sheet_tabs = MagicMock()
+                app.cluster_view = MagicMock()
+                app.status_bar = MagicMock()
+                app.current_cluster_list = [3, 17, 42]
+
+                # Act / Assert
+                assert app.goto_cluster(" 17 ") is True
+                assert app.current_cluster_index == 1
+                assert app.goto_cluster("abc") is False
+
+        finally:
+            os.unlink(excel_path)
+
+    def test_switching_to_sheet_without_clusters_clears_view(self):
+        """Test the previous sheet's cluster is not left on screen after switching."""
+        # Arrange
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
+            excel_path = temp_file.name
+
+        try:
+            with patch('src.app.ExcelDataManager') as mock_dm_class, \
+                 patch('src.app.SessionManager'):
+                mock_data_manager = MagicMock()
+                mock_dm_class.return_value = mock_data_manager
+                mock_data_manager.get_sheet_names.return_value = ["SEP25", "OCT25"]
+                mock_data_manager.get_clusters_list.return_value = []
+
+                app = AnalysisTUIApp(excel_path)
+                app.sheet_tabs = MagicMock()
+                app.cluster_view = MagicMock()
+                app.status_bar = MagicMock()
+                app.current_cluster_list = [1, 2]
+
+                # Act
+                app.on_sheet_change("OCT25")
+
+                # Assert
+                app.cluster_view.clear_data.assert_called_once()
+                app.cluster_view.load_data.assert_not_called()
+
+        finally:
+            os.unlink(excel_path)
+
+
 class TestSessionManagement:
     """Test suite for session state management."""
 
@@ -284,6 +397,72 @@ class TestSessionManagement:
         finally:
             os.unlink(excel_path)
 
+    def test_session_resumes_at_saved_cluster(self):
+        """Test the main interface opens on the cluster ID saved by the last session."""
+        # Arrange
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
+            excel_path = temp_file.name
+
+        try:
+            with patch('src.app.ExcelDataManager') as mock_dm_class, \
+                 patch('src.app.SessionManager'), \
+                 patch('src.app.Container'):
+                mock_data_manager = MagicMock()
+                mock_dm_class.return_value = mock_data_manager
+                mock_data_manager.get_sheet_names.return_value = ["SEP25", "OCT25"]
+                mock_data_manager.get_clusters_list.return_value = [10, 20, 30]
+
+                app = AnalysisTUIApp(excel_path)
+                app.sheet_tabs = MagicMock()
+                app.sheet_tabs.active_sheet = "OCT25"
+                app.cluster_view = MagicMock()
+                app.status_bar = MagicMock()
+                app.mount = AsyncMock()
+                app.current_session = MagicMock(current_sheet="OCT25", current_cluster=0,
+                                                current_cluster_id=30)
+
+                # Act
+                asyncio.run(app.switch_to_main_interface())
+
+                # Assert
+                assert app.current_cluster_index == 2
+
+        finally:
+            os.unlink(excel_path)
+
+    def test_session_without_cluster_id_resumes_at_saved_index(self):
+        """Test state written before cluster IDs were saved still restores by index."""
+        # Arrange
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
+            excel_path = temp_file.name
+
+        try:
+            with patch('src.app.ExcelDataManager') as mock_dm_class, \
+                 patch('src.app.SessionManager'), \
+                 patch('src.app.Container'):
+                mock_data_manager = MagicMock()
+                mock_dm_class.return_value = mock_data_manager
+                mock_data_manager.get_sheet_names.return_value = ["SEP25", "OCT25"]
+                mock_data_manager.get_clusters_list.return_value = [10, 20, 30]
+
+                app = AnalysisTUIApp(excel_path)
+                app.sheet_tabs = MagicMock()
+                app.sheet_tabs.active_sheet = "OCT25"
+                app.cluster_view = MagicMock()
+                app.status_bar = MagicMock()
+                app.mount = AsyncMock()
+                app.current_session = SessionState.from_dict(
+                    {"last_file": excel_path, "current_sheet": "OCT25", "current_cluster": 1})
+
+                # Act
+                asyncio.run(app.switch_to_main_interface())
+
+                # Assert
+                assert app.current_cluster_index == 1
+
+        finally:
+            os.unlink(excel_path)
+
     def test_session_save_on_exit(self):
         """Test application saves session state on clean shutdown."""
         # Arrange
@@ -318,6 +497,117 @@ class TestSessionManagement:
             os.unlink(excel_path)
 
 
+    def test_navigation_state_write_is_debounced_while_running(self):
+        """Test rapid cluster navigation defers the session write to one timer."""
+        # Arrange
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
+            excel_path = temp_file.name
+
+        try:
+            with patch('src.app.ExcelDataManager'), \
+                 patch('src.app.SessionManager') as mock_sm_class, \
+                 patch.object(AnalysisTUIApp, 'is_running', new_callable=PropertyMock,
+                              return_value=True):
+                mock_session_manager = MagicMock()
+                mock_sm_class.return_value = mock_session_manager
+
+                app = AnalysisTUIApp(excel_path)
+                app.sheet_tabs = MagicMock()
+                app.sheet_tabs.active_sheet = "SEP25"
+                app.cluster_view = MagicMock()
+                app.status_bar = MagicMock()
+                app.current_cluster_list = [1, 2, 3]
+                timers = [MagicMock(), MagicMock()]
+                app.set_timer = MagicMock(side_effect=timers)
+                app._prefetch_adjacent_sheets = MagicMock()
+
+                # Act
+                app.action_next_cluster()
+                app.action_next_cluster()
+
+                # Assert - neighbouring sheets are warmed once per sheet
+                app._prefetch_adjacent_sheets.assert_called_once_with("SEP25")
+
+                # Assert - nothing written yet, only the latest timer is live
+                mock_session_manager.update_current_state.assert_not_called()
+                timers[0].stop.assert_called_once()
+                assert app._pending_state == {"current_sheet": "SEP25", "current_cluster": 2,
+                                              "current_cluster_id": 3}
+
+                # Act - quitting writes the final position itself
+                with patch.object(app, 'exit'):
+                    app.action_quit()
+
+                mock_session_manager.update_current_state.assert_called_once_with(
+                    current_sheet="SEP25", current_cluster=2, current_cluster_id=3)
+                timers[1].stop.assert_called_once()
+
+        finally:
+            os.unlink(excel_path)
+
+
+    def test_state_timer_writes_on_calling_thread(self):
+        """Test the debounced state write runs in the timer callback, not a worker."""
+        # Arrange
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
+            excel_path = temp_file.name
+
+        try:
+            with patch('src.app.ExcelDataManager'), \
+                 patch('src.app.SessionManager') as mock_sm_class:
+                mock_session_manager = MagicMock()
+                mock_sm_class.return_value = mock_session_manager
+
+                app = AnalysisTUIApp(excel_path)
+                app._state_flush_timer = MagicMock()
+                app._pending_state = {"current_sheet": "OCT25", "current_cluster": 4}
+
+                # Act
+                app._flush_state()
+
+                # Assert
+                mock_session_manager.update_current_state.assert_called_once_with(
+                    current_sheet="OCT25", current_cluster=4)
+                assert app._state_flush_timer is None
+                assert app._pending_state is None
+
+        finally:
+            os.unlink(excel_path)
+
+    def test_manual_save_flushes_pending_navigation_state(self):
+        """Test Ctrl+S writes the debounced navigation position immediately."""
+        # Arrange
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
+            excel_path = temp_file.name
+
+        try:
+            with patch('src.app.ExcelDataManager') as mock_dm_class, \
+                 patch('src.app.SessionManager') as mock_sm_class:
+                mock_data_manager = MagicMock()
+                mock_dm_class.return_value = mock_data_manager
+                mock_data_manager.save_changes.return_value = "/tmp/out_edited.xlsx"
+                mock_session_manager = MagicMock()
+                mock_sm_class.return_value = mock_session_manager
+
+                app = AnalysisTUIApp(excel_path)
+                app.status_bar = MagicMock()
+                timer = MagicMock()
+                app._state_flush_timer = timer
+                app._pending_state = {"current_sheet": "OCT25", "current_cluster": 4}
+
+                # Act
+                app.action_save()
+
+                # Assert
+                timer.stop.assert_called_once()
+                mock_session_manager.update_current_state.assert_called_once_with(
+                    current_sheet="OCT25", current_cluster=4)
+                assert app._pending_state is None
+
+        finally:
+            os.unlink(excel_path)
+
+
 class TestErrorHandling:
     """Test suite for error handling and recovery."""
 
@@ -495,6 +785,67 @@ class TestWidgetCommunication:
         finally:
             os.unlink(excel_path)
 
+    def test_sheet_names_fetched_once_across_sheet_changes(self):
+        """Test repeated sheet switches reuse the cached sheet list."""
+        # Arrange
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
+            excel_path = temp_file.name
+
+        try:
+            with patch('src.app.ExcelDataManager') as mock_dm_class, \
+                 patch('src.app.SessionManager'):
+                mock_data_manager = MagicMock()
+                mock_dm_class.return_value = mock_data_manager
+                mock_data_manager.get_sheet_names.return_value = ["SEP25", "OCT25"]
+                mock_data_manager.get_clusters_list.return_value = []
+
+                app = AnalysisTUIApp(excel_path)
+                app.sheet_tabs = MagicMock()
+                app.cluster_view = MagicMock()
+                app.status_bar = MagicMock()
+
+                # Act
+                app.on_sheet_change("OCT25")
+                app.on_sheet_change("SEP25")
+
+                # Assert
+                mock_data_manager.get_sheet_names.assert_called_once()
+                assert app.sheet_names == ("SEP25", "OCT25")
+
+        finally:
+            os.unlink(excel_path)
+
+    def test_sheet_change_to_loaded_sheet_skips_reload(self):
+        """Test re-selecting the sheet already on screen does not refetch or redraw."""
+        # Arrange
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
+            excel_path = temp_file.name
+
+        try:
+            with patch('src.app.ExcelDataManager') as mock_dm_class, \
+                 patch('src.app.SessionManager'):
+                mock_data_manager = MagicMock()
+                mock_dm_class.return_value = mock_data_manager
+                mock_data_manager.get_sheet_names.return_value = ["SEP25", "OCT25"]
+                mock_data_manager.get_clusters_list.return_value = [1, 2]
+                mock_data_manager.get_cluster_data.return_value = pd.DataFrame({"VIEW": [1.0]})
+
+                app = AnalysisTUIApp(excel_path)
+                app.sheet_tabs = MagicMock()
+                app.cluster_view = MagicMock()
+                app.status_bar = MagicMock()
+
+                # Act
+                app.on_sheet_change("OCT25")
+                app.on_sheet_change("OCT25")
+
+                # Assert
+                mock_data_manager.get_clusters_list.assert_called_once_with("OCT25")
+                app.cluster_view.load_data.assert_called_once()
+
+        finally:
+            os.unlink(excel_path)
+
     def test_auto_save_integration(self):
         """Test auto-save functionality integrates with edit operations."""
         # Arrange
@@ -529,6 +880,128 @@ class TestWidgetCommunication:
             os.unlink(excel_path)
 
 
+    def test_rapid_edits_coalesce_into_one_pending_save(self):
+        """Test a burst of edits updates the sheet each time but re-arms a single save timer."""
+        # Arrange
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
+            excel_path = temp_file.name
+
+        try:
+            with patch('src.app.ExcelDataManager') as mock_dm_class, \
+                 patch('src.app.SessionManager'):
+
+                mock_data_manager = MagicMock()
+                mock_dm_class.return_value = mock_data_manager
+
+                app = AnalysisTUIApp(excel_path)
+                app.sheet_tabs = MagicMock()
+                app.sheet_tabs.active_sheet = "SEP25"
+                app.status_bar = MagicMock()
+                # Index labels are not sheet positions; edits must use the positions
+                app._current_cluster_df = pd.DataFrame({"VIEW": [1.0, 2.0]}, index=[70, 90])
+                app._current_cluster_positions = [7, 9]
+                timers = [MagicMock(), MagicMock()]
+                app.set_timer = MagicMock(side_effect=timers)
+
+                # Act
+                app.on_cell_edit(0, "VIEW", 10.0)
+                app.on_cell_edit(1, "VIEW", 20.0)
+
+                # Assert - edits go to sheet rows, only the latest timer survives
+                mock_data_manager.update_value.assert_has_calls([
+                    call("SEP25", 7, "VIEW", 10.0),
+                    call("SEP25", 9, "VIEW", 20.0),
+                ])
+                timers[0].stop.assert_called_once()
+                timers[1].stop.assert_not_called()
+                assert app._pending_save_timer is timers[1]
+                mock_data_manager.save_changes.assert_not_called()
+                mock_data_manager.get_cluster_data.assert_not_called()
+                app.status_bar.update_status.assert_called_once_with("Modified (unsaved)")
+
+        finally:
+            os.unlink(excel_path)
+
+    def test_quit_saves_edits_still_waiting_on_auto_save(self):
+        """Test quitting before the auto-save timer fires writes the edits instead of dropping them."""
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
+            excel_path = temp_file.name
+
+        try:
+            with patch('src.app.ExcelDataManager') as mock_dm_class, \
+                 patch('src.app.SessionManager'):
+
+                mock_data_manager = MagicMock()
+                mock_data_manager.has_pending_edits.return_value = True
+                mock_dm_class.return_value = mock_data_manager
+
+                app = AnalysisTUIApp(excel_path)
+                app.sheet_tabs = MagicMock()
+                app.sheet_tabs.active_sheet = "SEP25"
+                app.status_bar = MagicMock()
+                app._current_cluster_positions = [7]
+                timer = MagicMock()
+                app.set_timer = MagicMock(return_value=timer)
+
+                app.on_cell_edit(0, "VIEW", 10.0)
+                with patch.object(app, 'exit') as mock_exit:
+                    app.action_quit()
+
+                timer.stop.assert_called_once()
+                assert app._pending_save_timer is None
+                mock_data_manager.save_changes.assert_called_once()
+                mock_exit.assert_called_once()
+
+        finally:
+            os.unlink(excel_path)
+
+    def test_quit_stays_open_when_final_save_fails(self):
+        """Test a failed save on quit is reported and the app keeps running."""
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
+            excel_path = temp_file.name
+
+        try:
+            with patch('src.app.ExcelDataManager') as mock_dm_class, \
+                 patch('src.app.SessionManager'):
+
+                mock_data_manager = MagicMock()
+                mock_data_manager.has_pending_edits.return_value = True
+                mock_data_manager.save_changes.side_effect = OSError("Disk full")
+                mock_dm_class.return_value = mock_data_manager
+
+                app = AnalysisTUIApp(excel_path)
+                with patch.object(app, 'exit') as mock_exit, \
+                     patch.object(app, 'notify') as mock_notify:
+                    app.action_quit()
+
+                mock_exit.assert_not_called()
+                assert mock_notify.call_args.kwargs['severity'] == "error"
+
+        finally:
+            os.unlink(excel_path)
+
+    def test_auto_save_skips_when_nothing_is_pending(self):
+        """Test an auto-save worker does not write when an earlier save already covered its edits."""
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
+            excel_path = temp_file.name
+
+        try:
+            with patch('src.app.ExcelDataManager') as mock_dm_class, \
+                 patch('src.app.SessionManager'):
+
+                mock_data_manager = MagicMock()
+                mock_data_manager.has_pending_edits.return_value = False
+                mock_dm_class.return_value = mock_data_manager
+
+                app = AnalysisTUIApp(excel_path)
+                app._flush_save.__wrapped__(app)
+
+                mock_data_manager.save_changes.assert_not_called()
+
+        finally:
+            os.unlink(excel_path)
+
+
 class TestApplicationLifecycle:
     """Test suite for application lifecycle management."""
 
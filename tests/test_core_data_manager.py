@@ -0,0 +1,305 @@
+"""
+Unit tests for the core ExcelDataManager used by the TUI application.
+Covers lazy sheet loading, incremental saves and cluster lookups against a mocked ExcelIO.
+"""
+
+import threading
+
+import pytest
+import pandas as pd
+from unittest.mock import Mock
+
+from src.core.data_manager import ExcelDataManager
+
+
+def make_sheet(clusters):
+    """Build a minimal sheet with one constraint row per cluster entry."""
+    return pd.DataFrame({
+        'CLUSTER': clusters,
+        'CUID': [f'C{i:03d}' for i in range(len(clusters))],
+        'VIEW': [10.0 * (i + 1) for i in range(len(clusters))],
+    })
+
+
+@pytest.fixture
+def excel_io(tmp_path):
+    """Mock ExcelIO serving two small sheets."""
+    workbook = tmp_path / "flows.xlsx"
+    workbook.touch()
+
+    sheets = {
+        "SEP25": make_sheet([2, 1, 1, 3]),
+        "OCT25": make_sheet([5, 4]),
+    }
+    io = Mock()
+    io.get_sheet_names.return_value = list(sheets)
+    io.load_sheet.side_effect = lambda name: sheets[name]
+    io.save_cell_edits.return_value = str(tmp_path / "flows_edited.xlsx")
+    io.workbook = str(workbook)
+    return io
+
+
+@pytest.fixture
+def manager(excel_io):
+    """Data manager with the mocked workbook opened."""
+    dm = ExcelDataManager(excel_io)
+    dm.load_excel(excel_io.workbook)
+    return dm
+
+
+class TestLazySheetLoading:
+    """Sheets are parsed on first access rather than at open time."""
+
+    def test_load_excel_reads_only_sheet_names(self, manager, excel_io):
+        assert manager.get_sheet_names() == ["SEP25", "OCT25"]
+        excel_io.load_sheet.assert_not_called()
+
+    def test_get_sheet_parses_once(self, manager, excel_io):
+        first = manager.get_sheet("SEP25")
+        second = manager.get_sheet("SEP25")
+
+        assert first is second
+        excel_io.load_sheet.assert_called_once_with("SEP25")
+
+    def test_unknown_sheet_raises_key_error(self, manager):
+        with pytest.raises(KeyError):
+            manager.get_sheet("HIST")
+
+    def test_clusters_list_loads_only_requested_sheet(self, manager, excel_io):
+        assert list(manager.get_clusters_list("OCT25")) == [4, 5]
+        excel_io.load_sheet.assert_called_once_with("OCT25")
+
+    def test_prefetch_sheet_parses_and_indexes(self, manager, excel_io):
+        manager.prefetch_sheet("OCT25")
+
+        excel_io.load_sheet.assert_called_once_with("OCT25")
+        assert "OCT25" in manager._cluster_cache
+        assert "OCT25" in manager._cluster_rows
+
+    def test_prefetch_and_ui_thread_parse_sheet_once(self, manager, excel_io):
+        parsing = threading.Event()
+        release = threading.Event()
+        sheet = make_sheet([5, 4])
+
+        def slow_load(name):
+            parsing.set()
+            release.wait(5)
+            return sheet
+
+        excel_io.load_sheet.side_effect = slow_load
+        worker = threading.Thread(target=manager.prefetch_sheet, args=("OCT25",))
+        worker.start()
+        parsing.wait(5)
+        threading.Timer(0.05, release.set).start()
+
+        clusters = manager.get_clusters_list("OCT25")
+        worker.join(5)
+
+        assert clusters == [4, 5]
+        excel_io.load_sheet.assert_called_once_with("OCT25")
+        assert manager.get_sheet("OCT25") is sheet
+
+    def test_set_data_uses_preloaded_sheets(self, excel_io):
+        dm = ExcelDataManager(excel_io)
+        dm.set_data({"SEP25": make_sheet([1, 2])}, excel_io.workbook)
+
+        assert dm.get_sheet_names() == ["SEP25"]
+        assert list(dm.get_clusters_list("SEP25")) == [1, 2]
+        excel_io.load_sheet.assert_not_called()
+
+    def test_metadata_counts_distinct_clusters_across_sheets(self, excel_io):
+        dm = ExcelDataManager(excel_io)
+        dm.set_data({"SEP25": make_sheet([1, 2, 2]), "OCT25": make_sheet([2, 3])}, excel_io.workbook)
+
+        assert dm.metadata.total_clusters == 3
+        assert dm.metadata.total_rows == 5
+
+
+class TestUpdateValue:
+    """Edits write positionally and record the previous value."""
+
+    def test_edit_records_old_value_and_cluster(self, manager):
+        manager.update_value("SEP25", 2, "VIEW", 5.0)
+
+        edit = manager.edit_history[-1]
+        assert (edit.old_value, edit.new_value, edit.cluster_id) == (30.0, 5.0, "1")
+        assert manager.get_sheet("SEP25").at[2, 'VIEW'] == 5.0
+
+    def test_edit_history_keeps_most_recent_edits(self, manager):
+        for i in range(1005):
+            manager.update_value("SEP25", 0, "VIEW", float(i))
+
+        assert len(manager.edit_history) == 1000
+        assert manager.edit_history[0].new_value == 5.0
+        assert manager.edit_history[-1].new_value == 1004.0
+
+    def test_unknown_column_raises_key_error(self, manager):
+        with pytest.raises(KeyError):
+            manager.update_value("SEP25", 0, "NOPE", 1.0)
+
+    def test_edit_adds_new_label_to_category_column(self, excel_io):
+        sheet = make_sheet([1, 1, 2, 2])
+        sheet['MON'] = pd.Categorical(['LINE_X', 'LINE_X', 'LINE_X', 'LINE_Y'])
+        excel_io.load_sheet.side_effect = lambda name: sheet
+        dm = ExcelDataManager(excel_io)
+        dm.load_excel(excel_io.workbook)
+
+        dm.update_value("SEP25", 1, "MON", "LINE_Z")
+
+        df = dm.get_sheet("SEP25")
+        assert df['MON'].tolist() == ['LINE_X', 'LINE_Z', 'LINE_X', 'LINE_Y']
+        assert dm.edit_history[-1].old_value == 'LINE_X'
+
+    def test_cluster_positions_ignore_index_labels(self, excel_io):
+        sheet = make_sheet([2, 1, 1, 3])
+        sheet.index = [40, 30, 20, 10]
+        excel_io.load_sheet.side_effect = lambda name: sheet
+        dm = ExcelDataManager(excel_io)
+        dm.load_excel(excel_io.workbook)
+
+        positions = dm.get_cluster_positions("SEP25", 1)
+        dm.update_value("SEP25", int(positions[1]), "VIEW", 5.0)
+        dm.save_changes()
+
+        assert dm.get_cluster_data("SEP25", 1).index.tolist() == [30, 20]
+        assert sheet.at[20, 'VIEW'] == 5.0
+        excel_io.save_cell_edits.assert_called_once_with(
+            {"SEP25": {(4, 3): 5.0}}, excel_io.workbook)
+
+
+class TestSaveChanges:
+    """Saves write only the cells edited since the previous save."""
+
+    def test_edits_map_to_worksheet_coordinates(self, manager, excel_io):
+        manager.update_value("SEP25", 1, "VIEW", 55.0)
+
+        manager.save_changes()
+
+        excel_io.save_cell_edits.assert_called_once_with(
+            {"SEP25": {(3, 3): 55.0}}, excel_io.workbook)
+
+    def test_saved_edits_are_not_written_again(self, manager, excel_io):
+        manager.update_value("SEP25", 0, "VIEW", 1.0)
+        manager.save_changes()
+
+        manager.save_changes()
+
+        assert excel_io.save_cell_edits.call_args[0][0] == {}
+
+    def test_failed_save_keeps_edits_pending(self, manager, excel_io):
+        manager.update_value("OCT25", 0, "VIEW", 2.0)
+        excel_io.save_cell_edits.side_effect = [OSError("disk full"), "saved.xlsx"]
+
+        with pytest.raises(OSError):
+            manager.save_changes()
+        manager.save_changes()
+
+        assert excel_io.save_cell_edits.call_args[0][0] == {"OCT25": {(2, 3): 2.0}}
+
+    def test_concurrent_saves_run_one_at_a_time(self, manager, excel_io):
+        writing = threading.Event()
+        release = threading.Event()
+        active = []
+
+        def slow_save(edits, path):
+            active.append(edits)
+            assert len(active) == 1, "saves overlapped"
+            writing.set()
+            release.wait(5)
+            active.pop()
+            return "saved.xlsx"
+
+        excel_io.save_cell_edits.side_effect = slow_save
+        manager.update_value("SEP25", 0, "VIEW", 1.0)
+        first = threading.Thread(target=manager.save_changes)
+        first.start()
+        writing.wait(5)
+
+        # An edit made mid-save is left for the next save, which waits its turn
+        manager.update_value("SEP25", 1, "VIEW", 2.0)
+        second = threading.Thread(target=manager.save_changes)
+        second.start()
+        release.set()
+        first.join(5)
+        second.join(5)
+
+        calls = [c.args[0] for c in excel_io.save_cell_edits.call_args_list]
+        assert calls == [{"SEP25": {(2, 3): 1.0}}, {"SEP25": {(3, 3): 2.0}}]
+        assert not manager.has_pending_edits()
+
+
+class TestClusterListCache:
+    """Cluster lists are computed once per sheet and invalidated on CLUSTER edits."""
+
+    def test_clusters_are_sorted_python_ints(self, manager):
+        clusters = manager.get_clusters_list("SEP25")
+
+        assert clusters == [1, 2, 3]
+        assert all(type(c) is int for c in clusters)
+
+    def test_cluster_ids_are_stored_as_int32(self, manager):
+        assert manager.get_sheet("SEP25")['CLUSTER'].dtype == 'int32'
+        assert list(manager.get_cluster_data("SEP25", 1).index) == [1, 2]
+
+    def test_repeat_lookups_return_cached_list(self, manager):
+        first = manager.get_clusters_list("SEP25")
+
+        assert manager.get_clusters_list("SEP25") is first
+
+    def test_value_edit_keeps_cache(self, manager):
+        first = manager.get_clusters_list("SEP25")
+
+        manager.update_value("SEP25", 0, "VIEW", 99.0)
+
+        assert manager.get_clusters_list("SEP25") is first
+
+    def test_cluster_edit_invalidates_cache(self, manager):
+        manager.get_clusters_list("SEP25")
+
+        manager.update_value("SEP25", 0, "CLUSTER", 7)
+
+        assert list(manager.get_clusters_list("SEP25")) == [1, 3, 7]
+
+
+class TestClusterRowIndex:
+    """Cluster rows are located through a per-sheet index instead of a full scan."""
+
+    def test_cluster_data_keeps_sheet_rows(self, manager):
+        cluster = manager.get_cluster_data("SEP25", 1)
+
+        assert list(cluster.index) == [1, 2]
+        assert list(cluster['CUID']) == ['C001', 'C002']
+
+    def test_cluster_data_is_detached_from_sheet(self, manager):
+        cluster = manager.get_cluster_data("SEP25", 1)
+
+        cluster.loc[1, 'VIEW'] = -1.0
+
+        assert manager.get_sheet("SEP25").at[1, 'VIEW'] == 20.0
+
+    def test_cluster_view_slices_contiguous_rows(self, manager):
+        view = manager.get_cluster_view("SEP25", 1)
+
+        assert list(view.index) == [1, 2]
+        assert list(view['CUID']) == ['C001', 'C002']
+
+    def test_cluster_view_skips_header_rows(self, excel_io):
+        sheet = make_sheet([1, 1, 1, 2])
+        sheet['SP'] = [5.0, None, None, 3.0]
+        dm = ExcelDataManager(excel_io)
+        dm.set_data({"SEP25": sheet}, excel_io.workbook)
+
+        assert list(dm.get_cluster_view("SEP25", 1).index) == [1, 2]
+        assert list(dm.get_cluster_data("SEP25", 1).index) == [1, 2]
+        assert dm.get_cluster_view("SEP25", 2).empty
+
+    def test_unknown_cluster_raises_value_error(self, manager):
+        with pytest.raises(ValueError):
+            manager.get_cluster_data("SEP25", 99)
+
+    def test_cluster_edit_moves_row_to_new_cluster(self, manager):
+        manager.get_cluster_data("SEP25", 1)
+
+        manager.update_value("SEP25", 3, "CLUSTER", 1)
+
+        assert list(manager.get_cluster_data("SEP25", 1).index) == [1, 2, 3]
@@ -0,0 +1,84 @@
+"""
+Unit tests for the theme-aware ColorFormatter used by the TUI widgets.
+"""
+
+from src.core.formatter import ColorFormatter, _interpolate_hex
+from src.models import ColumnType
+
+
+class TestThemes:
+    """The neutral background follows the theme."""
+
+    def test_theme_sets_neutral_color(self):
+        assert ColorFormatter(theme="dark").neutral == "#1A1A1A"
+        assert ColorFormatter(theme="light").neutral == "#FFFFFF"
+
+
+class TestColorCaching:
+    """Repeated color lookups are served from a per-instance cache."""
+
+    def test_repeat_lookups_hit_cache(self):
+        formatter = ColorFormatter()
+
+        first = formatter.get_color(ColumnType.VIEW, 5.0)
+        second = formatter.get_color(ColumnType.VIEW, 5.0)
+
+        assert first == second
+        assert formatter._color_for.cache_info().hits == 1
+
+    def test_nearby_values_share_quantized_entry(self):
+        formatter = ColorFormatter()
+
+        formatter.get_color(ColumnType.VIEW, 5.0001)
+        formatter.get_color(ColumnType.VIEW, 5.0002)
+
+        assert formatter._color_for.cache_info().currsize == 1
+
+    def test_empty_values_bypass_cache(self):
+        formatter = ColorFormatter()
+
+        assert formatter.get_color(ColumnType.VIEW, None) == formatter.neutral
+        assert formatter.get_color(ColumnType.VIEW, float("nan")) == formatter.neutral
+        assert formatter._color_for.cache_info().currsize == 0
+
+    def test_themes_do_not_share_cached_colors(self):
+        dark = ColorFormatter(theme="dark")
+        light = ColorFormatter(theme="light")
+
+        assert dark.get_color(ColumnType.VIEW, 0.75) != light.get_color(ColumnType.VIEW, 0.75)
+
+    def test_text_color_is_cached(self):
+        formatter = ColorFormatter()
+
+        assert formatter.get_text_color_for_background("#FFFF00") == "black"
+        assert formatter.get_text_color_for_background("#FFFF00") == "black"
+        assert formatter._text_color_for.cache_info().hits == 1
+
+    def test_interpolation_is_shared_across_formatters(self):
+        _interpolate_hex.cache_clear()
+
+        ColorFormatter(theme="light")._interpolate_color("#FFFFFF", "#FF0000", 0.5)
+        ColorFormatter(theme="light")._interpolate_color("#FFFFFF", "#FF0000", 0.5)
+
+        assert _interpolate_hex.cache_info().hits == 1
+        assert ColorFormatter()._interpolate_color("#FFFFFF", "#FF0000", 1.5) == "#ff0000"
+
+
+class TestVectorizedColors:
+    """get_colors_array colors a whole column exactly like per-cell get_color."""
+
+    def test_matches_scalar_colors(self):
+        formatter = ColorFormatter()
+        values = [None, float("nan"), -60.0, -1.0, -0.4, 0.0, 0.5, 0.75, 1.0, 5.0, 10.0,
+                  20.0, 45.0, 100.0, 250.0]
+
+        for column_type in (ColumnType.VIEW, ColumnType.RECENT_DELTA, ColumnType.DATE_COLUMN,
+                            ColumnType.LODF_COLUMN, ColumnType.FLOW):
+            expected = [formatter.get_color(column_type, v) for v in values]
+            assert list(formatter.get_colors_array(column_type, values)) == expected
+
+    def test_empty_input(self):
+        formatter = ColorFormatter(theme="light")
+
+        assert len(formatter.get_colors_array(ColumnType.VIEW, [])) == 0
+
@@ -105,6 +105,21 @@ class TestSessionState:
         assert session.current_row == 0  # default from get()
         assert session.window_size == (120, 40)  # default from get()
         assert isinstance(session.last_modified, datetime)  # default now()
+        assert session.current_cluster_id is None  # state saved before IDs were recorded
+
+    def test_session_state_round_trips_cluster_id(self):
+        """Test the saved cluster ID survives serialization next to the cluster index."""
+        session = SessionState(
+            last_file="/test/file.xlsx",
+            current_sheet="JAN25",
+            current_cluster=2,
+            current_cluster_id=417
+        )
+        
+        restored = SessionState.from_dict(session.to_dict())
+        
+        assert restored.current_cluster == 2
+        assert restored.current_cluster_id == 417
 
 
 class TestEditRecord:
@@ -189,6 +204,21 @@ class TestEditRecord:
         expected = "Edit at 09:45:30: JUL25[8,SHORTLIMIT] -30.0 -> -25.5"
         assert str_repr == expected
 
+    def test_edit_record_is_immutable(self):
+        """Test EditRecord fields cannot be reassigned after creation."""
+        edit = EditRecord(
+            timestamp=datetime(2025, 1, 15, 9, 45, 30),
+            sheet="JUL25",
+            cluster_id="7",
+            constraint_index=8,
+            column="VIEW",
+            old_value=100.0,
+            new_value=110.0
+        )
+        
+        with pytest.raises(AttributeError):
+            edit.new_value = 120.0
+
 
 class TestClusterInfo:
     """Test suite for ClusterInfo model."""
@@ -73,6 +73,21 @@ class TestStatusBar:
         assert "Cluster 42/156" in rendered_plain
         assert "Row 3/7" in rendered_plain
 
+    def test_set_state_assigns_all_fields(self):
+        """Test set_state updates several position fields in one call."""
+        # Arrange
+        status_bar = StatusBar()
+
+        # Act
+        status_bar.set_state(current_sheet="NOV25", current_cluster=2,
+                             total_clusters=10, current_row=1, total_rows=4)
+
+        # Assert
+        rendered_plain = status_bar.render().plain
+        assert "NOV25" in rendered_plain
+        assert "Cluster 2/10" in rendered_plain
+        assert "Row 1/4" in rendered_plain
+
     def test_file_info_display_with_modified_indicator(self):
         """Test file information display including modified status and save timestamp."""
         # Arrange
@@ -179,7 +179,8 @@ class TestQuitShortcuts:
         # Assert session state is saved
         app.session_manager.update_current_state.assert_called_once_with(
             current_sheet="SEP25",
-            current_cluster="CLUSTER_001"
+            current_cluster=0,
+            current_cluster_id="CLUSTER_001"
         )
         
         # Assert app exits